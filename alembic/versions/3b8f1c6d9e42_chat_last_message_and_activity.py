@@ -0,0 +1,46 @@
+"""chat_last_message_and_activity
+
+Revision ID: 3b8f1c6d9e42
+Revises: d17e3c8f4a20
+Create Date: 2026-10-18 13:21:07.384915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8f1c6d9e42'
+down_revision: Union[str, None] = 'd17e3c8f4a20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('chat', sa.Column('last_message_id', sa.Integer(), nullable=True))
+    op.add_column('chat', sa.Column('last_activity_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False))
+
+    op.execute("""
+        UPDATE chat c
+        LEFT JOIN (
+            SELECT chat_id,
+                   MAX(message_id) AS last_message_id,
+                   MAX(sent_at) AS last_sent_at
+            FROM message
+            GROUP BY chat_id
+        ) m ON m.chat_id = c.chat_id
+        SET c.last_message_id = m.last_message_id,
+            c.last_activity_at = COALESCE(m.last_sent_at, c.created_at)
+    """)
+
+    op.create_index('ix_chat_last_activity_at', 'chat', ['last_activity_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_chat_last_activity_at', table_name='chat')
+    op.drop_column('chat', 'last_activity_at')
+    op.drop_column('chat', 'last_message_id')
@@ -0,0 +1,54 @@
+"""chat_read_status_watermarks
+
+Revision ID: 9a4d7e2b6c15
+Revises: 5f2c9e1a7d3b
+Create Date: 2026-10-18 11:03:52.617240
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4d7e2b6c15'
+down_revision: Union[str, None] = '5f2c9e1a7d3b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('chat_read_status', sa.Column('last_delivered_message_id', sa.Integer(), nullable=True))
+    op.add_column('chat_read_status', sa.Column('delivered_at', sa.DateTime(timezone=True), nullable=True))
+
+    op.execute("""
+        UPDATE chat_read_status crs
+        JOIN (
+            SELECT user_id, chat_id,
+                   MAX(CASE WHEN is_delivered THEN message_id END) AS delivered_id,
+                   MAX(CASE WHEN is_read THEN message_id END) AS read_id,
+                   MAX(delivered_at) AS delivered_at
+            FROM message_delivery
+            GROUP BY user_id, chat_id
+        ) md ON md.user_id = crs.user_id AND md.chat_id = crs.chat_id
+        SET crs.last_delivered_message_id = md.delivered_id,
+            crs.delivered_at = md.delivered_at,
+            crs.last_read_message_id = GREATEST(
+                COALESCE(crs.last_read_message_id, 0),
+                COALESCE(md.read_id, 0)
+            )
+    """)
+
+    op.execute("""
+        UPDATE chat_read_status
+        SET last_delivered_message_id = last_read_message_id
+        WHERE last_read_message_id > COALESCE(last_delivered_message_id, 0)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('chat_read_status', 'delivered_at')
+    op.drop_column('chat_read_status', 'last_delivered_message_id')
@@ -2,7 +2,7 @@ from jose import ExpiredSignatureError
 
 from app.core.security import decode_jwt_token
 from app.infrastructure.exceptions.exceptions import InvalidAccessTokenException
-from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
 from app.infrastructure.exceptions.websocket import WebSocketException
 from app.schemas.token import TokenPayload
 from app.services.redis_token_blacklist_service import \
@@ -18,26 +18,30 @@ async def get_current_user_id_ws(
         token: str,
         user_query_service: UserQueryService,
         redis_token_blacklist_service: RedisTokenBlacklistService,
-        redis: RedisCache,
+        redis: TwoLevelCache,
 ) -> int:
     token_payload = await get_access_token_payload(token)
 
-    if await redis_token_blacklist_service.is_blacklisted(token_payload.jti):
+    auth_key = f'auth:{token_payload.jti}'
+    blacklisted, cached_auth = await redis.get_many_raw([
+        redis_token_blacklist_service.get_key(token_payload.jti), auth_key
+    ])
+    if blacklisted:
         raise WebSocketException('this access token is blacklisted')
 
-    redis_key = f'auth:{token_payload.jti}'
-    cached_user_id = await redis.get(redis_key)
-    if cached_user_id:
-        return int(cached_user_id)
-
-    user = await user_query_service.get_user_by_id(int(token_payload.user_id))
-    if not user:
-        raise WebSocketException('user not found')
-    if user.deleted_at:
-        raise WebSocketException('user has been deleted')
-
-    await redis.set(redis_key, user.user_id)
-    return user.user_id
+    async def load_user_id() -> int:
+        user = await user_query_service.get_user_by_id(
+            int(token_payload.user_id)
+        )
+        if not user:
+            raise WebSocketException('user not found')
+        if user.deleted_at:
+            raise WebSocketException('user has been deleted')
+        return user.user_id
+
+    return int(await redis.get_or_load(
+        auth_key, load_user_id, raw=cached_auth
+    ))
 
 
 async def get_access_token_payload(
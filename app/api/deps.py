@@ -6,8 +6,6 @@ from app.core.security import decode_jwt_token
 from app.db.repository.chat_read_status_repository import \
     ChatReadStatusRepository
 from app.db.repository.chat_repository import ChatRepository
-from app.db.repository.message_delivery_repository import \
-    MessageDeliveryRepository
 from app.db.repository.message_repository import MessageRepository
 from app.db.repository.refresh_token_repository import RefreshTokenRepository
 from app.db.repository.scheduled_message_repository import \
@@ -16,15 +14,16 @@ from app.db.repository.user_repository import UserRepository
 from app.db.session import get_db_session
 from app.infrastructure.exceptions.exceptions import InvalidAccessTokenException, DeletedUserError, \
     RedisConnectionError, TokenInvalidatedError
-from app.infrastructure.cache.json_serializer import JsonSerializer
-from app.infrastructure.cache.redis_cache import RedisCache
 from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
 from app.infrastructure.message_queue.rabbitmq_client import RabbitMQClient
-from app.models import User, Chat, Message, MessageDelivery
+from app.models import User, Chat, Message
 from app.models.chat_read_status import ChatReadStatus
 from app.models.scheduled_message import ScheduledMessage
 from app.schemas.token import TokenPayload
 from app.services.auth_service import AuthService
+from app.services.chat.chat_membership_cache import ChatMembershipCache
+from app.services.chat.chat_overview_cache import ChatOverviewCache
 from app.services.chat.chat_service import ChatService
 from app.services.message_delivery_service import MessageDeliveryService
 from app.services.message.message_service import MessageService
@@ -36,17 +35,11 @@ from app.services.user.user_service import UserService
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl='/api/v1/token')
 
 
-async def get_redis(request: Request) -> RedisCache:
-    redis = request.app.state.redis
-    if (
-            not hasattr(request.app.state, 'redis') or
-            redis is None
-    ):
+async def get_redis(request: Request) -> TwoLevelCache:
+    cache = getattr(request.app.state, 'cache', None)
+    if cache is None:
         raise RedisConnectionError
-    return RedisCache(
-        redis=redis,
-        serializer=JsonSerializer(),
-    )
+    return cache
 
 
 async def get_redis_pubsub(request: Request) -> RedisPubSub:
@@ -59,8 +52,16 @@ async def get_redis_pubsub(request: Request) -> RedisPubSub:
     return RedisPubSub(redis=redis)
 
 
-async def get_mq_client():
-    return RabbitMQClient()
+async def get_chat_overview_cache(request: Request) -> ChatOverviewCache:
+    return ChatOverviewCache(request.app.state.redis)
+
+
+async def get_chat_membership_cache(request: Request) -> ChatMembershipCache:
+    return ChatMembershipCache(request.app.state.redis)
+
+
+async def get_mq_client(request: Request) -> RabbitMQClient:
+    return request.app.state.mq_client
 
 
 async def get_user_repository(
@@ -72,8 +73,11 @@ async def get_user_repository(
 
 async def get_chat_repository(
         db: AsyncSession = Depends(get_db_session),
+        membership_cache: ChatMembershipCache = Depends(
+            get_chat_membership_cache
+        ),
 ) -> ChatRepository:
-    chat_repository = ChatRepository(db, Chat)
+    chat_repository = ChatRepository(db, Chat, membership_cache)
     return chat_repository
 
 
@@ -84,15 +88,6 @@ async def get_message_repository(
     return message_repository
 
 
-async def get_message_delivery_repository(
-        db: AsyncSession = Depends(get_db_session)
-) -> MessageDeliveryRepository:
-    message_delivery_repository = MessageDeliveryRepository(
-        db, MessageDelivery
-    )
-    return message_delivery_repository
-
-
 async def get_scheduled_message_repository(
         db: AsyncSession = Depends(get_db_session)
 ) -> ScheduledMessageRepository:
@@ -118,7 +113,7 @@ async def get_chat_read_status_repository(
 
 
 async def get_redis_token_blacklist_service(
-        redis: RedisCache = Depends(get_redis),
+        redis: TwoLevelCache = Depends(get_redis),
 ):
     redis_token_blacklist_service = RedisTokenBlacklistService(
         redis=redis
@@ -142,24 +137,26 @@ async def get_current_user_id(
                 Depends(get_redis_token_blacklist_service)
         ),
         token_data: TokenPayload = Depends(get_access_token_payload),
-        redis: RedisCache = Depends(get_redis),
+        redis: TwoLevelCache = Depends(get_redis),
 ) -> int:
-    if await redis_token_blacklist_service.is_blacklisted(token_data.jti):
+    auth_key = f'auth:{token_data.jti}'
+    blacklisted, cached_auth = await redis.get_many_raw([
+        redis_token_blacklist_service.get_key(token_data.jti), auth_key
+    ])
+    if blacklisted:
         raise TokenInvalidatedError
 
-    redis_key = f'auth:{token_data.jti}'
-    cached_user_id = await redis.get(redis_key)
-    if cached_user_id:
-        return int(cached_user_id)
+    async def load_user_id() -> int:
+        user = await user_repository.get_by_id(token_data.user_id)
+        if not user:
+            raise InvalidAccessTokenException
+        if user.deleted_at:
+            raise DeletedUserError
+        return user.user_id
 
-    user = await user_repository.get_by_id(token_data.user_id)
-    if not user:
-        raise InvalidAccessTokenException
-    if user.deleted_at:
-        raise DeletedUserError
-
-    await redis.set(redis_key, user.user_id)
-    return user.user_id
+    return int(await redis.get_or_load(
+        auth_key, load_user_id, raw=cached_auth
+    ))
 
 
 async def get_current_user_db_bound(
@@ -215,7 +212,10 @@ async def get_chat_service(
         chat_read_status_repository: ChatReadStatusRepository =
             Depends(get_chat_read_status_repository),
         current_user_id: int = Depends(get_current_user_id),
-        redis: RedisCache = Depends(get_redis)
+        redis: TwoLevelCache = Depends(get_redis),
+        chat_overview_cache: ChatOverviewCache = Depends(
+            get_chat_overview_cache
+        ),
 ) -> ChatService:
     chat_service = ChatService(
         db=db,
@@ -223,18 +223,21 @@ async def get_chat_service(
         user_repository=user_repository,
         chat_read_status_repository=chat_read_status_repository,
         current_user_id=current_user_id,
-        redis=redis
+        redis=redis,
+        chat_overview_cache=chat_overview_cache,
     )
     return chat_service
 
 
 async def get_message_delivery_service(
         db: AsyncSession = Depends(get_db_session),
-        message_delivery_repository = Depends(get_message_delivery_repository),
+        chat_read_status_repository = Depends(
+            get_chat_read_status_repository
+        ),
 ):
     message_delivery_service = MessageDeliveryService(
         db=db,
-        message_delivery_repository=message_delivery_repository
+        chat_read_status_repository=chat_read_status_repository
     )
     return message_delivery_service
 
@@ -262,12 +265,14 @@ async def get_scheduled_message_service(
             get_scheduled_message_repository
         ),
         chat_repository: ChatRepository = Depends(get_chat_repository),
+        mq_client: RabbitMQClient = Depends(get_mq_client),
         current_user_id: int = Depends(get_current_user_id)
 ) -> ScheduledMessageService:
     scheduled_message_service = ScheduledMessageService(
         db,
         scheduled_message_repository=scheduled_message_repository,
         chat_repository=chat_repository,
+        mq_client=mq_client,
         current_user_id=current_user_id,
     )
     return scheduled_message_service
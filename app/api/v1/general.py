@@ -1,6 +1,9 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, Request
 
 from app.api.deps import get_current_user_id
+from app.infrastructure.cache.connection import get_redis_pool_stats
+from app.infrastructure.serialization.wire_protocol import \
+    compression_metrics
 
 from fastapi import Depends
 
@@ -13,6 +16,22 @@ async def root():
     return {"message": "Hello World from API v1!"}
 
 
+@router.get("/health/redis")
+async def redis_health(request: Request):
+    return {
+        'ping': await request.app.state.redis.ping(),
+        **get_redis_pool_stats(request.app.state.redis_pool),
+        'local_cache': request.app.state.cache.stats(),
+    }
+
+
+@router.get("/health/ws")
+async def ws_health():
+    return {
+        'compression': compression_metrics.as_dict(),
+    }
+
+
 @router.get("/users")
 async def users(
         current_user_id = Depends(get_current_user_id),
@@ -2,10 +2,13 @@ from fastapi import APIRouter
 from fastapi.params import Depends
 from fastapi_limiter.depends import RateLimiter
 
-from app.api.deps import get_message_service, get_redis
-from app.infrastructure.cache.redis_cache import RedisCache
+from app.api.deps import get_message_service, get_redis, \
+    get_chat_overview_cache
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
 
 from app.schemas.message import MessageRead, MessageCreate
+from app.services.chat.chat_overview_cache import ChatOverviewCache
+from app.services.chat.chat_service import chat_cache_tag
 from app.services.message.message_service import MessageService
 
 router = APIRouter()
@@ -19,9 +22,14 @@ router = APIRouter()
 async def send_message(
         message_in: MessageCreate,
         message_service: MessageService = Depends(get_message_service),
-        redis: RedisCache = Depends(get_redis),
+        redis: TwoLevelCache = Depends(get_redis),
+        chat_overview_cache: ChatOverviewCache = Depends(
+            get_chat_overview_cache
+        ),
 ):
-    redis_key = f'chat:{message_in.chat_id}:*'
-    new_message = await message_service.create_message(message_in)
-    await redis.delete_pattern(redis_key)
+    new_message, participant_ids = await message_service.create_message(
+        message_in
+    )
+    await redis.invalidate_tags([chat_cache_tag(message_in.chat_id)])
+    await chat_overview_cache.invalidate(participant_ids)
     return new_message
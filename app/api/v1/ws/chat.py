@@ -4,8 +4,9 @@ from starlette.websockets import WebSocketDisconnect, WebSocketState
 
 from app.api.dependencies.auth import get_current_user_id_ws
 from app.db.session import get_lifespan_db
-from app.infrastructure.cache.connection import get_lifespan_redis_client
 from app.infrastructure.exceptions.websocket import WebSocketException
+from app.infrastructure.serialization.wire_protocol import \
+    negotiate_wire_protocol, WireDecodeError, WireProtocol
 from app.schemas.event import WebSocketEvent
 from app.services.ws.web_socket_service_container import WebSocketServiceContainer
 from app.services.ws.chat_web_socket_service import ChatWebSocketService
@@ -19,18 +20,29 @@ router = APIRouter()
 async def chat_websocket(
         websocket: WebSocket,
 ):
-    await websocket.accept()
+    wire_protocol = negotiate_wire_protocol(
+        websocket.scope.get('subprotocols', []),
+        websocket.headers.get('sec-websocket-extensions', ''),
+    )
+    await websocket.accept(subprotocol=wire_protocol.subprotocol)
     logger.info('websocket connection is established')
 
-    async with (
-        get_lifespan_db() as db,
-        get_lifespan_redis_client() as redis_client
-    ):
-        logger.info('db and redis connection are established')
+    redis_client = websocket.app.state.redis
+    async with get_lifespan_db() as db:
+        logger.info('db connection is established')
         current_user_id = None
         chat_service = None
+        presence_registry = websocket.app.state.presence_registry
+        is_present = False
         try:
-            container = WebSocketServiceContainer(db, redis_client)
+            container = WebSocketServiceContainer(
+                db,
+                redis_client,
+                websocket.app.state.redis_subscription_multiplexer,
+                websocket.app.state.presence_registry,
+                websocket.app.state.mq_client,
+                websocket.app.state.cache,
+            )
 
             logger.info('trying to get access token...')
 
@@ -66,6 +78,7 @@ async def chat_websocket(
                 redis_event_dispatcher=container.redis_event_dispatcher,
                 chat_create_helper=container.chat_create_helper,
                 contact_service=container.contact_service,
+                wire_protocol=wire_protocol,
             )
         except WebSocketException as e:
             logger.warning(f"WebSocket connection failed: {e.message}")
@@ -79,6 +92,10 @@ async def chat_websocket(
             if not current_user_id or not chat_service:
                 raise WebSocketException('WebSocket initialization failed')
 
+            if presence_registry:
+                await presence_registry.register(current_user_id)
+                is_present = True
+
             logger.info('trying to start chat service...')
 
             await chat_service.start(current_user_id)
@@ -88,7 +105,7 @@ async def chat_websocket(
             while True:
                 try:
                     logger.info("websocket has got a message")
-                    data_in = await websocket.receive_json()
+                    data_in = await wire_protocol.receive(websocket)
 
                     if not data_in:
                         continue
@@ -104,15 +121,15 @@ async def chat_websocket(
                     logger.info(
                         f"WebSocket disconnected for user {current_user_id}")
                     break
-                except ValidationError as e:
+                except (ValidationError, WireDecodeError) as e:
                     logger.exception(f'validation error, {e}', exc_info=True)
-                    await websocket.send_json({
+                    await send_error(websocket, wire_protocol, {
                         'type': 'error',
                         'message': f'Invalid message format: {e}'
                     })
                 except WebSocketException as e:
                     logger.exception(f'logic exception!, {e}', exc_info=True)
-                    await websocket.send_json({
+                    await send_error(websocket, wire_protocol, {
                         'type': 'error',
                         'message': e.message
                     })
@@ -120,7 +137,7 @@ async def chat_websocket(
                     logger.error(f'An unexpected exception occurred: {e}',
                                  exc_info=True
                                  )
-                    await websocket.send_json({
+                    await send_error(websocket, wire_protocol, {
                         'type': 'error',
                         'message': f'An unexpected error '
                                    f'occurred processing your message'
@@ -129,12 +146,14 @@ async def chat_websocket(
             logger.info(f"WebSocket disconnected for user {current_user_id}")
         except Exception as e:
             logger.error(f'Critical exception occurred: {e}', exc_info=True)
-            await websocket.send_json({
+            await send_error(websocket, wire_protocol, {
                 'type': 'error',
                 'message': 'Internal server error'
             })
         finally:
             logger.info(f"Cleaning up resources for user {current_user_id}.")
+            if is_present:
+                await presence_registry.unregister(current_user_id)
             if chat_service:
                 await chat_service.stop()
             if not websocket.client_state == WebSocketState.DISCONNECTED:
@@ -151,3 +170,11 @@ async def safe_close_websocket(
             await websocket.close(code=code, reason=reason)
         except RuntimeError:
             pass
+
+
+async def send_error(
+        websocket: WebSocket,
+        wire_protocol: WireProtocol,
+        error: dict
+):
+    await wire_protocol.send(websocket, wire_protocol.encode(error))
@@ -3,6 +3,9 @@ import pathlib
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from functools import lru_cache
 
+from app.infrastructure.types.codec import JsonCodecBackend
+from app.infrastructure.types.event import DeliveryMode
+
 ROOT_DIR = pathlib.Path(__file__).parent.parent.parent
 
 ENV_FILE_PATH = ROOT_DIR / '.env'
@@ -26,10 +29,24 @@ class Settings(BaseSettings):
     REDIS_HOST:str
     REDIS_PORT: int
     REDIS_PASSWORD: str
+    REDIS_MAX_CONNECTIONS: int = 100
+    REDIS_POOL_TIMEOUT_SECONDS: int = 5
+    REDIS_HEALTH_CHECK_INTERVAL_SECONDS: int = 30
+    LOCAL_CACHE_MAX_SIZE: int = 10000
+    LOCAL_CACHE_TTL_SECONDS: float = 30.0
+    CACHE_INVALIDATION_CHANNEL: str = 'cache:invalidate'
+    CACHE_STALE_TTL_SECONDS: int = 300
+    CACHE_EARLY_REFRESH_BETA: float = 1.0
+    CACHE_LOCK_TIMEOUT_SECONDS: float = 5.0
+    CACHE_LOCK_WAIT_SECONDS: float = 2.0
+    CACHE_LOCK_POLL_INTERVAL_SECONDS: float = 0.05
 
     SQLALCHEMY_ECHO: bool = False
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
 
     DEBUG: bool = False
+    JSON_CODEC: JsonCodecBackend = JsonCodecBackend.AUTO
     PROJECT_NAME: str = 'messenger'
     API_V1_STR: str = '/api/v1'
 
@@ -46,6 +63,36 @@ class Settings(BaseSettings):
     RABBITMQ_PROCESSING_QUEUE: str
     RABBITMQ_DLX_NAME: str
     RABBITMQ_REGULAR_MESSAGE_QUEUE: str
+    RABBITMQ_CHANNEL_POOL_SIZE: int = 10
+    RABBITMQ_CONFIRM_WINDOW: int = 256
+
+    CHAT_MESSAGES_PAGE_SIZE: int = 50
+    CHAT_MESSAGES_MAX_PAGE_SIZE: int = 200
+    CHAT_OVERVIEW_CACHE_TTL_SECONDS: int = 86400
+    CHAT_OVERVIEW_CACHE_MAX_CHATS: int = 500
+    CHAT_OVERVIEW_PAGE_SIZE: int = 30
+    CHAT_OVERVIEW_MAX_PAGE_SIZE: int = 100
+    UNDELIVERED_MESSAGES_CHUNK_SIZE: int = 200
+    CHAT_MEMBERSHIP_CACHE_TTL_SECONDS: int = 3600
+    CHAT_MEMBERSHIP_LOCAL_CACHE_SIZE: int = 10000
+    CHAT_MEMBERSHIP_LOCAL_CACHE_TTL_SECONDS: float = 5.0
+
+    WORKER_BATCH_SIZE: int = 1
+    WORKER_BATCH_WAIT_MS: int = 50
+    WORKER_CONCURRENCY: int = 1
+
+    WS_DELIVERY_MODE: DeliveryMode = DeliveryMode.CHAT
+    WS_OUTBOUND_QUEUE_SIZE: int = 1000
+    WS_OUTBOUND_HIGH_WATER_MARK: int = 200
+    WS_SLOW_CONSUMER_TIMEOUT_SECONDS: float = 10.0
+    WS_COMPRESSION_ENABLED: bool = True
+    WS_COMPRESSION_THRESHOLD_BYTES: int = 1024
+    WS_COMPRESSION_LEVEL: int = 6
+    WS_PER_MESSAGE_DEFLATE: bool = False
+
+    NODE_ID: str | None = None
+    PRESENCE_TTL_SECONDS: int = 60
+    PRESENCE_HEARTBEAT_SECONDS: int = 20
 
     model_config = SettingsConfigDict(
         env_file=ENV_FILE_PATH,
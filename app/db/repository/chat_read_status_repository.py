@@ -1,6 +1,7 @@
-from datetime import datetime, timezone
+from datetime import datetime
+from typing import Dict, List
 
-from sqlalchemy import select
+from sqlalchemy import select, func, update, bindparam, and_, case
 
 from app.db.repository.base import BaseRepository
 from app.models import Message
@@ -34,17 +35,186 @@ class ChatReadStatusRepository(
         result = await self.db.execute(query)
         return result.scalar_one_or_none()
 
+    async def get_chat_read_statuses(
+            self, chat_id: int
+    ) -> List[ChatReadStatus]:
+        query = select(ChatReadStatus).where(
+            ChatReadStatus.chat_id == chat_id
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
     async def mark_as_read(
             self,
-            last_read_message: ChatReadStatus,
-            new_last_read_message_id: int,
+            chat_id: int,
+            user_id: int,
+            last_read_message_id: int,
+            current_time: datetime,
+    ) -> bool:
+        last_delivered_message_id = func.coalesce(
+            ChatReadStatus.last_delivered_message_id, 0
+        )
+        query = (
+            update(ChatReadStatus)
+            .where(
+                ChatReadStatus.chat_id == chat_id,
+                ChatReadStatus.user_id == user_id,
+                func.coalesce(ChatReadStatus.last_read_message_id, 0)
+                < last_read_message_id,
+            )
+            .ordered_values(
+                (ChatReadStatus.delivered_at, case(
+                    (last_delivered_message_id < last_read_message_id,
+                     current_time),
+                    else_=ChatReadStatus.delivered_at
+                )),
+                (ChatReadStatus.last_delivered_message_id, func.greatest(
+                    last_delivered_message_id, last_read_message_id
+                )),
+                (ChatReadStatus.last_read_message_id, last_read_message_id),
+                (ChatReadStatus.read_at, current_time),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.db.execute(query)
+        return result.rowcount > 0
+
+    async def mark_as_sent(
+            self, sent_messages: List[Dict], current_time: datetime
+    ):
+        if not sent_messages:
+            return
+
+        table = ChatReadStatus.__table__
+        query = (
+            update(table)
+            .where(
+                table.c.chat_id == bindparam('b_chat_id'),
+                table.c.user_id == bindparam('b_user_id'),
+            )
+            .values(
+                last_read_message_id=func.greatest(
+                    func.coalesce(table.c.last_read_message_id, 0),
+                    bindparam('b_message_id')
+                ),
+                last_delivered_message_id=func.greatest(
+                    func.coalesce(table.c.last_delivered_message_id, 0),
+                    bindparam('b_message_id')
+                ),
+                read_at=current_time,
+                delivered_at=current_time,
+            )
+        )
+        await self.db.execute(query, [
+            {
+                'b_chat_id': sent_message['chat_id'],
+                'b_user_id': sent_message['user_id'],
+                'b_message_id': sent_message['message_id'],
+            } for sent_message in sent_messages
+        ])
+
+    async def mark_as_delivered(
+            self,
+            user_id: int,
+            delivered_message_ids: Dict[int, int],
+            current_time: datetime,
     ):
-        last_read_message.read_at = datetime.now(timezone.utc)
-        last_read_message.last_read_message_id = new_last_read_message_id
-        return last_read_message
+        if not delivered_message_ids:
+            return
 
-    async def create_chat_read_status(self, chat_id: int, user_id: int):
-        return ChatReadStatus(chat_id=chat_id, user_id=user_id)
+        query = (
+            update(ChatReadStatus)
+            .where(
+                ChatReadStatus.user_id == user_id,
+                ChatReadStatus.chat_id.in_(list(delivered_message_ids)),
+            )
+            .values(
+                last_delivered_message_id=func.greatest(
+                    func.coalesce(ChatReadStatus.last_delivered_message_id, 0),
+                    case(
+                        delivered_message_ids,
+                        value=ChatReadStatus.chat_id,
+                    )
+                ),
+                delivered_at=current_time,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        await self.db.execute(query)
+
+    async def get_undelivered_messages(
+            self,
+            user_id: int,
+            *,
+            limit: int | None = None,
+            after_message_id: int | None = None,
+    ) -> List[Message]:
+        query = (
+            select(Message)
+            .join(
+                ChatReadStatus,
+                and_(
+                    ChatReadStatus.chat_id == Message.chat_id,
+                    ChatReadStatus.user_id == user_id,
+                )
+            )
+            .where(
+                Message.message_id > func.coalesce(
+                    ChatReadStatus.last_delivered_message_id, 0
+                ),
+                Message.user_id != user_id,
+            )
+            .order_by(Message.message_id)
+            .limit(limit)
+        )
+        if after_message_id is not None:
+            query = query.where(Message.message_id > after_message_id)
+
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def get_unread_counts(self, user_id: int, chat_ids: list[int]):
+        query = (
+            select(
+                ChatReadStatus.chat_id,
+                func.count(Message.message_id).label('unread_count')
+            ).outerjoin(
+                Message,
+                onclause=and_(
+                    Message.chat_id == ChatReadStatus.chat_id,
+                    Message.message_id > func.coalesce(
+                        ChatReadStatus.last_read_message_id, 0
+                    ),
+                    Message.user_id != user_id,
+                )
+            ).where(
+                ChatReadStatus.user_id == user_id,
+                ChatReadStatus.chat_id.in_(chat_ids),
+            )
+            .group_by(ChatReadStatus.chat_id)
+        )
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def get_last_message_id(self, chat_id: int) -> int | None:
+        query = select(func.max(Message.message_id)).where(
+            Message.chat_id == chat_id
+        )
+        result = await self.db.execute(query)
+        return result.scalar_one_or_none()
+
+    async def create_chat_read_status(
+            self,
+            chat_id: int,
+            user_id: int,
+            last_message_id: int | None = None,
+    ):
+        return ChatReadStatus(
+            chat_id=chat_id,
+            user_id=user_id,
+            last_read_message_id=last_message_id,
+            last_delivered_message_id=last_message_id,
+        )
 
     async def get_all_user_unread_messages(self, user_id, chat_ids):
         pass
@@ -1,6 +1,11 @@
-from typing import Dict
+from collections import defaultdict
+from datetime import datetime
+from logging import getLogger
+from typing import Dict, Iterable, List, Type
 
-from sqlalchemy import select, asc, delete, and_
+from sqlalchemy import select, asc, delete, and_, update, func, desc, \
+    bindparam, or_
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
 from .base import BaseRepository
@@ -8,9 +13,22 @@ from app.models.chat import Chat as ChatModel
 from app.models.user import User as UserModel
 from app.schemas.chat import ChatCreate, ChatUpdate
 from app.models.chat_participant import ChatParticipant
+from app.models.message import Message as MessageModel
+from app.services.chat.chat_membership_cache import ChatMembershipCache
+
+logger = getLogger(__name__)
 
 
 class ChatRepository(BaseRepository[ChatModel, ChatCreate, ChatUpdate]):
+    def __init__(
+            self,
+            db: AsyncSession,
+            model: Type[ChatModel],
+            membership_cache: ChatMembershipCache | None = None,
+    ):
+        super().__init__(db, model)
+        self.membership_cache = membership_cache
+
     async def create_chat_with_participants(
             self,
             *,
@@ -33,9 +51,17 @@ class ChatRepository(BaseRepository[ChatModel, ChatCreate, ChatUpdate]):
             ))
 
         self.db.add_all(chat_participants)
+        await self.invalidate_participants([new_chat.chat_id])
 
         return new_chat
 
+    async def add_participants(
+            self, chat: ChatModel, users_to_add: list[UserModel]
+    ):
+        for user in users_to_add:
+            chat.participants.append(user)
+        await self.invalidate_participants([chat.chat_id])
+
     async def get_chat_by_participants_ids(
             self,
             participants_ids: list[int],
@@ -53,12 +79,54 @@ class ChatRepository(BaseRepository[ChatModel, ChatCreate, ChatUpdate]):
         return result.scalar_one_or_none()
 
     async def check_if_user_in_chat(self, chat_id, user_id) -> bool:
-        query = select(ChatParticipant).where(
-            ChatParticipant.chat_id == chat_id,
-            ChatParticipant.user_id == user_id
+        return user_id in await self.get_participant_ids(chat_id)
+
+    async def get_participant_ids(self, chat_id: int) -> list[int]:
+        participant_ids_map = await self.get_participant_ids_map([chat_id])
+        return participant_ids_map.get(chat_id, [])
+
+    async def get_participant_ids_map(
+            self, chat_ids: Iterable[int]
+    ) -> Dict[int, List[int]]:
+        chat_ids = set(chat_ids)
+        participant_ids_map = defaultdict(list)
+        if self.membership_cache:
+            participant_ids_map.update(
+                await self.membership_cache.get_participant_ids_map(chat_ids)
+            )
+            chat_ids -= participant_ids_map.keys()
+        if not chat_ids:
+            return participant_ids_map
+
+        generations = None
+        if self.membership_cache:
+            generations = await self.membership_cache.get_generations(
+                chat_ids
+            )
+
+        query = select(ChatParticipant.chat_id, ChatParticipant.user_id).where(
+            ChatParticipant.chat_id.in_(chat_ids)
         )
         result = await self.db.execute(query)
-        return result.scalar_one_or_none() is not None
+
+        for chat_id, user_id in result.all():
+            participant_ids_map[chat_id].append(user_id)
+
+        if generations:
+            for chat_id in chat_ids & participant_ids_map.keys():
+                await self.membership_cache.store_participant_ids(
+                    chat_id, participant_ids_map[chat_id],
+                    generations[chat_id]
+                )
+        return participant_ids_map
+
+    async def invalidate_participants(self, chat_ids: Iterable[int]):
+        if not self.membership_cache:
+            return
+        try:
+            await self.membership_cache.invalidate(chat_ids)
+        except Exception as e:
+            logger.error(f'Failed to invalidate chat membership cache: {e}')
 
     async def get_chat_with_relationships(self, chat_id):
         query = select(ChatModel).where(
@@ -96,18 +164,36 @@ class ChatRepository(BaseRepository[ChatModel, ChatCreate, ChatUpdate]):
         result = await self.db.execute(query)
         return result.all()
 
-    async def delete_user_from_group_chats(self, user_id):
-        group_chat_ids_subquery = select(ChatModel.chat_id).where(
-            ChatModel.is_group == True
-        ).scalar_subquery()
+    async def get_user_group_chat_ids(self, user_id) -> list[int]:
+        query = (
+            select(ChatParticipant.chat_id)
+            .select_from(ChatParticipant)
+            .join(
+                ChatModel,
+                onclause=ChatModel.chat_id == ChatParticipant.chat_id,
+            )
+            .where(
+                ChatParticipant.user_id == user_id,
+                ChatModel.is_group == True
+            )
+        )
+        result = await self.db.execute(query)
+        return list(result.scalars().all())
+
+    async def delete_user_from_group_chats(self, user_id) -> list[int]:
+        group_chat_ids = await self.get_user_group_chat_ids(user_id)
+        if not group_chat_ids:
+            return group_chat_ids
 
         delete_stmt = delete(ChatParticipant).where(
             and_(
                 ChatParticipant.user_id == user_id,
-                ChatParticipant.chat_id.in_(group_chat_ids_subquery)
+                ChatParticipant.chat_id.in_(group_chat_ids)
             )
         )
-        return delete_stmt
+        await self.db.execute(delete_stmt)
+        await self.invalidate_participants(group_chat_ids)
+        return group_chat_ids
 
     async def get_user_chat_ids(self, user_id):
         query = select(ChatParticipant.chat_id).where(
@@ -125,3 +211,72 @@ class ChatRepository(BaseRepository[ChatModel, ChatCreate, ChatUpdate]):
 
         result = await self.db.execute(query)
         return result.all()
+
+    async def get_chat_overviews_for_user_raw(
+            self,
+            user_id: int,
+            limit: int | None = None,
+            before_activity_at: datetime | None = None,
+            before_chat_id: int | None = None,
+    ):
+        query = (
+            select(
+                ChatModel.chat_id,
+                ChatParticipant.chat_name,
+                ChatModel.last_activity_at,
+                MessageModel,
+                UserModel.display_name,
+            )
+            .select_from(ChatModel)
+            .join(
+                ChatParticipant,
+                onclause=ChatParticipant.chat_id == ChatModel.chat_id,
+            )
+            .outerjoin(
+                MessageModel,
+                MessageModel.message_id == ChatModel.last_message_id
+            )
+            .outerjoin(UserModel, UserModel.user_id == MessageModel.user_id)
+            .where(ChatParticipant.user_id == user_id)
+            .order_by(
+                desc(ChatModel.last_activity_at), desc(ChatModel.chat_id)
+            )
+            .limit(limit)
+        )
+        if before_activity_at is not None:
+            query = query.where(or_(
+                ChatModel.last_activity_at < before_activity_at,
+                and_(
+                    ChatModel.last_activity_at == before_activity_at,
+                    ChatModel.chat_id < (before_chat_id or 0),
+                )
+            ))
+
+        result = await self.db.execute(query)
+        return result.all()
+
+    async def update_last_messages(
+            self, last_messages: Dict[int, int], activity_at: datetime
+    ):
+        if not last_messages:
+            return
+
+        table = ChatModel.__table__
+        query = (
+            update(table)
+            .where(table.c.chat_id == bindparam('b_chat_id'))
+            .values(
+                last_message_id=func.greatest(
+                    func.coalesce(table.c.last_message_id, 0),
+                    bindparam('b_message_id')
+                ),
+                last_activity_at=func.greatest(
+                    func.coalesce(table.c.last_activity_at, activity_at),
+                    activity_at
+                ),
+            )
+        )
+        await self.db.execute(query, [
+            {'b_chat_id': chat_id, 'b_message_id': message_id}
+            for chat_id, message_id in last_messages.items()
+        ])
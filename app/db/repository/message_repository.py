@@ -1,10 +1,12 @@
-from sqlalchemy import select, func, Sequence
+from typing import Dict, List
+
+from sqlalchemy import select, Sequence, insert
 from sqlalchemy.orm import selectinload
 
 from .base import BaseRepository
+from app.infrastructure.exceptions.exceptions import DatabaseError
 from app.models.message import Message as MessageModel
 from app.schemas.message import MessageCreate, MessageUpdate
-from ...models import User
 
 
 class MessageRepository(
@@ -24,35 +26,52 @@ class MessageRepository(
         self.db.add(new_message)
         return new_message
 
-    async def get_last_messages_from_every_chat(self, chat_ids):
-        subquery = (
-            select(
-                MessageModel.chat_id,
-                func.max(MessageModel.message_id).label('last_message_id')
-            ).where(MessageModel.chat_id.in_(chat_ids))
-            .group_by(MessageModel.chat_id)
-            .subquery()
-        )
+    async def create_messages_bulk(
+            self, messages_data: List[Dict]
+    ) -> List[MessageModel]:
+        if not messages_data:
+            return []
 
-        query = (
-            select(MessageModel, User.display_name)
-            .join(
-                subquery, MessageModel.message_id == subquery.c.last_message_id
-            ).join(User)
+        result = await self.db.execute(
+            insert(MessageModel).values(messages_data)
         )
-        result = await self.db.execute(query)
+        if not result.lastrowid:
+            raise DatabaseError('Failed to read ids of inserted messages')
 
-        return result.all()
+        return [
+            MessageModel(message_id=result.lastrowid + i, **message_data)
+            for i, message_data in enumerate(messages_data)
+        ]
 
-    async def get_chat_messages(self, chat_id) -> Sequence[MessageModel]:
+    async def get_chat_messages(
+            self,
+            chat_id: int,
+            *,
+            limit: int,
+            before_message_id: int | None = None,
+            after_message_id: int | None = None,
+    ) -> Sequence[MessageModel]:
         query = (
             select(MessageModel)
-            .options(
-                selectinload(MessageModel.sender),
-                selectinload(MessageModel.deliveries)
-            )
+            .options(selectinload(MessageModel.sender))
             .where(MessageModel.chat_id == chat_id)
+            .limit(limit)
         )
 
+        if after_message_id is not None:
+            query = query.where(
+                MessageModel.message_id > after_message_id
+            ).order_by(MessageModel.message_id.asc())
+        else:
+            if before_message_id is not None:
+                query = query.where(
+                    MessageModel.message_id < before_message_id
+                )
+            query = query.order_by(MessageModel.message_id.desc())
+
         result = await self.db.execute(query)
-        return result.scalars().all()
+        messages = list(result.scalars().all())
+
+        if after_message_id is None:
+            messages.reverse()
+        return messages
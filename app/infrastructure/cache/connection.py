@@ -1,5 +1,3 @@
-from contextlib import asynccontextmanager
-
 import redis.asyncio as redis
 
 from app.core.config import settings
@@ -12,14 +10,25 @@ REDIS_PORT = settings.REDIS_PORT
 REDIS_PASSWORD = settings.REDIS_PASSWORD
 
 
-async def get_redis_client() -> redis.Redis:
+def create_redis_pool(
+        max_connections: int = settings.REDIS_MAX_CONNECTIONS,
+) -> redis.BlockingConnectionPool:
+    return redis.BlockingConnectionPool(
+        host=REDIS_HOST,
+        port=REDIS_PORT,
+        password=REDIS_PASSWORD,
+        decode_responses=True,
+        max_connections=max_connections,
+        timeout=settings.REDIS_POOL_TIMEOUT_SECONDS,
+        health_check_interval=settings.REDIS_HEALTH_CHECK_INTERVAL_SECONDS,
+    )
+
+
+async def get_redis_client(
+        pool: redis.ConnectionPool | None = None
+) -> redis.Redis:
     try:
-        redis_client = redis.StrictRedis(
-            host=REDIS_HOST,
-            port=REDIS_PORT,
-            password=REDIS_PASSWORD,
-            decode_responses=True,
-        )
+        redis_client = redis.Redis.from_pool(pool or create_redis_pool())
         await redis_client.ping()
 
         logger.info('Redis connection established!')
@@ -31,11 +40,12 @@ async def get_redis_client() -> redis.Redis:
         raise
 
 
-@asynccontextmanager
-async def get_lifespan_redis_client():
-    redis = await get_redis_client()
-    try:
-        yield redis
-    finally:
-        if redis:
-            await redis.close()
+def get_redis_pool_stats(pool: redis.ConnectionPool) -> dict:
+    in_use = len(pool._in_use_connections)
+    available = len(pool._available_connections)
+    return {
+        'max_connections': pool.max_connections,
+        'in_use_connections': in_use,
+        'available_connections': available,
+        'created_connections': in_use + available,
+    }
@@ -1,11 +1,17 @@
-import json
 from typing import Any
 from fastapi.encoders import jsonable_encoder
 
+from app.infrastructure.serialization.json_codec import json_codec
+
+
+def _encode_fallback(obj: Any) -> Any:
+    encoded = jsonable_encoder(obj)
+    return str(encoded) if encoded is obj else encoded
+
 
 class JsonSerializer:
     def dumps(self, obj: Any) -> str:
-        return json.dumps(jsonable_encoder(obj), default=str)
+        return json_codec.dumps(obj, default=_encode_fallback)
 
     def loads(self, data: str) -> Any:
-        return json.loads(data)
+        return json_codec.loads(data)
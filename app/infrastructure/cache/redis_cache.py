@@ -1,9 +1,54 @@
-from typing import Any
+import asyncio
+import math
+import random
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Iterable, \
+    List, Mapping, NamedTuple, Tuple
+
+from redis.asyncio.client import Pipeline
 
 from redis.asyncio import Redis
+from redis.exceptions import LockError, RedisError
+from sqlalchemy.exc import SQLAlchemyError
 import logging
 
 from app.core.cache.base import Serializer, Cache
+from app.core.config import settings
+
+STALE_ON_ERRORS = (SQLAlchemyError, RedisError, OSError, asyncio.TimeoutError)
+
+NOT_FETCHED: Any = object()
+
+INVALIDATE_TAGS_SCRIPT = """
+local invalidated = {}
+for _, tag_key in ipairs(KEYS) do
+    local members = redis.call('SMEMBERS', tag_key)
+    for i = 1, #members, 1000 do
+        local batch = {unpack(members, i, math.min(i + 999, #members))}
+        redis.call('UNLINK', unpack(batch))
+        redis.call('SREM', tag_key, unpack(batch))
+    end
+    for _, member in ipairs(members) do
+        table.insert(invalidated, member)
+    end
+end
+return invalidated
+"""
+
+
+class LoadAbandonedError(Exception):
+    pass
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    delta: float
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
 
 
 class RedisCache(Cache):
@@ -12,38 +57,294 @@ class RedisCache(Cache):
             redis: Redis,
             serializer: Serializer,
             default_ttl: int = 900,
+            early_refresh_beta: float = settings.CACHE_EARLY_REFRESH_BETA,
+            lock_timeout: float = settings.CACHE_LOCK_TIMEOUT_SECONDS,
+            lock_wait: float = settings.CACHE_LOCK_WAIT_SECONDS,
+            lock_poll_interval: float =
+            settings.CACHE_LOCK_POLL_INTERVAL_SECONDS,
     ):
         self._redis = redis
         self._ttl = default_ttl
         self._serializer = serializer
+        self._early_refresh_beta = early_refresh_beta
+        self._lock_timeout = lock_timeout
+        self._lock_wait = lock_wait
+        self._lock_poll_interval = lock_poll_interval
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._invalidate_tags = redis.register_script(INVALIDATE_TAGS_SCRIPT)
         self._log = logging.getLogger(__name__)
 
+    @property
+    def serializer(self) -> Serializer:
+        return self._serializer
+
+    @property
+    def default_ttl(self) -> int:
+        return self._ttl
+
     async def get(self, key: str) -> Any | None:
-        raw = await self._redis.get(key)
+        raw = await self.get_raw(key)
         return self._serializer.loads(raw) if raw else None
 
-    async def set(self, key: str, value: Any, ttl: int | None = None) -> None:
-        await self._redis.set(
-            key,
-            self._serializer.dumps(value),
-            ex = ttl or self._ttl,
-        )
+    async def get_raw(self, key: str) -> str | None:
+        return await self._redis.get(key)
 
-    async def delete(self, key: str) -> None:
-        await self._redis.delete(key)
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        return {
+            key: self._serializer.loads(raw)
+            for key, raw in zip(keys, await self.get_many_raw(keys))
+            if raw
+        }
 
-    async def delete_pattern(
+    async def get_many_raw(self, keys: Iterable[str]) -> List[str | None]:
+        keys = list(keys)
+        if not keys:
+            return []
+        return await self._redis.mget(keys)
+
+    async def set(
             self,
-            pattern: str,
-            batch: int = 500
+            key: str,
+            value: Any,
+            ttl: int | None = None,
+            tags: Iterable[str] = (),
+    ) -> None:
+        await self.set_raw(key, self._serializer.dumps(value), ttl, tags)
+
+    async def set_raw(
+            self,
+            key: str,
+            raw: str,
+            ttl: int | None = None,
+            tags: Iterable[str] = (),
     ):
-        cursor = "0"
-        while cursor:
-            cursor, keys = await self._redis.scan(
-                cursor=cursor, match=pattern, batch=batch
+        ttl = ttl or self._ttl
+        tag_keys = [self.tag_key(tag) for tag in tags]
+        if not tag_keys:
+            await self._redis.set(key, raw, ex=ttl)
+            return
+
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.set(key, raw, ex=ttl)
+            for tag_key in tag_keys:
+                pipe.sadd(tag_key, key)
+                pipe.expire(tag_key, ttl, nx=True)
+                pipe.expire(tag_key, ttl, gt=True)
+            await pipe.execute()
+
+    async def set_many(
+            self, mapping: Mapping[str, Any], ttl: int | None = None
+    ) -> None:
+        await self.set_many_raw(
+            {
+                key: self._serializer.dumps(value)
+                for key, value in mapping.items()
+            },
+            ttl
+        )
+
+    async def set_many_raw(
+            self, mapping: Mapping[str, str], ttl: int | None = None
+    ):
+        if not mapping:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, raw in mapping.items():
+                pipe.set(key, raw, ex=ttl or self._ttl)
+            await pipe.execute()
+
+    @asynccontextmanager
+    async def pipeline(
+            self, transaction: bool = True
+    ) -> AsyncIterator[Pipeline]:
+        async with self._redis.pipeline(transaction=transaction) as pipe:
+            yield pipe
+
+    @staticmethod
+    def tag_key(tag: str) -> str:
+        return f'tag:{tag}'
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            ttl: int | None = None,
+            **kwargs,
+    ) -> Any | None:
+        value, _ = await self.get_or_load_raw(key, loader, ttl, **kwargs)
+        return value
+
+    async def get_or_load_raw(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            ttl: int | None = None,
+            *,
+            raw: str | None = NOT_FETCHED,
+            tags: Iterable[str] = (),
+            stale_ttl: int = settings.CACHE_STALE_TTL_SECONDS,
+            lock: bool = False,
+    ) -> Tuple[Any, str | None]:
+        if raw is NOT_FETCHED:
+            raw = await self._read_raw(key)
+        entry = self._parse_entry(raw)
+        if entry is not None and not self._should_refresh(entry):
+            return entry.value, raw
+
+        inflight = self._inflight.get(key)
+        if inflight is not None:
+            try:
+                value, raw = await asyncio.shield(inflight)
+            except LoadAbandonedError:
+                return await self.get_or_load_raw(
+                    key, loader, ttl,
+                    tags=tags, stale_ttl=stale_ttl, lock=lock,
+                )
+            if raw:
+                return self._serializer.loads(raw)['value'], raw
+            return value, raw
+
+        inflight = asyncio.get_running_loop().create_future()
+        self._inflight[key] = inflight
+        try:
+            result = await self._load(
+                key, loader, ttl or self._ttl, stale_ttl, list(tags), lock,
+                entry
             )
-            if keys:
-                await self._redis.unlink(*keys)
+        except asyncio.CancelledError:
+            self._fail_inflight(inflight, LoadAbandonedError(key))
+            raise
+        except Exception as e:
+            self._fail_inflight(inflight, e)
+            raise
+        else:
+            inflight.set_result(result)
+            return result
+        finally:
+            if self._inflight.get(key) is inflight:
+                del self._inflight[key]
+
+    @staticmethod
+    def _fail_inflight(inflight: asyncio.Future, error: Exception):
+        inflight.set_exception(error)
+        inflight.exception()
+
+    async def _read_raw(self, key: str) -> str | None:
+        try:
+            return await self.get_raw(key)
+        except RedisError as e:
+            self._log.error(f'Failed to read cache entry {key}: {e}')
+            return None
+
+    def _parse_entry(self, raw: str | None) -> CacheEntry | None:
+        if not raw:
+            return None
+
+        envelope = self._serializer.loads(raw)
+        if not isinstance(envelope, dict) or 'expires_at' not in envelope:
+            return None
+        return CacheEntry(
+            envelope['value'], envelope['delta'], envelope['expires_at']
+        )
+
+    def _should_refresh(self, entry: CacheEntry) -> bool:
+        return time.time() - entry.delta * self._early_refresh_beta * (
+            math.log(1 - random.random())
+        ) >= entry.expires_at
+
+    async def _load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            ttl: int,
+            stale_ttl: int,
+            tags: List[str],
+            use_lock: bool,
+            stale: CacheEntry | None,
+    ) -> Tuple[Any, str | None]:
+        redis_lock = None
+        if use_lock:
+            redis_lock = self._redis.lock(
+                f'lock:{key}', timeout=self._lock_timeout, blocking=False
+            )
+            try:
+                acquired = await redis_lock.acquire()
+            except RedisError as e:
+                self._log.error(f'Failed to acquire cache lock {key}: {e}')
+                acquired, redis_lock = True, None
+
+            if not acquired:
+                redis_lock = None
+                if stale is not None:
+                    return stale.value, None
+                raw = await self._wait_for_entry(key)
+                if raw is not None:
+                    return self._parse_entry(raw).value, raw
+
+        try:
+            return await self._load_and_store(
+                key, loader, ttl, stale_ttl, tags, stale
+            )
+        finally:
+            if redis_lock is not None:
+                try:
+                    await redis_lock.release()
+                except (LockError, RedisError) as e:
+                    self._log.warning(f'Failed to release cache lock '
+                                      f'{key}: {e}')
+
+    async def _wait_for_entry(self, key: str) -> str | None:
+        deadline = time.monotonic() + self._lock_wait
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self._lock_poll_interval)
+            raw = await self._read_raw(key)
+            entry = self._parse_entry(raw)
+            if entry is not None and entry.is_fresh:
+                return raw
+        return None
+
+    async def _load_and_store(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            ttl: int,
+            stale_ttl: int,
+            tags: List[str],
+            stale: CacheEntry | None,
+    ) -> Tuple[Any, str | None]:
+        started_at = time.monotonic()
+        try:
+            value = await loader()
+        except STALE_ON_ERRORS as e:
+            if stale is None:
+                raise
+            self._log.warning(f'Serving stale cache entry {key}: {e}')
+            return stale.value, None
+
+        if value is None:
+            return None, None
+
+        raw = self._serializer.dumps({
+            'value': value,
+            'delta': time.monotonic() - started_at,
+            'expires_at': time.time() + ttl,
+        })
+        try:
+            await self.set_raw(key, raw, ttl + stale_ttl, tags)
+        except RedisError as e:
+            self._log.error(f'Failed to store cache entry {key}: {e}')
+        return value, raw
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(key)
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        tag_keys = [self.tag_key(tag) for tag in tags]
+        if not tag_keys:
+            return []
+
+        return list(set(await self._invalidate_tags(keys=tag_keys)))
 
     async def exists(self, key: str) -> bool:
         return await self._redis.exists(key)
@@ -1,14 +1,36 @@
+from typing import Any, Iterable, Tuple
+
 from redis.asyncio import Redis
 from redis.asyncio.client import PubSub
 
+from app.infrastructure.serialization.json_codec import JsonCodec, \
+    json_codec
+
 
 class RedisPubSub:
-    def __init__(self, redis: Redis):
+    def __init__(self, redis: Redis, codec: JsonCodec = json_codec):
         self._redis = redis
+        self._codec = codec
 
-    async def publish(self, channel: str, message: str):
+    async def publish(self, channel: str, message: str | bytes):
         await self._redis.publish(channel, message)
 
+    async def publish_json(self, channel: str, payload: Any):
+        await self.publish(channel, self._codec.dumpb(payload))
+
+    async def publish_many(
+            self, channels: Iterable[str], message: str | bytes
+    ):
+        await self.publish_batch((channel, message) for channel in channels)
+
+    async def publish_batch(
+            self, messages: Iterable[Tuple[str, str | bytes]]
+    ):
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for channel, message in messages:
+                pipe.publish(channel, message)
+            await pipe.execute()
+
     async def subscribe(self, channel: str) -> PubSub:
         pubsub = self._redis.pubsub()
         await pubsub.subscribe(channel)
@@ -0,0 +1,196 @@
+from logging import getLogger
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, \
+    Iterable, List, Mapping
+from uuid import uuid4
+
+from app.core.cache.base import Cache
+from app.core.config import settings
+from app.infrastructure.cache.local_ttl_cache import LocalTTLCache
+from redis.asyncio.client import Pipeline
+
+from app.infrastructure.cache.redis_cache import RedisCache, NOT_FETCHED
+from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.schemas.event import RedisEvent
+
+logger = getLogger(__name__)
+
+CACHE_INVALIDATED_EVENT = 'cache_invalidated'
+
+
+class TwoLevelCache(Cache):
+    def __init__(
+            self,
+            remote: RedisCache,
+            pubsub: RedisPubSub,
+            local_cache: LocalTTLCache | None = None,
+            channel: str = settings.CACHE_INVALIDATION_CHANNEL,
+    ):
+        self.remote = remote
+        self.local_cache = local_cache or LocalTTLCache(
+            max_size=settings.LOCAL_CACHE_MAX_SIZE,
+            ttl=settings.LOCAL_CACHE_TTL_SECONDS,
+        )
+        self.channel = channel
+        self.node_id = uuid4().hex
+        self._pubsub = pubsub
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Any | None:
+        raw = self.local_cache.get(key)
+        if raw is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            raw = await self.remote.get_raw(key)
+            if not raw:
+                return None
+            self.local_cache.set(key, raw)
+        return self.remote.serializer.loads(raw)
+
+    async def set(
+            self,
+            key: str,
+            value: Any,
+            ttl: int | None = None,
+            tags: Iterable[str] = (),
+    ) -> None:
+        raw = self.remote.serializer.dumps(value)
+        self.local_cache.set(key, raw, self._local_ttl(ttl))
+        await self.remote.set_raw(key, raw, ttl, tags)
+        await self._publish_invalidation([key])
+
+    async def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        keys = list(keys)
+        return {
+            key: self.remote.serializer.loads(raw)
+            for key, raw in zip(keys, await self.get_many_raw(keys))
+            if raw
+        }
+
+    async def get_many_raw(self, keys: Iterable[str]) -> List[str | None]:
+        keys = list(keys)
+        raws = [self.local_cache.get(key) for key in keys]
+        missing = [i for i, raw in enumerate(raws) if raw is None]
+        self.hits += len(keys) - len(missing)
+        self.misses += len(missing)
+        if not missing:
+            return raws
+
+        remote_raws = await self.remote.get_many_raw(
+            [keys[i] for i in missing]
+        )
+        for i, raw in zip(missing, remote_raws):
+            if raw:
+                self.local_cache.set(keys[i], raw)
+            raws[i] = raw
+        return raws
+
+    async def set_many(
+            self, mapping: Mapping[str, Any], ttl: int | None = None
+    ) -> None:
+        raws = {
+            key: self.remote.serializer.dumps(value)
+            for key, value in mapping.items()
+        }
+        for key, raw in raws.items():
+            self.local_cache.set(key, raw, self._local_ttl(ttl))
+        await self.remote.set_many_raw(raws, ttl)
+        await self._publish_invalidation(raws)
+
+    @asynccontextmanager
+    async def pipeline(
+            self, transaction: bool = True
+    ) -> AsyncIterator[Pipeline]:
+        async with self.remote.pipeline(transaction) as pipe:
+            yield pipe
+
+    async def get_or_load(
+            self,
+            key: str,
+            loader: Callable[[], Awaitable[Any]],
+            ttl: int | None = None,
+            *,
+            raw: str | None = NOT_FETCHED,
+            **kwargs,
+    ) -> Any | None:
+        if raw is NOT_FETCHED:
+            raw = self.local_cache.get(key)
+            if raw is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+                raw = NOT_FETCHED
+        cached_raw = raw
+
+        value, raw = await self.remote.get_or_load_raw(
+            key, loader, ttl, raw=raw, **kwargs
+        )
+        if raw is not None and raw is not cached_raw:
+            self.local_cache.set(key, raw, self._local_ttl(ttl))
+        return value
+
+    async def delete(self, key: str) -> None:
+        self.local_cache.delete(key)
+        await self.remote.delete(key)
+        await self._publish_invalidation([key])
+
+    async def invalidate_tags(self, tags: Iterable[str]):
+        keys = await self.remote.invalidate_tags(tags)
+        if keys:
+            self.local_cache.delete_many(keys)
+            await self._publish_invalidation(keys)
+
+    async def exists(self, key: str) -> bool:
+        if self.local_cache.get(key) is not None:
+            return True
+        return await self.remote.exists(key)
+
+    async def setex(
+            self,
+            *,
+            key: str,
+            value: Any,
+            ttl: int | None = None
+    ) -> None:
+        await self.set(key, value, ttl)
+
+    async def incr(self, key: str):
+        self.local_cache.delete(key)
+        return await self.remote.incr(key)
+
+    async def expire(self, key: str, ttl: int | None = None) -> bool:
+        return await self.remote.expire(key, ttl)
+
+    async def handle_invalidation(self, redis_event: RedisEvent):
+        if redis_event.event != CACHE_INVALIDATED_EVENT \
+                or redis_event.data.get('node_id') == self.node_id:
+            return
+        self.local_cache.delete_many(redis_event.data.get('keys', []))
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            'size': len(self.local_cache),
+            'max_size': self.local_cache.max_size,
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_ratio': self.hits / lookups if lookups else 0.0,
+            'evictions': self.local_cache.evictions,
+        }
+
+    def _local_ttl(self, ttl: int | None) -> float:
+        return min(ttl or self.remote.default_ttl, self.local_cache.ttl)
+
+    async def _publish_invalidation(self, keys: Iterable[str]):
+        try:
+            await self._pubsub.publish_json(self.channel, {
+                'event': CACHE_INVALIDATED_EVENT,
+                'data': {
+                    'node_id': self.node_id,
+                    'keys': list(keys),
+                },
+            })
+        except Exception as e:
+            logger.error(f'Failed to publish cache invalidation: {e}')
@@ -0,0 +1,48 @@
+import asyncio
+from collections import deque
+from logging import getLogger
+from typing import Awaitable, Callable, Deque, Dict, Hashable, Set
+
+logger = getLogger(__name__)
+
+Job = Callable[[], Awaitable[None]]
+
+
+class KeyedTaskQueue:
+    def __init__(self, max_concurrency: int):
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._queues: Dict[Hashable, Deque[Job]] = {}
+        self._tasks: Set[asyncio.Task] = set()
+
+    @property
+    def active_keys(self) -> int:
+        return len(self._queues)
+
+    def submit(self, key: Hashable, job: Job):
+        queue = self._queues.get(key)
+        if queue is not None:
+            queue.append(job)
+            return
+
+        self._queues[key] = deque([job])
+        task = asyncio.create_task(self._drain(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def join(self):
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _drain(self, key: Hashable):
+        queue = self._queues[key]
+        try:
+            while queue:
+                job = queue.popleft()
+                async with self._semaphore:
+                    try:
+                        await job()
+                    except Exception as e:
+                        logger.error(f'Job for key {key} failed: {e}',
+                                     exc_info=e)
+        finally:
+            del self._queues[key]
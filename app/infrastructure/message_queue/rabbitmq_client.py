@@ -1,14 +1,18 @@
-import json
+import asyncio
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from logging import getLogger
+from typing import AsyncIterator, Set
 
 import aio_pika
+from aio_pika.pool import Pool
 
 from app.core.config import settings
 from app.infrastructure.exceptions.exceptions import MessagingConnectionError, InvalidMessageDataError, \
     MessagePublishError
 from app.infrastructure.message_queue.rabbitmq_connection_provider import \
     RabbitMQConnectionProvider
+from app.infrastructure.serialization.json_codec import json_codec
 
 RABBITMQ_HOST = settings.RABBITMQ_HOST
 RABBITMQ_PORT = settings.RABBITMQ_PORT
@@ -18,6 +22,8 @@ WAITING_QUEUE_NAME = settings.RABBITMQ_WAITING_QUEUE
 PROCESSING_QUEUE_NAME = settings.RABBITMQ_PROCESSING_QUEUE
 DLX_NAME = settings.RABBITMQ_DLX_NAME
 REGULAR_MESSAGE_QUEUE_NAME = settings.RABBITMQ_REGULAR_MESSAGE_QUEUE
+CHANNEL_POOL_SIZE = settings.RABBITMQ_CHANNEL_POOL_SIZE
+CONFIRM_WINDOW = settings.RABBITMQ_CONFIRM_WINDOW
 
 
 logger = getLogger(__name__)
@@ -26,55 +32,115 @@ logger = getLogger(__name__)
 class RabbitMQClient:
     def __init__(
             self,
-            connection_provider = RabbitMQConnectionProvider()
+            connection_provider = RabbitMQConnectionProvider(),
+            channel_pool_size: int = CHANNEL_POOL_SIZE,
+            confirm_window: int = CONFIRM_WINDOW,
     ):
         self.connection_provider = connection_provider
+        self.channel_pool_size = channel_pool_size
+        self._connection: aio_pika.abc.AbstractRobustConnection | None = None
+        self._channel_pool: Pool[aio_pika.abc.AbstractChannel] | None = None
+        self._confirm_channel: aio_pika.abc.AbstractChannel | None = None
+        self._confirm_window = asyncio.Semaphore(confirm_window)
+        self._pending_confirms: Set[asyncio.Task] = set()
+        self._lock = asyncio.Lock()
+
+    @property
+    def pending_confirms(self) -> int:
+        return len(self._pending_confirms)
+
+    async def connect(self):
+        async with self._lock:
+            if self._channel_pool:
+                return
+
+            self._connection = await self.connection_provider.get_connection()
+            self._channel_pool = Pool(
+                self._connection.channel, max_size=self.channel_pool_size
+            )
+            async with self._channel_pool.acquire() as channel:
+                await self._declare_topology(channel)
+            self._confirm_channel = await self._connection.channel(
+                publisher_confirms=True
+            )
+            logger.info(f"RabbitMQ client connected with up to "
+                        f"{self.channel_pool_size} channels")
+
+    async def close(self):
+        if self._pending_confirms:
+            await asyncio.gather(
+                *self._pending_confirms, return_exceptions=True
+            )
+        async with self._lock:
+            if self._confirm_channel and not self._confirm_channel.is_closed:
+                await self._confirm_channel.close()
+            self._confirm_channel = None
+            if self._channel_pool:
+                await self._channel_pool.close()
+                self._channel_pool = None
+            if self._connection and not self._connection.is_closed:
+                await self._connection.close()
+            self._connection = None
+            logger.info("RabbitMQ client closed")
+
+    @asynccontextmanager
+    async def _channel(self) -> AsyncIterator[aio_pika.abc.AbstractChannel]:
+        if not self._channel_pool:
+            try:
+                await self.connect()
+            except Exception as e:
+                raise MessagingConnectionError(str(e))
+        async with self._channel_pool.acquire() as channel:
+            yield channel
+
+    async def _declare_topology(self, channel: aio_pika.abc.AbstractChannel):
+        await channel.declare_queue(REGULAR_MESSAGE_QUEUE_NAME, durable=True)
+
+        dlx_exchange = await channel.declare_exchange(
+            DLX_NAME, aio_pika.ExchangeType.DIRECT, durable=True
+        )
+        processing_queue = await channel.declare_queue(
+            PROCESSING_QUEUE_NAME, durable=True
+        )
+        await processing_queue.bind(
+            dlx_exchange,
+            routing_key=WAITING_QUEUE_NAME
+        )
+
+        await channel.declare_queue(
+            WAITING_QUEUE_NAME,
+            durable=True,
+            arguments={
+                'x-dead-letter-exchange': DLX_NAME,
+                'x-dead-letter-routing-key': WAITING_QUEUE_NAME
+            }
+        )
 
     async def publish_delayed(self, message_data: dict, delay_seconds: int):
-        connection = await self.connection_provider.get_connection()
-
         try:
-            async with connection.channel() as channel:
-                dlx_exchange = await channel.declare_exchange(
-                    DLX_NAME, aio_pika.ExchangeType.DIRECT, durable=True
-                )
-                processing_queue = await channel.declare_queue(
-                    PROCESSING_QUEUE_NAME, durable=True
-                )
-                await processing_queue.bind(
-                    dlx_exchange,
-                    routing_key=WAITING_QUEUE_NAME
-                )
+            message_body = json_codec.dumpb(message_data)
+            delay_ms = int(delay_seconds * 1000)
 
-                await channel.declare_queue(
-                    WAITING_QUEUE_NAME,
-                    durable=True,
-                    arguments={
-                        'x-dead-letter-exchange': DLX_NAME,
-                        'x-dead-letter-routing-key': WAITING_QUEUE_NAME
-                    }
-                )
-
-                message_body = json.dumps(message_data).encode('utf-8')
-                delay_ms = int(delay_seconds * 1000)
+            if delay_ms < 0:
+                raise ValueError("Delay must be greater than 0")
 
-                if delay_ms < 0:
-                    raise ValueError("Delay must be greater than 0")
-
-                message = aio_pika.Message(
-                    body=message_body,
-                    delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
-                    expiration=timedelta(milliseconds=delay_ms)
-                )
+            message = aio_pika.Message(
+                body=message_body,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                expiration=timedelta(milliseconds=delay_ms)
+            )
 
+            async with self._channel() as channel:
                 await channel.default_exchange.publish(
                     message,
                     routing_key=WAITING_QUEUE_NAME
                 )
-                logger.info(f" [x] ASYNC Sent delayed message to queue "
-                            f"'{WAITING_QUEUE_NAME}': {message_data} "
-                            f"with delay {delay_seconds}s")
+            logger.info(f" [x] ASYNC Sent delayed message to queue "
+                        f"'{WAITING_QUEUE_NAME}': {message_data} "
+                        f"with delay {delay_seconds}s")
 
+        except MessagingConnectionError:
+            raise
         except InvalidMessageDataError as value_error:
             logger.error(f" [x] ASYNC Invalid value for publishing: "
                          f"{value_error}")
@@ -82,28 +148,62 @@ class RabbitMQClient:
         except Exception as e:
             logger.error(f" [x] ASYNC Error publishing message: {e}")
             raise MessagePublishError(str(e))
-        finally:
-            if connection and not connection.is_closed:
-                await connection.close()
 
-    async def publish(self, message_data: dict):
-        connection = await self.connection_provider.get_connection()
+    async def publish_confirmed(self, message_data: dict) -> asyncio.Future:
         try:
-            async with connection.channel() as channel:
-                await channel.declare_queue(
-                    REGULAR_MESSAGE_QUEUE_NAME,
-                    durable=True
-                )
+            message = aio_pika.Message(
+                body=json_codec.dumpb(message_data),
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+            )
+        except (TypeError, ValueError) as value_error:
+            raise InvalidMessageDataError(str(value_error))
+
+        if not self._confirm_channel:
+            try:
+                await self.connect()
+            except Exception as e:
+                raise MessagingConnectionError(str(e))
+
+        await self._confirm_window.acquire()
+        confirmation = asyncio.create_task(
+            self._wait_for_confirm(message, message_data)
+        )
+        self._pending_confirms.add(confirmation)
+        confirmation.add_done_callback(self._release_confirm_slot)
+        return confirmation
+
+    async def _wait_for_confirm(
+            self, message: aio_pika.Message, message_data: dict
+    ):
+        try:
+            await self._confirm_channel.default_exchange.publish(
+                message,
+                routing_key=REGULAR_MESSAGE_QUEUE_NAME
+            )
+        except Exception as e:
+            logger.error(f" [x] ASYNC Message was not confirmed by broker: "
+                         f"{e}")
+            raise MessagePublishError(str(e))
+        logger.info(f'message {message_data} confirmed by mq')
 
-                message = aio_pika.Message(
-                    body=json.dumps(message_data).encode('utf-8'),
-                )
+    def _release_confirm_slot(self, confirmation: asyncio.Task):
+        self._pending_confirms.discard(confirmation)
+        self._confirm_window.release()
+
+    async def publish(self, message_data: dict):
+        try:
+            message = aio_pika.Message(
+                body=json_codec.dumpb(message_data),
+            )
 
+            async with self._channel() as channel:
                 await channel.default_exchange.publish(
                     message,
                     routing_key=REGULAR_MESSAGE_QUEUE_NAME
                 )
-                logger.info(f'message {message_data} sent to mq')
+            logger.info(f'message {message_data} sent to mq')
+        except MessagingConnectionError:
+            raise
         except InvalidMessageDataError as value_error:
             logger.error(f" [x] ASYNC Invalid value for publishing: "
                          f"{value_error}")
@@ -111,6 +211,3 @@ class RabbitMQClient:
         except Exception as e:
             logger.error(f" [x] ASYNC Error publishing message: {e}")
             raise MessagePublishError(str(e))
-        finally:
-            if connection and not connection.is_closed:
-                await connection.close()
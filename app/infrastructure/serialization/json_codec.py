@@ -0,0 +1,121 @@
+import json
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from enum import Enum
+from logging import getLogger
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from app.core.config import settings
+from app.infrastructure.types.codec import JsonCodecBackend
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+logger = getLogger(__name__)
+
+Default = Callable[[Any], Any]
+
+
+class JsonDecodeError(ValueError):
+    pass
+
+
+def encode_default(obj: Any) -> Any:
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, Enum):
+        return obj.value
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    return str(obj)
+
+
+class JsonCodec(ABC):
+    name: JsonCodecBackend
+
+    @abstractmethod
+    def dumpb(self, obj: Any, default: Default = encode_default) -> bytes: ...
+
+    @abstractmethod
+    def loads(self, data: str | bytes) -> Any: ...
+
+    def dumps(self, obj: Any, default: Default = encode_default) -> str:
+        return self.dumpb(obj, default).decode('utf-8')
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = JsonCodecBackend.STDLIB
+
+    def dumps(self, obj: Any, default: Default = encode_default) -> str:
+        return json.dumps(obj, default=default)
+
+    def dumpb(self, obj: Any, default: Default = encode_default) -> bytes:
+        return self.dumps(obj, default).encode('utf-8')
+
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return json.loads(data)
+        except json.JSONDecodeError as e:
+            raise JsonDecodeError(str(e)) from e
+
+
+class OrjsonCodec(JsonCodec):
+    name = JsonCodecBackend.ORJSON
+
+    def dumpb(self, obj: Any, default: Default = encode_default) -> bytes:
+        return orjson.dumps(
+            obj, default=default, option=orjson.OPT_NON_STR_KEYS
+        )
+
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError as e:
+            raise JsonDecodeError(str(e)) from e
+
+
+class MsgspecJsonCodec(JsonCodec):
+    name = JsonCodecBackend.MSGSPEC
+
+    def __init__(self):
+        self._encoder = msgspec.json.Encoder(enc_hook=encode_default)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumpb(self, obj: Any, default: Default = encode_default) -> bytes:
+        if default is encode_default:
+            return self._encoder.encode(obj)
+        return msgspec.json.encode(obj, enc_hook=default)
+
+    def loads(self, data: str | bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise JsonDecodeError(str(e)) from e
+
+
+def get_json_codec(
+        backend: JsonCodecBackend = settings.JSON_CODEC
+) -> JsonCodec:
+    if backend in (JsonCodecBackend.AUTO, JsonCodecBackend.ORJSON) and orjson:
+        return OrjsonCodec()
+    if backend in (JsonCodecBackend.AUTO, JsonCodecBackend.MSGSPEC) \
+            and msgspec:
+        return MsgspecJsonCodec()
+    if backend not in (JsonCodecBackend.AUTO, JsonCodecBackend.STDLIB):
+        logger.warning(f'JSON codec {backend.value} is not installed, '
+                       f'falling back to stdlib json')
+    return StdlibJsonCodec()
+
+
+json_codec = get_json_codec()
@@ -0,0 +1,174 @@
+import zlib
+from abc import ABC, abstractmethod
+from typing import Any, Iterable, Tuple
+
+from starlette.websockets import WebSocket
+
+from app.core.config import settings
+
+from app.infrastructure.serialization.json_codec import json_codec, \
+    JsonDecodeError, encode_default
+from app.infrastructure.types.codec import WireFormat
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+MSGPACK_SUBPROTOCOL = 'msgpack'
+DEFLATE_JSON_SUBPROTOCOL = 'json+deflate'
+PER_MESSAGE_DEFLATE_EXTENSION = 'permessage-deflate'
+
+
+class WireDecodeError(ValueError):
+    pass
+
+
+class CompressionMetrics:
+    def __init__(self):
+        self.frames_compressed = 0
+        self.frames_raw = 0
+        self.bytes_before = 0
+        self.bytes_after = 0
+
+    @property
+    def bytes_saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    def record(self, size_before: int, size_after: int, compressed: bool):
+        if compressed:
+            self.frames_compressed += 1
+        else:
+            self.frames_raw += 1
+        self.bytes_before += size_before
+        self.bytes_after += size_after
+
+    def as_dict(self) -> dict:
+        return {
+            'frames_compressed': self.frames_compressed,
+            'frames_raw': self.frames_raw,
+            'bytes_before': self.bytes_before,
+            'bytes_after': self.bytes_after,
+            'bytes_saved': self.bytes_saved,
+        }
+
+    def __str__(self) -> str:
+        return (f'{self.frames_compressed} compressed / {self.frames_raw} '
+                f'raw frames, {self.bytes_saved} of {self.bytes_before} '
+                f'bytes saved')
+
+
+compression_metrics = CompressionMetrics()
+
+
+class WireProtocol(ABC):
+    wire_format: WireFormat
+    subprotocol: str | None = None
+
+    @abstractmethod
+    def encode(self, payload: Any) -> str | bytes: ...
+
+    @abstractmethod
+    def decode(self, data: str | bytes) -> Any: ...
+
+    @abstractmethod
+    async def receive(self, websocket: WebSocket) -> Any: ...
+
+    @abstractmethod
+    async def send(self, websocket: WebSocket, frame: str | bytes): ...
+
+
+class JsonWireProtocol(WireProtocol):
+    wire_format = WireFormat.JSON
+
+    def encode(self, payload: Any) -> str:
+        return json_codec.dumps(payload)
+
+    def decode(self, data: str | bytes) -> Any:
+        try:
+            return json_codec.loads(data)
+        except JsonDecodeError as e:
+            raise WireDecodeError(str(e)) from e
+
+    async def receive(self, websocket: WebSocket) -> Any:
+        return self.decode(await websocket.receive_text())
+
+    async def send(self, websocket: WebSocket, frame: str | bytes):
+        await websocket.send_text(frame)
+
+
+class MsgpackWireProtocol(WireProtocol):
+    wire_format = WireFormat.MSGPACK
+    subprotocol = MSGPACK_SUBPROTOCOL
+
+    def encode(self, payload: Any) -> bytes:
+        return msgpack.packb(payload, default=encode_default)
+
+    def decode(self, data: str | bytes) -> Any:
+        try:
+            return msgpack.unpackb(data)
+        except (ValueError, msgpack.UnpackException) as e:
+            raise WireDecodeError(str(e)) from e
+
+    async def receive(self, websocket: WebSocket) -> Any:
+        return self.decode(await websocket.receive_bytes())
+
+    async def send(self, websocket: WebSocket, frame: str | bytes):
+        await websocket.send_bytes(frame)
+
+
+class DeflateJsonWireProtocol(JsonWireProtocol):
+    subprotocol = DEFLATE_JSON_SUBPROTOCOL
+
+    def __init__(
+            self,
+            threshold: int = settings.WS_COMPRESSION_THRESHOLD_BYTES,
+            level: int = settings.WS_COMPRESSION_LEVEL,
+    ):
+        self.threshold = threshold
+        self.level = level
+
+    @property
+    def compression_key(self) -> Tuple[int, int]:
+        return self.threshold, self.level
+
+    def encode(self, payload: Any) -> str | bytes:
+        return self.compress(super().encode(payload))
+
+    def compress(self, frame: str) -> str | bytes:
+        data = frame.encode('utf-8')
+        if len(data) < self.threshold:
+            compression_metrics.record(len(data), len(data), False)
+            return frame
+
+        compressor = zlib.compressobj(
+            self.level, zlib.DEFLATED, -zlib.MAX_WBITS
+        )
+        compressed = compressor.compress(data) + compressor.flush()
+        compression_metrics.record(len(data), len(compressed), True)
+        return compressed
+
+    async def send(self, websocket: WebSocket, frame: str | bytes):
+        if isinstance(frame, bytes):
+            await websocket.send_bytes(frame)
+        else:
+            await websocket.send_text(frame)
+
+
+json_wire_protocol = JsonWireProtocol()
+
+
+def negotiate_wire_protocol(
+        subprotocols: Iterable[str],
+        extensions: str = '',
+) -> WireProtocol:
+    transport_compressed = settings.WS_PER_MESSAGE_DEFLATE \
+        and PER_MESSAGE_DEFLATE_EXTENSION in extensions
+    for subprotocol in subprotocols:
+        if subprotocol == MSGPACK_SUBPROTOCOL and msgpack:
+            return MsgpackWireProtocol()
+        if subprotocol == DEFLATE_JSON_SUBPROTOCOL \
+                and settings.WS_COMPRESSION_ENABLED \
+                and not transport_compressed:
+            return DeflateJsonWireProtocol()
+    return json_wire_protocol
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class JsonCodecBackend(str, Enum):
+    AUTO = 'auto'
+    ORJSON = 'orjson'
+    MSGSPEC = 'msgspec'
+    STDLIB = 'stdlib'
+
+
+class WireFormat(str, Enum):
+    JSON = 'json'
+    MSGPACK = 'msgpack'
@@ -10,10 +10,13 @@ class ClientToServerEvent(str, Enum):
     START_NEW_CHAT = 'start_new_chat'
     ADD_TO_CONTACTS = 'add_to_contacts'
     GET_CONTACTS = 'get_contacts'
+    GET_CHAT_OVERVIEW_LIST = 'get_chat_overview_list'
 
 
 class ServerToClientEvent(str, Enum):
     MESSAGE_SENT = 'message_sent'
+    MESSAGE_ACCEPTED = 'message_accepted'
+    MESSAGE_REJECTED = 'message_rejected'
     READ_STATUS_UPDATED = 'read_status_updated'
     UNDELIVERED_MESSAGES_SENT = 'undelivered_messages_sent'
     CHAT_OVERVIEW_LIST_SENT = 'chat_overview_list_sent'
@@ -24,3 +27,9 @@ class ServerToClientEvent(str, Enum):
     NEW_CHAT_SENT = 'new_chat_sent'
     ADDED_TO_CONTACTS = 'added_to_contacts'
     CONTACTS_SENT = 'contacts_sent'
+
+
+class DeliveryMode(str, Enum):
+    CHAT = 'chat'
+    USER = 'user'
+    NODE = 'node'
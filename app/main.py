@@ -20,7 +20,19 @@ from app.api.v1 import users
 from app.api.v1 import scheduled_messages
 from app.api.v1.ws import chat as chat_ws
 
-from app.infrastructure.cache.connection import get_redis_client
+from app.core.config import settings
+from app.infrastructure.cache.connection import get_redis_client, \
+    create_redis_pool
+from app.infrastructure.cache.json_serializer import JsonSerializer
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
+from app.infrastructure.message_queue.rabbitmq_client import RabbitMQClient
+from app.infrastructure.types.event import DeliveryMode
+from app.services.chat.chat_membership_cache import ChatMembershipCache
+from app.services.ws.presence_registry import PresenceRegistry
+from app.services.ws.redis_subscription_multiplexer import \
+    RedisSubscriptionMultiplexer
 
 import app.models as models  # noqa: F401
 from app.infrastructure.exceptions.exceptions import (
@@ -47,18 +59,61 @@ logger = logging.getLogger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Connecting to Redis...")
-    redis_client = await get_redis_client()
+    app.state.redis_pool = create_redis_pool()
+    redis_client = await get_redis_client(app.state.redis_pool)
     app.state.redis = redis_client
     await FastAPILimiter.init(app.state.redis)
 
+    app.state.redis_subscription_multiplexer = RedisSubscriptionMultiplexer(
+        app.state.redis
+    )
+    await app.state.redis_subscription_multiplexer.start()
+
+    app.state.cache = TwoLevelCache(
+        RedisCache(app.state.redis, JsonSerializer()),
+        RedisPubSub(app.state.redis),
+    )
+    await app.state.redis_subscription_multiplexer.subscribe(
+        [app.state.cache.channel],
+        app.state.cache.handle_invalidation
+    )
+    chat_membership_cache = ChatMembershipCache(app.state.redis)
+    await app.state.redis_subscription_multiplexer.subscribe(
+        [chat_membership_cache.channel],
+        chat_membership_cache.handle_invalidation
+    )
+
+    app.state.presence_registry = None
+    if settings.WS_DELIVERY_MODE == DeliveryMode.NODE:
+        app.state.presence_registry = PresenceRegistry(app.state.redis)
+        await app.state.presence_registry.start()
+        await app.state.redis_subscription_multiplexer.subscribe(
+            [app.state.presence_registry.inbox_channel],
+            app.state.redis_subscription_multiplexer.dispatch_to_recipients
+        )
+
+    logger.info("Connecting to RabbitMQ...")
+    app.state.mq_client = RabbitMQClient()
+    await app.state.mq_client.connect()
+
     yield
 
+    logger.info("Disconnecting from RabbitMQ...")
+    await app.state.mq_client.close()
+
+    if app.state.presence_registry:
+        logger.info("Stopping presence registry...")
+        await app.state.presence_registry.stop()
+
+    logger.info("Stopping Redis subscription multiplexer...")
+    await app.state.redis_subscription_multiplexer.stop()
+
     logger.info("Disconnecting from Redis...")
     if (
             hasattr(app.state, 'redis') and
             app.state.redis is not None
     ):
-        await app.state.redis.close()
+        await app.state.redis.aclose()
         logger.info("Disconnected from Redis")
 
 app = FastAPI(
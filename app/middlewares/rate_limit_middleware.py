@@ -4,14 +4,14 @@ from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.responses import JSONResponse
 from fastapi import Request
 
-from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
 
 WINDOW_SIZE = 60
 MAX_REQUESTS = 100
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
-        redis: RedisCache = getattr(request.app.state, 'redis', None)
+        redis: TwoLevelCache = getattr(request.app.state, 'cache', None)
         if redis is None:
             return JSONResponse(
                 content={'detail': 'cant connect to redis'},
@@ -23,10 +23,10 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
 
         key = f'rate_limit:{client_ip}:{now // WINDOW_SIZE}'
 
-        current_count = await redis.incr(key)
-
-        if current_count == 1:
-            await redis.expire(key, WINDOW_SIZE)
+        async with redis.pipeline() as pipe:
+            pipe.incr(key)
+            pipe.expire(key, WINDOW_SIZE, nx=True)
+            current_count, _ = await pipe.execute()
 
         if current_count > MAX_REQUESTS:
             return JSONResponse(
@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, Boolean, DateTime, func
+from sqlalchemy import Integer, Boolean, DateTime, func, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from app.db.base import Base
 from typing import TYPE_CHECKING
@@ -11,11 +11,20 @@ if TYPE_CHECKING:
 
 class Chat(Base):
     __tablename__ = 'chat'
+    __table_args__ = (
+        Index('ix_chat_last_activity_at', 'last_activity_at'),
+    )
     chat_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     is_group: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
+    last_message_id: Mapped[int | None] = mapped_column(
+        Integer, nullable=True, default=None
+    )
+    last_activity_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
 
     participants: Mapped[list["User"]] = relationship(
         "User",
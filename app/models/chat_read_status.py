@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Integer, ForeignKey, DateTime, func
+from sqlalchemy import Integer, ForeignKey, DateTime, func, Index
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.db.base import Base
@@ -8,6 +8,15 @@ from app.db.base import Base
 
 class ChatReadStatus(Base):
     __tablename__ = 'chat_read_status'
+    __table_args__ = (
+        Index(
+            'ix_chat_read_status_user_id_watermarks',
+            'user_id',
+            'chat_id',
+            'last_read_message_id',
+            'last_delivered_message_id',
+        ),
+    )
 
     last_read_message_id: Mapped[int] = mapped_column(
         Integer,
@@ -30,3 +39,12 @@ class ChatReadStatus(Base):
         nullable=True,
         server_onupdate=func.now()
     )
+    last_delivered_message_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=True,
+        default=None
+    )
+    delivered_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True
+    )
@@ -1,4 +1,4 @@
-from sqlalchemy import ForeignKey, Integer, Text, DateTime, func
+from sqlalchemy import ForeignKey, Integer, Text, DateTime, func, Index
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 from datetime import datetime
 from app.db.base import Base
@@ -6,6 +6,9 @@ from app.db.base import Base
 
 class Message(Base):
     __tablename__ = 'message'
+    __table_args__ = (
+        Index('ix_message_chat_id_message_id', 'chat_id', 'message_id'),
+    )
 
     message_id: Mapped[int] = mapped_column(Integer, primary_key=True)
     chat_id: Mapped[int] = mapped_column(
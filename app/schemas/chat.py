@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel
 
 from app.models import Chat
@@ -55,6 +57,7 @@ class ChatOverview(BaseModel):
     chat_name: str
     last_message: MessageInChatOverview | None
     unread_count: int
+    last_activity_at: datetime | None = None
 
 class ChatInfo(BaseModel):
     chat_id: int
@@ -1,12 +1,18 @@
-from typing import Literal, Union, List
+from datetime import datetime
+from typing import Literal, Union, List, Type, TypeVar, Dict, Hashable
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from app.core.config import settings
+from app.infrastructure.serialization.json_codec import json_codec
+from app.infrastructure.serialization.wire_protocol import WireProtocol, \
+    DeflateJsonWireProtocol
+from app.infrastructure.types.codec import WireFormat
 from app.infrastructure.types.event import ServerToClientEvent
 from app.schemas.chat import ChatOverview, ChatInfo
 from app.schemas.chat_read_status import ChatReadStatusRead
 from app.schemas.contact import ContactRead
-from app.schemas.message import MessageRead, ChatMessage
+from app.schemas.message import MessageRead, ChatMessage, MessageAck
 from app.schemas.search import SearchOut
 
 
@@ -14,9 +20,67 @@ class WebSocketEvent(BaseModel):
     event: str
     data: dict | None = None
 
+DTO = TypeVar('DTO', bound=BaseModel)
+
 class RedisEvent(BaseModel):
     event: str
     data: dict
+    recipient_ids: list[int] | None = None
+
+    _frame: str | None = PrivateAttr(default=None)
+    _encoded_frames: Dict[WireFormat, bytes] = PrivateAttr(
+        default_factory=dict
+    )
+    _compressed_frames: Dict[Hashable, str | bytes] = PrivateAttr(
+        default_factory=dict
+    )
+    _dtos: Dict[type, BaseModel] = PrivateAttr(default_factory=dict)
+
+    @classmethod
+    def from_raw(cls, raw_data: str) -> 'RedisEvent':
+        redis_event = cls(**json_codec.loads(raw_data))
+        if redis_event.recipient_ids is None:
+            redis_event._frame = raw_data
+        return redis_event
+
+    @property
+    def frame(self) -> str:
+        if self._frame is None:
+            self._frame = json_codec.dumps(
+                {'event': self.event, 'data': self.data}
+            )
+        return self._frame
+
+    def encode_for(self, wire_protocol: WireProtocol) -> str | bytes:
+        if isinstance(wire_protocol, DeflateJsonWireProtocol):
+            return self._compress_for(wire_protocol)
+        if wire_protocol.wire_format == WireFormat.JSON:
+            return self.frame
+
+        encoded = self._encoded_frames.get(wire_protocol.wire_format)
+        if encoded is None:
+            encoded = wire_protocol.encode(
+                {'event': self.event, 'data': self.data}
+            )
+            self._encoded_frames[wire_protocol.wire_format] = encoded
+        return encoded
+
+    def _compress_for(
+            self, wire_protocol: DeflateJsonWireProtocol
+    ) -> str | bytes:
+        compressed = self._compressed_frames.get(
+            wire_protocol.compression_key
+        )
+        if compressed is None:
+            compressed = wire_protocol.compress(self.frame)
+            self._compressed_frames[wire_protocol.compression_key] = compressed
+        return compressed
+
+    def get_dto(self, dto_class: Type[DTO]) -> DTO:
+        dto = self._dtos.get(dto_class)
+        if dto is None:
+            dto = self._dtos[dto_class] = dto_class(**self.data)
+        return dto
 
 class ReadStatusUpdatedEvent(BaseModel):
     event: Literal[ServerToClientEvent.READ_STATUS_UPDATED] = Field(
@@ -30,29 +94,61 @@ class MessageSentEvent(BaseModel):
     )
     data: ChatMessage
 
+class MessageAcceptedEvent(BaseModel):
+    event: Literal[ServerToClientEvent.MESSAGE_ACCEPTED] = Field(
+        default=ServerToClientEvent.MESSAGE_ACCEPTED,
+    )
+    data: MessageAck
+
+class MessageRejectedEvent(BaseModel):
+    event: Literal[ServerToClientEvent.MESSAGE_REJECTED] = Field(
+        default=ServerToClientEvent.MESSAGE_REJECTED,
+    )
+    data: MessageAck
+
 class UndeliveredMessagesSentEvent(BaseModel):
     event: Literal[ServerToClientEvent.UNDELIVERED_MESSAGES_SENT] = Field(
         default=ServerToClientEvent.UNDELIVERED_MESSAGES_SENT,
     )
     data: list[MessageRead]
+    has_more: bool = False
 
 class ChatOverviewListSentEvent(BaseModel):
     event: Literal[ServerToClientEvent.CHAT_OVERVIEW_LIST_SENT] = Field(
         default=ServerToClientEvent.CHAT_OVERVIEW_LIST_SENT,
     )
     data: list[ChatOverview]
+    has_more: bool = False
+
+class GetChatOverviewListEvent(BaseModel):
+    before_activity_at: datetime | None = None
+    before_chat_id: int | None = None
+    limit: int = Field(
+        default=settings.CHAT_OVERVIEW_PAGE_SIZE,
+        ge=1,
+        le=settings.CHAT_OVERVIEW_MAX_PAGE_SIZE,
+    )
 
 class GetChatInfoEvent(BaseModel):
     chat_id: int
 
 class GetChatMessagesEvent(BaseModel):
     chat_id: int
+    before_message_id: int | None = None
+    after_message_id: int | None = None
+    limit: int = Field(
+        default=settings.CHAT_MESSAGES_PAGE_SIZE,
+        ge=1,
+        le=settings.CHAT_MESSAGES_MAX_PAGE_SIZE,
+    )
 
 class ChatMessagesSentEvent(BaseModel):
     event: Literal[ServerToClientEvent.CHAT_MESSAGES_SENT] = Field(
         default=ServerToClientEvent.CHAT_MESSAGES_SENT,
     )
     data: List[ChatMessage]
+    chat_id: int | None = None
+    has_more: bool = False
 
 class ChatInfoSentEvent(BaseModel):
     event: Literal[ServerToClientEvent.CHAT_INFO_SENT] = Field(
@@ -93,6 +189,8 @@ class ContactsSentEvent(BaseModel):
 ServerEvent: type = Union[
     ReadStatusUpdatedEvent,
     MessageSentEvent,
+    MessageAcceptedEvent,
+    MessageRejectedEvent,
     UndeliveredMessagesSentEvent,
     ChatOverviewListSentEvent,
     ChatInfoSentEvent,
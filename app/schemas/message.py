@@ -28,6 +28,13 @@ class MessageCreate(MessageBase):
     chat_id: int
     content: str
     user_id: int | None = None
+    client_message_id: str | None = None
+
+
+class MessageAck(MessageBase):
+    chat_id: int
+    client_message_id: str | None = None
+    error: str | None = None
 
 
 class MessageUpdate(MessageBase):
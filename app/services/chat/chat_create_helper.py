@@ -1,5 +1,3 @@
-import json
-
 from app.infrastructure.cache.redis_pubsub import RedisPubSub
 from app.schemas.chat import ChatCreate, ChatOverview, ChatInfo
 from app.schemas.event import NewChatSentEvent
@@ -35,11 +33,9 @@ class ChatCreateHelper:
                 data=chat_overview_dict
             ).model_dump(mode='json')
 
-            event_json = json.dumps(redis_event)
-
-            await self.pubsub.publish(
+            await self.pubsub.publish_json(
                 f'user:{participant_id}',
-                event_json,
+                redis_event,
             )
 
         chat_info = await self.chat_info_service.construct_chat_info(
@@ -0,0 +1,151 @@
+from logging import getLogger
+from typing import Dict, Iterable, List
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.infrastructure.cache.local_ttl_cache import LocalTTLCache
+from app.infrastructure.serialization.json_codec import json_codec
+from app.schemas.event import RedisEvent
+
+logger = getLogger(__name__)
+
+CHAT_MEMBERSHIP_INVALIDATED_EVENT = 'chat_membership_invalidated'
+
+STORE_PARTICIPANT_IDS_SCRIPT = """
+local generation = tonumber(redis.call('GET', KEYS[2]) or '0')
+if generation ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('DEL', KEYS[1])
+redis.call('SADD', KEYS[1], unpack(ARGV, 3))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+local_membership_cache = LocalTTLCache(
+    max_size=settings.CHAT_MEMBERSHIP_LOCAL_CACHE_SIZE,
+    ttl=settings.CHAT_MEMBERSHIP_LOCAL_CACHE_TTL_SECONDS,
+)
+
+
+class ChatMembershipCache:
+    def __init__(
+            self,
+            redis: Redis,
+            ttl: int = settings.CHAT_MEMBERSHIP_CACHE_TTL_SECONDS,
+            local_cache: LocalTTLCache = local_membership_cache,
+            channel: str = settings.CACHE_INVALIDATION_CHANNEL,
+    ):
+        self._redis = redis
+        self._ttl = ttl
+        self._local_cache = local_cache
+        self.channel = channel
+        self._store_participant_ids = redis.register_script(
+            STORE_PARTICIPANT_IDS_SCRIPT
+        )
+
+    @staticmethod
+    def _key(chat_id: int) -> str:
+        return f'chat_members:{chat_id}'
+
+    @staticmethod
+    def _generation_key(chat_id: int) -> str:
+        return f'chat_members:{chat_id}:generation'
+
+    async def get_participant_ids(self, chat_id: int) -> List[int] | None:
+        participant_ids_map = await self.get_participant_ids_map([chat_id])
+        return participant_ids_map.get(chat_id)
+
+    async def get_participant_ids_map(
+            self, chat_ids: Iterable[int]
+    ) -> Dict[int, List[int]]:
+        participant_ids_map = {}
+        missing_chat_ids = []
+        for chat_id in chat_ids:
+            participant_ids = self._local_cache.get(chat_id)
+            if participant_ids is None:
+                missing_chat_ids.append(chat_id)
+            else:
+                participant_ids_map[chat_id] = participant_ids
+
+        if not missing_chat_ids:
+            return participant_ids_map
+
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for chat_id in missing_chat_ids:
+                    pipe.smembers(self._key(chat_id))
+                members = await pipe.execute()
+        except Exception as e:
+            logger.error(f'Failed to read chat membership cache: {e}')
+            return participant_ids_map
+
+        for chat_id, member_ids in zip(missing_chat_ids, members):
+            if not member_ids:
+                continue
+            participant_ids = [int(user_id) for user_id in member_ids]
+            self._local_cache.set(chat_id, participant_ids)
+            participant_ids_map[chat_id] = participant_ids
+        return participant_ids_map
+
+    async def get_generations(
+            self, chat_ids: Iterable[int]
+    ) -> Dict[int, int] | None:
+        chat_ids = list(chat_ids)
+        if not chat_ids:
+            return {}
+        try:
+            generations = await self._redis.mget(
+                [self._generation_key(chat_id) for chat_id in chat_ids]
+            )
+        except Exception as e:
+            logger.error(f'Failed to read chat membership generations: {e}')
+            return None
+        return {
+            chat_id: int(generation or 0)
+            for chat_id, generation in zip(chat_ids, generations)
+        }
+
+    async def store_participant_ids(
+            self, chat_id: int, participant_ids: List[int], generation: int
+    ) -> bool:
+        if not participant_ids:
+            return False
+
+        try:
+            stored = await self._store_participant_ids(
+                keys=[self._key(chat_id), self._generation_key(chat_id)],
+                args=[generation, self._ttl, *participant_ids],
+            )
+        except Exception as e:
+            logger.error(f'Failed to store chat membership cache: {e}')
+            return False
+
+        if not stored:
+            logger.debug(f'Skipped stale membership fill for chat {chat_id}')
+            return False
+        self._local_cache.set(chat_id, list(participant_ids))
+        return True
+
+    async def invalidate(self, chat_ids: Iterable[int]):
+        chat_ids = list(chat_ids)
+        if not chat_ids:
+            return
+
+        self._local_cache.delete_many(chat_ids)
+        async with self._redis.pipeline(transaction=True) as pipe:
+            for chat_id in chat_ids:
+                pipe.unlink(self._key(chat_id))
+                pipe.incr(self._generation_key(chat_id))
+                pipe.expire(self._generation_key(chat_id), self._ttl)
+            await pipe.execute()
+        await self._redis.publish(self.channel, json_codec.dumps({
+            'event': CHAT_MEMBERSHIP_INVALIDATED_EVENT,
+            'data': {'chat_ids': chat_ids},
+        }))
+
+    async def handle_invalidation(self, redis_event: RedisEvent):
+        if redis_event.event != CHAT_MEMBERSHIP_INVALIDATED_EVENT:
+            return
+        self._local_cache.delete_many(redis_event.data.get('chat_ids', []))
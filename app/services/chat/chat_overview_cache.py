@@ -0,0 +1,221 @@
+from datetime import datetime, timezone
+from logging import getLogger
+from typing import Iterable, List
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+from app.infrastructure.serialization.json_codec import json_codec
+from app.schemas.chat import ChatOverview
+from app.schemas.message import MessageInChatOverview
+
+logger = getLogger(__name__)
+
+APPLY_MESSAGE_SCRIPT = """
+redis.call('INCR', KEYS[5])
+redis.call('EXPIRE', KEYS[5], ARGV[5])
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    if redis.call('EXISTS', KEYS[1]) == 1 then
+        redis.call('DEL', KEYS[1], KEYS[2], KEYS[3], KEYS[4])
+    end
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+if tonumber(ARGV[4]) > 0 then
+    redis.call('HINCRBY', KEYS[3], ARGV[1], ARGV[4])
+end
+redis.call('ZADD', KEYS[4], ARGV[3], ARGV[1])
+for i = 1, 4 do
+    redis.call('EXPIRE', KEYS[i], ARGV[5])
+end
+return 1
+"""
+
+SET_UNREAD_COUNT_SCRIPT = """
+redis.call('INCR', KEYS[3])
+redis.call('EXPIRE', KEYS[3], ARGV[3])
+if redis.call('HEXISTS', KEYS[1], ARGV[1]) == 0 then
+    return 0
+end
+redis.call('HSET', KEYS[2], ARGV[1], ARGV[2])
+return 1
+"""
+
+STORE_OVERVIEW_LIST_SCRIPT = """
+local version = tonumber(redis.call('GET', KEYS[5]) or '0')
+if version ~= tonumber(ARGV[1]) then
+    return 0
+end
+redis.call('DEL', KEYS[1], KEYS[2], KEYS[3], KEYS[4])
+if #ARGV < 3 then
+    return 1
+end
+for i = 3, #ARGV, 5 do
+    local chat_id = ARGV[i]
+    redis.call('HSET', KEYS[1], chat_id, ARGV[i + 1])
+    redis.call('HSET', KEYS[3], chat_id, ARGV[i + 2])
+    redis.call('ZADD', KEYS[4], ARGV[i + 3], chat_id)
+    if ARGV[i + 4] ~= '' then
+        redis.call('HSET', KEYS[2], chat_id, ARGV[i + 4])
+    end
+end
+for i = 1, 4 do
+    redis.call('EXPIRE', KEYS[i], ARGV[2])
+end
+return 1
+"""
+
+
+def _timestamp(value: datetime) -> float:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.timestamp()
+
+
+def _activity_score(chat_overview: ChatOverview) -> float:
+    if chat_overview.last_activity_at:
+        return _timestamp(chat_overview.last_activity_at)
+    if chat_overview.last_message:
+        return _timestamp(chat_overview.last_message.sent_at)
+    return 0
+
+
+class ChatOverviewCache:
+    def __init__(
+            self,
+            redis: Redis,
+            ttl: int = settings.CHAT_OVERVIEW_CACHE_TTL_SECONDS,
+    ):
+        self._redis = redis
+        self._ttl = ttl
+        self._apply_message = redis.register_script(APPLY_MESSAGE_SCRIPT)
+        self._set_unread_count = redis.register_script(
+            SET_UNREAD_COUNT_SCRIPT
+        )
+        self._store_overview_list = redis.register_script(
+            STORE_OVERVIEW_LIST_SCRIPT
+        )
+
+    @staticmethod
+    def _keys(user_id: int) -> List[str]:
+        return [
+            f'chat_overview:{user_id}:names',
+            f'chat_overview:{user_id}:last_messages',
+            f'chat_overview:{user_id}:unread',
+            f'chat_overview:{user_id}:activity',
+        ]
+
+    @staticmethod
+    def _version_key(user_id: int) -> str:
+        return f'chat_overview:{user_id}:version'
+
+    async def get_version(self, user_id: int) -> int:
+        return int(await self._redis.get(self._version_key(user_id)) or 0)
+
+    async def get_overview_list(
+            self, user_id: int
+    ) -> List[ChatOverview] | None:
+        names_key, last_messages_key, unread_key, activity_key = (
+            self._keys(user_id)
+        )
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.hgetall(names_key)
+            pipe.hgetall(last_messages_key)
+            pipe.hgetall(unread_key)
+            pipe.zrevrange(activity_key, 0, -1, withscores=True)
+            names, last_messages, unread_counts, activity = (
+                await pipe.execute()
+            )
+
+        if not names:
+            return None
+
+        chat_overviews = []
+        for chat_id, score in activity:
+            if chat_id not in names:
+                continue
+            last_message = last_messages.get(chat_id)
+            chat_overviews.append(ChatOverview(
+                chat_id=int(chat_id),
+                chat_name=names[chat_id],
+                last_message=(
+                    MessageInChatOverview(**json_codec.loads(last_message))
+                    if last_message else None
+                ),
+                unread_count=int(unread_counts.get(chat_id, 0)),
+                last_activity_at=(
+                    datetime.fromtimestamp(score, timezone.utc)
+                    if score else None
+                ),
+            ))
+        return chat_overviews
+
+    async def store_overview_list(
+            self,
+            user_id: int,
+            chat_overviews: List[ChatOverview],
+            version: int,
+    ) -> bool:
+        args = [version, self._ttl]
+        for chat_overview in chat_overviews:
+            args.extend([
+                chat_overview.chat_id,
+                chat_overview.chat_name,
+                chat_overview.unread_count,
+                _activity_score(chat_overview),
+                chat_overview.last_message.model_dump_json()
+                if chat_overview.last_message else '',
+            ])
+        stored = await self._store_overview_list(
+            keys=[*self._keys(user_id), self._version_key(user_id)],
+            args=args,
+        )
+        if not stored:
+            logger.debug(f'Skipped stale chat overview rebuild for user '
+                         f'{user_id}')
+        return bool(stored)
+
+    async def apply_new_message(
+            self,
+            *,
+            chat_id: int,
+            sender_id: int,
+            participant_ids: Iterable[int],
+            last_message: MessageInChatOverview,
+    ):
+        payload = last_message.model_dump_json()
+        score = _timestamp(last_message.sent_at)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in set(participant_ids):
+                await self._apply_message(
+                    keys=[*self._keys(user_id), self._version_key(user_id)],
+                    args=[
+                        chat_id,
+                        payload,
+                        score,
+                        0 if user_id == sender_id else 1,
+                        self._ttl
+                    ],
+                    client=pipe,
+                )
+            await pipe.execute()
+
+    async def set_unread_count(
+            self, user_id: int, chat_id: int, unread_count: int
+    ):
+        names_key, _, unread_key, _ = self._keys(user_id)
+        await self._set_unread_count(
+            keys=[names_key, unread_key, self._version_key(user_id)],
+            args=[chat_id, unread_count, self._ttl],
+        )
+
+    async def invalidate(self, user_ids: Iterable[int]):
+        user_ids = set(user_ids)
+        if not user_ids:
+            return
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.unlink(*self._keys(user_id))
+                pipe.incr(self._version_key(user_id))
+                pipe.expire(self._version_key(user_id), self._ttl)
+            await pipe.execute()
@@ -1,3 +1,4 @@
+from datetime import datetime
 from typing import List, Dict, Any
 
 from app.db.repository.chat_repository import ChatRepository
@@ -22,6 +23,20 @@ class ChatQueryService:
             for chat, chat_name in data_raw
         ]
 
+    async def get_user_chat_ids(self, user_id: int) -> List[int]:
+        return list(await self.chat_repository.get_user_chat_ids(user_id))
+
+    async def get_chat_overviews_for_user(
+            self,
+            user_id: int,
+            limit: int | None = None,
+            before_activity_at: datetime | None = None,
+            before_chat_id: int | None = None,
+    ):
+        return await self.chat_repository.get_chat_overviews_for_user_raw(
+            user_id, limit, before_activity_at, before_chat_id
+        )
+
     async def get_chat_with_chat_participants(self, chat_id) -> Dict[str, Any]:
         data_raw = await (
             self.chat_repository.get_chat_with_chat_participants_raw(chat_id)
@@ -12,9 +12,14 @@ from app.infrastructure.exceptions.exceptions import (
     UsersNotFoundError,
     DatabaseError,
 )
-from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
 from app.models import User, Chat
 from app.schemas.chat import ChatCreate, ChatUpdate, ChatWithName
+from app.services.chat.chat_overview_cache import ChatOverviewCache
+
+
+def chat_cache_tag(chat_id: int) -> str:
+    return f'chat:{chat_id}'
 
 
 class ChatService:
@@ -24,19 +29,24 @@ class ChatService:
             chat_repository: ChatRepository,
             user_repository: UserRepository,
             chat_read_status_repository: ChatReadStatusRepository,
-            redis: RedisCache
+            redis: TwoLevelCache,
+            current_user_id: int | None = None,
+            chat_overview_cache: ChatOverviewCache | None = None,
     ):
         self.db: AsyncSession = db
         self.chat_repository = chat_repository
         self.user_repository = user_repository
         self.chat_read_status_repository = chat_read_status_repository
         self.redis = redis
+        self.current_user_id = current_user_id
+        self.chat_overview_cache = chat_overview_cache
 
     async def create_chat_in_db(
             self,
             chat_in: ChatCreate,
-            current_user_id: int
+            current_user_id: int | None = None
     ):
+        current_user_id = current_user_id or self.current_user_id
         self._validate_chat_input(chat_in, current_user_id)
 
         users_to_add = await self._get_and_validate_participants(
@@ -166,53 +176,63 @@ class ChatService:
             self,
             user_ids: list[int],
             chat_id: int,
+            last_message_id: int | None = None,
     ):
         chat_read_statuses = []
         for user_id in user_ids:
             chat_read_statuses.append(await self.chat_read_status_repository
-                                      .create_chat_read_status(chat_id, user_id
+                                      .create_chat_read_status(
+                                          chat_id, user_id, last_message_id
                                     ))
         self.db.add_all(chat_read_statuses)
 
     async def get_chat(
             self,
             chat_id: int,
-            current_user_id: int
+            current_user_id: int | None = None
     ) -> Chat:
-        redis_key = f'chat:{chat_id}:full'
+        current_user_id = current_user_id or self.current_user_id
+        if not await self.chat_repository.check_if_user_in_chat(
+            chat_id, current_user_id
+        ):
+            raise ChatValidationError('User not in chat')
 
-        cached_chat = await self.redis.get(redis_key)
-        if cached_chat:
-            return cached_chat
+        return await self.redis.get_or_load(
+            f'chat:{chat_id}:full',
+            lambda: self._load_chat(chat_id),
+            tags=[chat_cache_tag(chat_id)],
+            lock=True,
+        )
 
+    async def _load_chat(self, chat_id: int) -> Chat:
         existing_chat = await self.chat_repository.get_chat_with_relationships(
             chat_id
         )
         if not existing_chat:
             raise ChatValidationError('Chat not found')
-
-        if current_user_id not in [
-            p.user_id for p in existing_chat.participants
-        ]:
-            raise ChatValidationError('User not in chat')
-
-        await self.redis.set(redis_key, existing_chat)
         return existing_chat
 
     async def update_chat(
             self,
             chat_in: ChatUpdate,
     ) -> Chat:
-        redis_key = f'chat:{chat_in.chat_id}:*'
         existing_chat = await self._get_and_validate_chat_with_participants(
-            chat_in.chat_id
+            chat_in.chat_id, self.current_user_id
         )
         try:
             if chat_in.chat_name:
+                participant_ids = [
+                    participant.user_id
+                    for participant in existing_chat.participants
+                ]
                 existing_chat.name = chat_in.chat_name
                 await self.db.commit()
                 await self.db.refresh(existing_chat, attribute_names=['name'])
-                await self.redis.delete_pattern(redis_key)
+                await self.redis.invalidate_tags(
+                    [chat_cache_tag(chat_in.chat_id)]
+                )
+                if self.chat_overview_cache:
+                    await self.chat_overview_cache.invalidate(participant_ids)
                 return existing_chat
         except SQLAlchemyError as db_exc:
             await self.db.rollback()
@@ -224,17 +244,17 @@ class ChatService:
     async def _get_and_validate_chat_with_participants(
             self, chat_id: int, current_user_id: int
     ):
+        if not await self.chat_repository.check_if_user_in_chat(
+            chat_id, current_user_id
+        ):
+            raise ChatValidationError('User not in chat')
+
         existing_chat = await self.chat_repository.get_chat_with_users(
             chat_id
         )
         if not existing_chat:
             raise ChatValidationError('Chat not found')
 
-        if current_user_id not in [
-            p.user_id for p in existing_chat.participants
-        ]:
-            raise ChatValidationError('User not in chat')
-
         return existing_chat
 
     async def add_participants(
@@ -242,9 +262,8 @@ class ChatService:
             chat_id : int,
             participant_ids: list[int]
     ) -> Chat:
-        redis_key = f'chat:{chat_id}:*'
         existing_chat = await self._get_and_validate_chat_with_participants(
-            chat_id
+            chat_id, self.current_user_id
         )
         try:
             current_participant_ids = {
@@ -258,18 +277,26 @@ class ChatService:
                 await self.create_chat_read_statuses(
                     user_ids=new_participant_ids,
                     chat_id=existing_chat.chat_id,
+                    last_message_id=await (
+                        self.chat_read_status_repository
+                        .get_last_message_id(existing_chat.chat_id)
+                    ),
                 )
                 users_to_add_in_db = await self.user_repository.get_by_ids(
                     new_participant_ids
                 )
-                for user in users_to_add_in_db:
-                    existing_chat.participants.append(user)
+                await self.chat_repository.add_participants(
+                    existing_chat, users_to_add_in_db
+                )
 
                 await self.db.commit()
+                await self.chat_repository.invalidate_participants(
+                    [existing_chat.chat_id]
+                )
                 await self.db.refresh(
                     existing_chat, attribute_names=['participants']
                 )
-                await self.redis.delete_pattern(redis_key)
+                await self.redis.invalidate_tags([chat_cache_tag(chat_id)])
 
             return existing_chat
         except SQLAlchemyError as db_exc:
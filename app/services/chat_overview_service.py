@@ -1,69 +1,183 @@
-from datetime import datetime
-from typing import List
+from datetime import datetime, timezone
+from typing import List, Tuple
 
-from app.schemas.chat import ChatOverview, ChatWithName
+from app.core.config import settings
+from app.schemas.chat import ChatOverview
+from app.services.chat.chat_overview_cache import ChatOverviewCache
+from app.services.chat.chat_query_service import ChatQueryService
 from app.schemas.message import MessageInChatOverview
-from app.services.message.message_query_service import MessageQueryService
 from app.services.message_delivery_service import MessageDeliveryService
+from logging import getLogger
+
+logger = getLogger(__name__)
 
 
 class ChatOverviewService:
     def __init__(
             self,
             message_delivery_service: MessageDeliveryService,
-            message_query_service: MessageQueryService,
+            chat_query_service: ChatQueryService,
+            chat_overview_cache: ChatOverviewCache | None = None,
+            cache_max_chats: int = settings.CHAT_OVERVIEW_CACHE_MAX_CHATS,
     ):
         self.message_delivery_service = message_delivery_service
-        self.message_query_service = message_query_service
+        self.chat_query_service = chat_query_service
+        self.chat_overview_cache = chat_overview_cache
+        self.cache_max_chats = cache_max_chats
+
+    async def get_chat_overview_page(
+            self,
+            user_id: int,
+            *,
+            limit: int,
+            before_activity_at: datetime | None = None,
+            before_chat_id: int | None = None,
+            chat_ids: list[int] | None = None,
+    ) -> Tuple[List[ChatOverview], bool]:
+        if before_activity_at is not None:
+            before_activity_at = self._to_utc(before_activity_at)
+
+        if self.chat_overview_cache:
+            if chat_ids is None:
+                chat_ids = await self.chat_query_service.get_user_chat_ids(
+                    user_id
+                )
+            if len(chat_ids) <= self.cache_max_chats:
+                chat_overviews = await self.get_chat_overview_list(
+                    user_id, chat_ids
+                )
+                return self._paginate(
+                    chat_overviews, limit, before_activity_at, before_chat_id
+                )
+
+        chat_overviews = await self.build_chat_overview_list(
+            user_id,
+            limit + 1,
+            before_activity_at=before_activity_at,
+            before_chat_id=before_chat_id,
+        )
+        return chat_overviews[:limit], len(chat_overviews) > limit
 
     async def get_chat_overview_list(
             self,
             user_id: int,
-            chats: list[ChatWithName],
             chat_ids: list[int]
     ) -> List[ChatOverview]:
+        if not self.chat_overview_cache:
+            return await self.build_chat_overview_list(user_id)
 
-        unread_counts_map = await (
-            self.message_delivery_service.get_unread_counts_map(
-                user_id, chat_ids
+        try:
+            version = await self.chat_overview_cache.get_version(user_id)
+            cached_overviews = (
+                await self.chat_overview_cache.get_overview_list(user_id)
+            )
+        except Exception as e:
+            logger.error(f'Failed to read chat overview cache: {e}')
+            version = cached_overviews = None
+
+        if cached_overviews is not None and {
+            chat_overview.chat_id for chat_overview in cached_overviews
+        } == set(chat_ids):
+            return cached_overviews
+
+        chat_overviews = await self.build_chat_overview_list(user_id)
+        if version is None:
+            return chat_overviews
+        try:
+            await self.chat_overview_cache.store_overview_list(
+                user_id, chat_overviews, version
+            )
+        except Exception as e:
+            logger.error(f'Failed to store chat overview cache: {e}')
+        return chat_overviews
+
+    async def build_chat_overview_list(
+            self,
+            user_id: int,
+            limit: int | None = None,
+            *,
+            before_activity_at: datetime | None = None,
+            before_chat_id: int | None = None,
+    ) -> List[ChatOverview]:
+        chat_overview_rows = (
+            await self.chat_query_service.get_chat_overviews_for_user(
+                user_id, limit, before_activity_at, before_chat_id
             )
         )
 
-        last_messages_map = await (
-            self.message_query_service.get_last_messages_from_every_chat_map(
-                chat_ids
+        unread_counts_map = await (
+            self.message_delivery_service.get_unread_counts_map(
+                user_id, [row.chat_id for row in chat_overview_rows]
             )
         )
 
         chat_overviews = []
 
-        for chat_with_name in chats:
-            chat_name = chat_with_name.chat_name
-            chat_id = chat_with_name.chat.chat_id
-
-
-            message_data = last_messages_map.get(chat_id)
+        for (
+                chat_id, chat_name, last_activity_at, message, display_name
+        ) in chat_overview_rows:
             last_message = None
 
-            if message_data:
+            if message:
                 last_message = MessageInChatOverview(
-                    sent_at=message_data['message'].sent_at,
-                    content=message_data['message'].content,
-                    display_name=message_data['display_name']
+                    sent_at=message.sent_at,
+                    content=message.content,
+                    display_name=display_name
                 )
 
             chat_overviews.append(
                 ChatOverview(
                     chat_id=chat_id,
                     chat_name=chat_name,
-                    unread_count=unread_counts_map[chat_id],
+                    unread_count=unread_counts_map.get(chat_id, 0),
                     last_message=last_message,
+                    last_activity_at=last_activity_at,
                 )
             )
 
-        chat_overviews.sort(
-            key=lambda co: co.last_message.sent_at
-            if co.last_message else datetime.min,
-            reverse=True
-        )
         return chat_overviews
+
+    def _paginate(
+            self,
+            chat_overviews: List[ChatOverview],
+            limit: int,
+            before_activity_at: datetime | None,
+            before_chat_id: int | None,
+    ) -> Tuple[List[ChatOverview], bool]:
+        keyed_overviews = sorted(
+            (
+                (self._activity_key(chat_overview), chat_overview)
+                for chat_overview in chat_overviews
+            ),
+            key=lambda item: item[0],
+            reverse=True,
+        )
+
+        if before_activity_at is not None:
+            cursor = (before_activity_at.timestamp(), before_chat_id or 0)
+            keyed_overviews = [
+                (key, chat_overview)
+                for key, chat_overview in keyed_overviews
+                if key < cursor
+            ]
+
+        page = [
+            chat_overview for _, chat_overview in keyed_overviews[:limit]
+        ]
+        return page, len(keyed_overviews) > limit
+
+    def _activity_key(self, chat_overview: ChatOverview) -> Tuple[float, int]:
+        activity_at = chat_overview.last_activity_at or (
+            chat_overview.last_message.sent_at
+            if chat_overview.last_message else None
+        )
+        return (
+            self._to_utc(activity_at).timestamp() if activity_at else 0,
+            chat_overview.chat_id,
+        )
+
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        if value.tzinfo is None:
+            return value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc)
@@ -1,59 +1,85 @@
-from typing import List, Dict
+from typing import List, Tuple
 
 from app.models import Message, User
+from app.models.chat_read_status import ChatReadStatus
 from app.schemas.message import ChatMessage
 from app.services.message.message_query_service import MessageQueryService
+from app.services.message_delivery_service import MessageDeliveryService
 
 
 class ChatMessagesConstructor:
     def __init__(
             self,
-            message_query_service: MessageQueryService | None = None
+            message_query_service: MessageQueryService | None = None,
+            message_delivery_service: MessageDeliveryService | None = None,
     ):
         self.message_query_service = message_query_service
+        self.message_delivery_service = message_delivery_service
+
+    async def construct_chat_messages(
+            self,
+            chat_id: int,
+            user_id: int,
+            *,
+            limit: int,
+            before_message_id: int | None = None,
+            after_message_id: int | None = None,
+    ) -> Tuple[List[ChatMessage], bool]:
+        messages = await self.message_query_service.get_chat_messages(
+            chat_id,
+            limit=limit + 1,
+            before_message_id=before_message_id,
+            after_message_id=after_message_id,
+        )
+
+        has_more = len(messages) > limit
+        if has_more:
+            messages = (
+                messages[:limit] if after_message_id is not None
+                else messages[1:]
+            )
+
+        read_statuses = (
+            await self.message_delivery_service.get_chat_read_statuses(chat_id)
+        )
 
-    async def construct_chat_messages(self, chat_id, user_id):
-        messages = await self.message_query_service.get_chat_messages(chat_id)
         return [
-            ChatMessage(
-                message_id=message.message_id,
-                chat_id=chat_id,
-                user_id=message.user_id,
-                content=message.content,
-                is_read=any(
-                    delivery.is_read for delivery in message.deliveries
-                    if delivery.user_id != user_id
-                ),
-                read_at_list=[{delivery.user_id: delivery.read_at}
-                              for delivery in message.deliveries
-                              if delivery.user_id != user_id
-                              and delivery.read_at],
-                display_name=message.sender.display_name,
-                sent_at=message.sent_at
+            self._construct_chat_message(
+                message=message,
+                sender=message.sender,
+                read_statuses=read_statuses,
             ) for message in messages
-        ]
+        ], has_more
 
     async def construct_chat_message(
             self,
             message: Message,
-            deliveries: List[Dict],
             sender: User
     ):
+        return self._construct_chat_message(
+            message=message, sender=sender, read_statuses=[]
+        )
+
+    @staticmethod
+    def _construct_chat_message(
+            *,
+            message: Message,
+            sender: User,
+            read_statuses: List[ChatReadStatus],
+    ) -> ChatMessage:
+        read_at_list = [
+            {read_status.user_id: read_status.read_at}
+            for read_status in read_statuses
+            if read_status.user_id != message.user_id
+            and (read_status.last_read_message_id or 0) >= message.message_id
+        ]
         return ChatMessage(
             message_id=message.message_id,
             chat_id=message.chat_id,
             user_id=message.user_id,
             content=message.content,
-            is_read=any(
-                delivery['is_read'] for delivery in deliveries
-                if delivery['user_id'] != message.user_id
-            ),
-            read_at_list=[
-                {delivery['user_id']: delivery['read_at']}
-                for delivery in deliveries
-                if delivery['user_id'] != message.user_id
-                and delivery['read_at']
-            ],
+            is_read=bool(read_at_list),
+            read_at_list=read_at_list,
             display_name=sender.display_name,
             sent_at=message.sent_at
         )
@@ -0,0 +1,101 @@
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.repository.chat_repository import ChatRepository
+from app.db.repository.message_repository import MessageRepository
+from app.infrastructure.exceptions.exceptions import DatabaseError
+from app.models import Message
+from app.schemas.message import MessageCreate
+from app.services.message_delivery_service import MessageDeliveryService
+from logging import getLogger
+
+logger = getLogger(__name__)
+
+
+class MessageBatchService:
+    def __init__(
+            self,
+            db: AsyncSession,
+            *,
+            message_repository: MessageRepository,
+            chat_repository: ChatRepository,
+            message_delivery_service: MessageDeliveryService,
+    ):
+        self.db = db
+        self.message_repository = message_repository
+        self.chat_repository = chat_repository
+        self.message_delivery_service = message_delivery_service
+
+    async def create_messages(
+            self, messages_in: List[MessageCreate]
+    ) -> List[Tuple[Message, List[int]]]:
+        participant_ids_map = (
+            await self.chat_repository.get_participant_ids_map(
+                {message_in.chat_id for message_in in messages_in}
+            )
+        )
+
+        valid_messages_in = [
+            message_in for message_in in messages_in
+            if self._is_valid(message_in, participant_ids_map)
+        ]
+        if not valid_messages_in:
+            return []
+
+        current_time = datetime.now(timezone.utc)
+
+        try:
+            messages = await self.message_repository.create_messages_bulk([
+                {
+                    'content': message_in.content,
+                    'user_id': message_in.user_id,
+                    'chat_id': message_in.chat_id,
+                    'sent_at': current_time,
+                } for message_in in valid_messages_in
+            ])
+
+            await self.message_delivery_service.mark_messages_sent(
+                messages, current_time
+            )
+            await self.chat_repository.update_last_messages(
+                {message.chat_id: message.message_id for message in messages},
+                current_time
+            )
+
+            await self.db.commit()
+
+            return [
+                (message, participant_ids_map[message.chat_id])
+                for message in messages
+            ]
+        except SQLAlchemyError as db_exc:
+            await self.db.rollback()
+            raise DatabaseError(
+                "Failed to create message batch due to database issue"
+            ) from db_exc
+        except Exception as e:
+            await self.db.rollback()
+            raise e
+
+    def _is_valid(
+            self,
+            message_in: MessageCreate,
+            participant_ids_map: Dict[int, List[int]],
+    ) -> bool:
+        participant_ids = participant_ids_map.get(message_in.chat_id)
+        if not message_in.content:
+            logger.warning(f'Skipping empty message for chat '
+                           f'{message_in.chat_id}')
+            return False
+        if not participant_ids:
+            logger.warning(f'Skipping message for wrong chat '
+                           f'{message_in.chat_id}')
+            return False
+        if message_in.user_id not in participant_ids:
+            logger.warning(f'Skipping message of user {message_in.user_id} '
+                           f'not in chat {message_in.chat_id}')
+            return False
+        return True
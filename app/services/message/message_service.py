@@ -1,5 +1,5 @@
 from datetime import datetime, timezone
-from typing import Dict, List
+from typing import List
 
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -31,21 +31,15 @@ class MessageService:
         self.message_delivery_service = message_delivery_service
 
     async def create_message(self, message_in: MessageCreate) \
-            -> (Message, List[Dict]):
+            -> (Message, List[int]):
         if not message_in.content:
             raise MessageValidationError('The message is empty')
 
-        existing_chat = await self.chat_repository.get_chat_with_users(
+        chat_participant_ids = await self.chat_repository.get_participant_ids(
             message_in.chat_id
         )
-        if not existing_chat:
-            raise MessageValidationError('Wrong chat')
-
-        chat_participant_ids = [
-            user.user_id for user in existing_chat.participants
-        ]
         if not chat_participant_ids:
-            raise MessageValidationError('No participants in chat')
+            raise MessageValidationError('Wrong chat')
 
         if self.current_user_id not in chat_participant_ids:
             raise MessageValidationError('User not in chat')
@@ -54,39 +48,23 @@ class MessageService:
             message = await self.message_repository.create_message(
                 content=message_in.content,
                 user_id=self.current_user_id,
-                chat_id=existing_chat.chat_id,
+                chat_id=message_in.chat_id,
             )
 
             await self.db.flush()
 
-            deliveries = []
-
             current_time = datetime.now(timezone.utc)
-
-            for user_id in chat_participant_ids:
-                is_sender = user_id == self.current_user_id
-
-                delivery_data = {
-                    'user_id': user_id,
-                    'chat_id': existing_chat.chat_id,
-                    'message_id': message.message_id,
-                    'is_delivered': True if is_sender else False,
-                    'is_read': True if is_sender else False,
-                    'delivered_at': current_time if is_sender else None,
-                    'read_at': current_time if is_sender else None,
-                }
-                deliveries.append(delivery_data)
-
-            logger.info(f'deliveries: {deliveries}')
-
-            await self.message_delivery_service.create_message_deliveries_bulk(
-                deliveries=deliveries
+            await self.message_delivery_service.mark_messages_sent(
+                [message], current_time
+            )
+            await self.chat_repository.update_last_messages(
+                {message_in.chat_id: message.message_id}, current_time
             )
 
             await self.db.commit()
             await self.db.refresh(message)
 
-            return message, deliveries
+            return message, chat_participant_ids
 
         except SQLAlchemyError as db_exc:
             await self.db.rollback()
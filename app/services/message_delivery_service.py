@@ -3,68 +3,85 @@ from typing import List, Dict
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.repository.message_delivery_repository import \
-    MessageDeliveryRepository
+from app.db.repository.chat_read_status_repository import \
+    ChatReadStatusRepository
+from app.models import Message
+from app.models.chat_read_status import ChatReadStatus
 
 
 class MessageDeliveryService:
     def __init__(
             self,
             db: AsyncSession,
-            message_delivery_repository: MessageDeliveryRepository,
+            chat_read_status_repository: ChatReadStatusRepository,
     ):
         self.db = db
-        self.message_delivery_repository = message_delivery_repository
+        self.chat_read_status_repository = chat_read_status_repository
 
-    async def create_message_delivery(self, user_id: int, message_id, chat_id):
-        await self.message_delivery_repository.create_message_delivery(
-            user_id=user_id, message_id=message_id, chat_id=chat_id
-        )
-
-    async def create_message_deliveries_bulk(
-            self, deliveries: List[Dict]
+    async def mark_messages_sent(
+            self, messages: List[Message], current_time: datetime
     ):
-        await self.message_delivery_repository.create_message_deliveries_bulk(
-            deliveries=deliveries
+        await self.chat_read_status_repository.mark_as_sent(
+            [
+                {
+                    'chat_id': message.chat_id,
+                    'user_id': message.user_id,
+                    'message_id': message.message_id,
+                } for message in messages
+            ],
+            current_time
         )
 
-    async def mark_messages_delivered(self, user_id):
-        deliveries = await (
-            self.message_delivery_repository.
-                get_undelivered_messages_with_content(user_id=user_id)
+    async def get_undelivered_messages(
+            self,
+            user_id: int,
+            *,
+            limit: int | None = None,
+            after_message_id: int | None = None,
+    ) -> List[Message]:
+        return await self.chat_read_status_repository.get_undelivered_messages(
+            user_id, limit=limit, after_message_id=after_message_id
         )
-        if not deliveries:
-            return []
 
-        for delivery in deliveries:
-            delivery.is_delivered = True
-            delivery.delivered_at = datetime.now(timezone.utc)
+    async def mark_messages_delivered(
+            self, user_id: int, messages: List[Message]
+    ):
+        if not messages:
+            return
 
-        await self.db.commit()
+        delivered_message_ids: Dict[int, int] = {}
+        for message in messages:
+            delivered_message_ids[message.chat_id] = max(
+                message.message_id,
+                delivered_message_ids.get(message.chat_id, 0)
+            )
 
-        return [delivery.message for delivery in deliveries]
+        await self.chat_read_status_repository.mark_as_delivered(
+            user_id, delivered_message_ids, datetime.now(timezone.utc)
+        )
+        await self.db.commit()
 
     async def read_messages(
             self, chat_id: int, user_id: int, last_read_message_id: int
-    ):
-        unread_messages = await (
-            self.message_delivery_repository.get_unread_messages(
-                chat_id=chat_id, user_id=user_id
-            )
+    ) -> datetime | None:
+        read_at = datetime.now(timezone.utc)
+        is_updated = await self.chat_read_status_repository.mark_as_read(
+            chat_id, user_id, last_read_message_id, read_at
         )
+        return read_at if is_updated else None
 
-        for unread_message in unread_messages:
-            if unread_message.message_id <= last_read_message_id:
-                unread_message.is_read = True
-                unread_message.read_at = datetime.now(timezone.utc)
-
-        await self.db.commit()
+    async def get_chat_read_statuses(
+            self, chat_id: int
+    ) -> List[ChatReadStatus]:
+        return await self.chat_read_status_repository.get_chat_read_statuses(
+            chat_id
+        )
 
     async def get_unread_counts_map(
             self, user_id: int, chat_ids: list[int]
     ) -> dict[int, int]:
         raw_results = await (
-            self.message_delivery_repository
+            self.chat_read_status_repository
             .get_unread_counts(user_id, chat_ids)
         )
 
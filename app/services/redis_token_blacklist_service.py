@@ -1,14 +1,14 @@
 from time import time
 
-from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
 
 
 class RedisTokenBlacklistService:
     def __init__(
             self,
-            redis: RedisCache
+            redis: TwoLevelCache
     ):
-        self.redis: RedisCache = redis
+        self.redis: TwoLevelCache = redis
         self.blacklist_prefix = "blacklisted_tokens:"
 
     async def add_to_blacklist(
@@ -21,12 +21,13 @@ class RedisTokenBlacklistService:
         if original_expiration_timestamp > current_time:
             ttl = original_expiration_timestamp - current_time
             await self.redis.setex(
-                key=f"{self.blacklist_prefix}{token_identifier}",
+                key=self.get_key(token_identifier),
                 ttl=ttl,
                 value='invalidated'
             )
 
     async def is_blacklisted(self, token_identifier: str) -> bool:
-        return await self.redis.exists(
-            f"{self.blacklist_prefix}{token_identifier}"
-        )
+        return await self.redis.exists(self.get_key(token_identifier))
+
+    def get_key(self, token_identifier: str) -> str:
+        return f"{self.blacklist_prefix}{token_identifier}"
@@ -5,6 +5,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.db.repository.chat_repository import ChatRepository
 from app.db.repository.scheduled_message_repository import \
     ScheduledMessageRepository
+from app.infrastructure.message_queue.rabbitmq_client import RabbitMQClient
 from app.infrastructure.exceptions.exceptions import ScheduledInPastError, MessagingConnectionError, \
     InvalidMessageDataError, MessagePublishError, ChatValidationError, \
     ScheduledMessageValidationError
@@ -19,11 +20,13 @@ class ScheduledMessageService:
             *,
             scheduled_message_repository: ScheduledMessageRepository,
             chat_repository: ChatRepository,
+            mq_client: RabbitMQClient,
             current_user_id: int,
     ):
         self.db = db
         self.scheduled_message_repository = scheduled_message_repository
         self.chat_repository = chat_repository
+        self.mq_client = mq_client
         self.current_user_id = current_user_id
 
     async def schedule_new_message(
@@ -112,7 +115,9 @@ class ScheduledMessageService:
             'created_at': now.isoformat(),
         }
         try:
-            await publish_delayed(message_payload, delay_seconds)
+            await self.mq_client.publish_delayed(
+                message_payload, delay_seconds
+            )
         except MessagingConnectionError:
             raise
         except InvalidMessageDataError:
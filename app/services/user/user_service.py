@@ -118,10 +118,11 @@ class UserService:
 
     async def soft_delete_user(self) -> User:
         try:
-            delete_stmt = await (
-                self.chat_repository.delete_user_from_group_chats(self.current_user.user_id)
+            group_chat_ids = await (
+                self.chat_repository.delete_user_from_group_chats(
+                    self.current_user.user_id
+                )
             )
-            await self.db.execute(delete_stmt)
 
             await self.refresh_token_repository.revoke_tokens_by_user_id(
                 self.current_user.user_id
@@ -130,6 +131,7 @@ class UserService:
             await self.user_repository.soft_delete_user(self.current_user)
 
             await self.db.commit()
+            await self.chat_repository.invalidate_participants(group_chat_ids)
             await self.db.refresh(self.current_user)
 
             return self.current_user
@@ -0,0 +1,77 @@
+from logging import getLogger
+from typing import Iterable
+
+from app.core.config import settings
+from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.infrastructure.serialization.json_codec import json_codec
+from app.infrastructure.types.event import DeliveryMode, ServerToClientEvent
+from app.services.ws.presence_registry import PresenceRegistry
+
+logger = getLogger(__name__)
+
+
+class ChatEventPublisher:
+    def __init__(
+            self,
+            pubsub: RedisPubSub,
+            delivery_mode: DeliveryMode = settings.WS_DELIVERY_MODE,
+            presence_registry: PresenceRegistry | None = None,
+    ):
+        if delivery_mode == DeliveryMode.NODE and presence_registry is None:
+            raise ValueError('Node delivery mode requires a presence registry')
+
+        self.pubsub = pubsub
+        self.delivery_mode = delivery_mode
+        self.presence_registry = presence_registry
+
+    async def publish_chat_event(
+            self,
+            chat_id: int,
+            recipient_ids: Iterable[int],
+            event: ServerToClientEvent,
+            data: dict,
+    ):
+        if self.delivery_mode == DeliveryMode.NODE:
+            channel_count = await self._publish_to_nodes(
+                recipient_ids, event, data
+            )
+        elif self.delivery_mode == DeliveryMode.USER:
+            channels = [f'user:{user_id}' for user_id in set(recipient_ids)]
+            await self.pubsub.publish_many(
+                channels, json_codec.dumps({'event': event, 'data': data})
+            )
+            channel_count = len(channels)
+        else:
+            await self.pubsub.publish(
+                f'chat:{chat_id}',
+                json_codec.dumps({'event': event, 'data': data}),
+            )
+            channel_count = 1
+
+        logger.info(f'published {event.value} of chat {chat_id} '
+                    f'to {channel_count} channel(s)')
+
+    async def _publish_to_nodes(
+            self,
+            recipient_ids: Iterable[int],
+            event: ServerToClientEvent,
+            data: dict,
+    ) -> int:
+        users_by_node = await self.presence_registry.get_user_nodes(
+            recipient_ids
+        )
+        if not users_by_node:
+            return 0
+
+        await self.pubsub.publish_batch(
+            (
+                f'node:{node_id}',
+                json_codec.dumps({
+                    'event': event,
+                    'data': data,
+                    'recipient_ids': user_ids
+                })
+            )
+            for node_id, user_ids in users_by_node.items()
+        )
+        return len(users_by_node)
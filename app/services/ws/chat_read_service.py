@@ -1,14 +1,18 @@
-import json
-
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.repository.chat_read_status_repository import \
     ChatReadStatusRepository
-from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.db.repository.chat_repository import ChatRepository
 from app.infrastructure.exceptions.websocket import WebSocketException
+from app.infrastructure.types.event import ServerToClientEvent
 from app.schemas.chat_read_status import ChatReadStatusUpdate, \
     ChatReadStatusRead
+from app.services.chat.chat_overview_cache import ChatOverviewCache
 from app.services.message_delivery_service import MessageDeliveryService
+from app.services.ws.chat_event_publisher import ChatEventPublisher
+from logging import getLogger
+
+logger = getLogger(__name__)
 
 
 class ChatReadService:
@@ -16,13 +20,17 @@ class ChatReadService:
             self,
             db: AsyncSession,
             chat_read_status_repository: ChatReadStatusRepository,
+            chat_repository: ChatRepository,
             message_delivery_service: MessageDeliveryService,
-            pubsub: RedisPubSub
+            chat_event_publisher: ChatEventPublisher,
+            chat_overview_cache: ChatOverviewCache | None = None,
     ):
         self.db = db
         self.chat_read_status_repository = chat_read_status_repository
+        self.chat_repository = chat_repository
         self.message_delivery_service = message_delivery_service
-        self.pubsub = pubsub
+        self.chat_overview_cache = chat_overview_cache
+        self.chat_event_publisher = chat_event_publisher
 
     async def update_read_status(
             self,
@@ -30,37 +38,51 @@ class ChatReadService:
             data_in: ChatReadStatusUpdate
     ):
         chat_id = data_in.chat_id
-        last_read_message = await (
-            self.chat_read_status_repository.get_last_read_message(
-                chat_id, user_id
-            )
-        )
-        if not last_read_message:
-            raise WebSocketException('No last read message')
-        if last_read_message.last_read_message_id >= data_in.message_id:
-            raise WebSocketException('already read')
-
-        last_read_message = await (self.chat_read_status_repository
-        .mark_as_read(
-            last_read_message, data_in.message_id
-        ))
-        await self.db.flush()
-
-        await self.message_delivery_service.read_messages(
+        read_at = await self.message_delivery_service.read_messages(
             chat_id=chat_id,
             user_id=user_id,
-            last_read_message_id=last_read_message.last_read_message_id
+            last_read_message_id=data_in.message_id
         )
+        if not read_at:
+            if not await (
+                self.chat_read_status_repository.get_last_read_message(
+                    chat_id, user_id
+                )
+            ):
+                raise WebSocketException('No last read message')
+            raise WebSocketException('already read')
 
         await self.db.commit()
 
+        if self.chat_overview_cache:
+            await self.update_cached_unread_count(user_id, chat_id)
+
         data_out = ChatReadStatusRead(
             chat_id=chat_id,
             user_id=user_id,
-            last_read_message_id=last_read_message.last_read_message_id,
-            read_at=last_read_message.read_at
+            last_read_message_id=data_in.message_id,
+            read_at=read_at
         ).model_dump(mode='json')
-        await self.pubsub.publish(
-            f'chat:{chat_id}',
-            json.dumps({'event': 'read_status_updated', 'data': data_out})
+
+        participant_ids = await self.chat_repository.get_participant_ids(
+            chat_id
+        )
+        await self.chat_event_publisher.publish_chat_event(
+            chat_id=chat_id,
+            recipient_ids=participant_ids,
+            event=ServerToClientEvent.READ_STATUS_UPDATED,
+            data=data_out
         )
+
+    async def update_cached_unread_count(self, user_id: int, chat_id: int):
+        try:
+            unread_counts_map = (
+                await self.message_delivery_service.get_unread_counts_map(
+                    user_id, [chat_id]
+                )
+            )
+            await self.chat_overview_cache.set_unread_count(
+                user_id, chat_id, unread_counts_map.get(chat_id, 0)
+            )
+        except Exception as e:
+            logger.error(f'Failed to update cached unread count: {e}')
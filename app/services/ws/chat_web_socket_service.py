@@ -1,20 +1,23 @@
-from typing import List
+from typing import List, Tuple
 
 from starlette.websockets import WebSocket
 
 from logging import getLogger
 
+from app.core.config import settings
 from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.infrastructure.serialization.wire_protocol import WireProtocol, \
+    json_wire_protocol
 from app.infrastructure.types.event import ServerToClientEvent, \
     ClientToServerEvent
 from app.models import Message
-from app.schemas.chat import ChatOverview, ChatWithName, ChatCreate, \
-    StartNewChatIn
+from app.schemas.chat import ChatOverview, ChatCreate, StartNewChatIn
 from app.schemas.chat_read_status import ChatReadStatusRead, \
     ChatReadStatusUpdate
 from app.schemas.contact import ContactCreate
 from app.schemas.event import UndeliveredMessagesSentEvent, \
-    ChatOverviewListSentEvent, GetChatInfoEvent, GetChatMessagesEvent
+    ChatOverviewListSentEvent, GetChatInfoEvent, GetChatMessagesEvent, \
+    GetChatOverviewListEvent
 from app.schemas.message import MessageRead, MessageCreate, ChatMessage
 from app.schemas.search import SearchIn
 from app.services.chat.chat_create_helper import ChatCreateHelper
@@ -59,10 +62,11 @@ class ChatWebSocketService:
             search_service: SearchService,
             redis_event_dispatcher: ChatRedisEventDispatcher,
             chat_create_helper: ChatCreateHelper,
-            contact_service: ContactService
+            contact_service: ContactService,
+            wire_protocol: WireProtocol = json_wire_protocol,
     ):
         self.websocket = websocket
-        self.event_sender = EventSender(websocket)
+        self.event_sender = EventSender(websocket, wire_protocol)
         self.redis_subscription_service = redis_subscription_service
         self.message_handler = message_handler
         self.message_delivery_service = message_delivery_service
@@ -76,6 +80,7 @@ class ChatWebSocketService:
         self.websocket_event_handler = WebSocketEventHandler(
             message_handler=self.message_handler,
             chat_message_constructor = chat_message_constructor,
+            chat_overview_service=chat_overview_service,
             chat_read_service=chat_read_service,
             chat_info_service=self.chat_info_service,
             event_sender=self.event_sender,
@@ -91,25 +96,17 @@ class ChatWebSocketService:
         )
 
     async def start(self, user_id: int):
+        self.event_sender.start()
         await self.register_handlers()
 
-        chats_with_names = await self.chat_query_service.get_chats_for_user(
-            user_id
-        )
-        chat_ids = [chat.chat.chat_id for chat in chats_with_names]
-
-        await self.handle_reconnect(user_id, chats_with_names, chat_ids)
+        chat_ids = await self.chat_query_service.get_user_chat_ids(user_id)
 
-        await self.redis_subscription_service.subscribe_to_every_chat(
+        await self.redis_subscription_service.subscribe_for_user(
             user_id,
             chat_ids,
         )
-        current_user_channel = f'user:{user_id}'
-        await (
-            self.redis_subscription_service.subscribe_to_channel(
-                current_user_channel, user_id
-            )
-        )
+
+        await self.handle_reconnect(user_id, chat_ids)
 
     async def register_handlers(self):
         await self.redis_dispatcher.register(
@@ -173,53 +170,85 @@ class ChatWebSocketService:
             event=ClientToServerEvent.GET_CONTACTS,
             handler=self.websocket_event_handler.handle_get_contacts
         )
+        await self.websocket_dispatcher.register(
+            event=ClientToServerEvent.GET_CHAT_OVERVIEW_LIST,
+            dto_class=GetChatOverviewListEvent,
+            handler=(
+                self.websocket_event_handler.handle_get_chat_overview_list
+            )
+        )
+
+    async def handle_reconnect(self, user_id: int, chat_ids: list[int]):
+        await self.stream_undelivered_messages(user_id)
+
+        chat_overview_list, has_more = await (
+            self.prepare_chat_overview_list_on_reconnect(user_id, chat_ids)
+        )
 
+        await self.send_chat_overview_list(chat_overview_list, has_more)
 
-    async def handle_reconnect(
-            self, user_id: int, chats: list[ChatWithName], chat_ids: list[int]
+    async def stream_undelivered_messages(
+            self,
+            user_id: int,
+            chunk_size: int = settings.UNDELIVERED_MESSAGES_CHUNK_SIZE,
     ):
-        undelivered_messages = await (
-            self.message_delivery_service
-            .mark_messages_delivered(user_id)
+        after_message_id = None
+        while True:
+            messages = await (
+                self.message_delivery_service.get_undelivered_messages(
+                    user_id,
+                    limit=chunk_size + 1,
+                    after_message_id=after_message_id,
+                )
             )
-        if undelivered_messages:
-            await self.send_undelivered_messages(undelivered_messages)
+            if not messages:
+                return
 
-        chat_overview_list = await (
-            self.prepare_chat_overview_list_on_reconnect(
-                user_id, chats, chat_ids
-            )
-        )
+            has_more = len(messages) > chunk_size
+            messages = messages[:chunk_size]
 
-        print('chat_overview_list: ', chat_overview_list)
+            await self.send_undelivered_messages(messages, has_more)
+            await self.message_delivery_service.mark_messages_delivered(
+                user_id, messages
+            )
 
-        await self.send_chat_overview_list(chat_overview_list)
+            if not has_more:
+                return
+            after_message_id = messages[-1].message_id
 
-    async def send_undelivered_messages(self, messages: list[Message]):
+    async def send_undelivered_messages(
+            self, messages: list[Message], has_more: bool
+    ):
         message_schemas = [
             MessageRead.model_validate(message)
             for message in messages
         ]
 
-        event = UndeliveredMessagesSentEvent(data=message_schemas)
+        event = UndeliveredMessagesSentEvent(
+            data=message_schemas, has_more=has_more
+        )
 
-        await self.event_sender.send_event(event)
+        await self.event_sender.send_event(event, wait=True)
 
     async def send_chat_overview_list(
-            self, chat_overview_list: list[ChatOverview]
+            self, chat_overview_list: list[ChatOverview], has_more: bool
     ):
-        event = ChatOverviewListSentEvent(data=chat_overview_list)
+        event = ChatOverviewListSentEvent(
+            data=chat_overview_list, has_more=has_more
+        )
 
         await self.event_sender.send_event(event)
 
     async def prepare_chat_overview_list_on_reconnect(
-            self, user_id: int, chats: list[ChatWithName], chat_ids: list[int]
-    ) -> List[ChatOverview]:
-        return await (
-            self.chat_overview_service.get_chat_overview_list(
-                user_id, chats, chat_ids
-            )
+            self, user_id: int, chat_ids: list[int]
+    ) -> Tuple[List[ChatOverview], bool]:
+        return await self.chat_overview_service.get_chat_overview_page(
+            user_id,
+            limit=settings.CHAT_OVERVIEW_PAGE_SIZE,
+            chat_ids=chat_ids,
         )
 
     async def stop(self):
+        await self.websocket_event_handler.stop()
         await self.redis_subscription_service.cleanup()
+        await self.event_sender.close()
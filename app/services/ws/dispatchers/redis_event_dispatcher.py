@@ -4,11 +4,8 @@ from app.schemas.event import RedisEvent
 
 class ChatRedisEventDispatcher(BaseEventDispatcher):
     async def dispatch(self, redis_event: RedisEvent):
-        event = redis_event.event
-        data: dict = redis_event.data
+        config = await self._get_config(redis_event.event)
 
-        config = await self._get_config(event)
+        dto = redis_event.get_dto(config.dto_class)
 
-        dto = config.dto_class(**data)
-
-        await config.handler(dto)
+        await config.handler(dto, redis_event)
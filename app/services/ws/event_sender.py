@@ -1,18 +1,93 @@
-from typing import List
+import asyncio
+import time
+from collections import deque
+from logging import getLogger
+from typing import Deque, Dict, Hashable, List, Tuple
 
-from starlette.websockets import WebSocket
+from starlette.websockets import WebSocket, WebSocketState
 
+from app.core.config import settings
+from app.infrastructure.serialization.wire_protocol import WireProtocol, \
+    json_wire_protocol
+from app.infrastructure.types.event import ServerToClientEvent
 from app.models import Message
-from app.schemas.event import ServerEvent
+from app.schemas.chat_read_status import ChatReadStatusRead
+from app.schemas.event import ServerEvent, RedisEvent
 from app.schemas.message import MessageRead
 
+logger = getLogger(__name__)
+
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+class _OutboundItem:
+    __slots__ = ('payload', 'coalesce_key', 'sent')
+
+    def __init__(
+            self,
+            payload: dict | str | bytes,
+            coalesce_key: Hashable | None,
+            sent: asyncio.Future | None,
+    ):
+        self.payload = payload
+        self.coalesce_key = coalesce_key
+        self.sent = sent
+
 
 class EventSender:
-    def __init__(self, websocket: WebSocket):
+    def __init__(
+            self,
+            websocket: WebSocket,
+            wire_protocol: WireProtocol = json_wire_protocol,
+            max_queue_size: int = settings.WS_OUTBOUND_QUEUE_SIZE,
+            high_water_mark: int = settings.WS_OUTBOUND_HIGH_WATER_MARK,
+            slow_consumer_timeout: float =
+            settings.WS_SLOW_CONSUMER_TIMEOUT_SECONDS,
+    ):
         self.websocket = websocket
+        self.wire_protocol = wire_protocol
+        self.max_queue_size = max_queue_size
+        self.high_water_mark = high_water_mark
+        self.slow_consumer_timeout = slow_consumer_timeout
+        self._queue: Deque[_OutboundItem] = deque()
+        self._pending: Dict[Hashable, _OutboundItem] = {}
+        self._has_items = asyncio.Event()
+        self._writer: asyncio.Task | None = None
+        self._evictor: asyncio.Task | None = None
+        self._over_high_water_since: float | None = None
+        self._high_water_timer: asyncio.TimerHandle | None = None
+        self._closed = False
+
+    @property
+    def queue_size(self) -> int:
+        return len(self._queue)
+
+    def start(self):
+        if self._writer is None:
+            self._writer = asyncio.create_task(self._write())
 
-    async def send_event(self, event: ServerEvent):
-        await self.websocket.send_json(event.model_dump(mode='json'))
+    async def close(self):
+        self._closed = True
+        self._reset_high_water()
+        if self._writer:
+            self._writer.cancel()
+            await asyncio.gather(self._writer, return_exceptions=True)
+            self._writer = None
+        self._fail_pending()
+
+    async def send_event(self, event: ServerEvent, wait: bool = False):
+        await self._enqueue(
+            event.model_dump(mode='json'), self._coalesce_key(event), wait
+        )
+
+    async def send_redis_event(
+            self,
+            redis_event: RedisEvent,
+            coalesce_key: Hashable | None = None,
+    ):
+        await self._enqueue(
+            redis_event.encode_for(self.wire_protocol), coalesce_key
+        )
 
     async def send_bulk_messages(self, messages: List[Message]):
         message_schemas = [
@@ -20,7 +95,152 @@ class EventSender:
             for message in messages
         ]
 
-        await self.websocket.send_json({
+        await self._enqueue({
             'event': 'bulk_messages',
             'messages': [m.model_dump(mode='json') for m in message_schemas]
         })
+
+    async def _enqueue(
+            self,
+            payload: dict | str | bytes,
+            coalesce_key: Hashable | None = None,
+            wait: bool = False,
+    ):
+        if self._closed:
+            if wait:
+                raise ConnectionError('WebSocket outbound queue is closed')
+            return
+
+        if self._writer is None:
+            await self._send(payload)
+            return
+
+        pending_item = self._pending.get(coalesce_key)
+        if pending_item is not None and not wait:
+            pending_item.payload = payload
+            return
+
+        sent = asyncio.get_running_loop().create_future() if wait else None
+        item = _OutboundItem(payload, coalesce_key, sent)
+        self._queue.append(item)
+        if coalesce_key is not None:
+            self._pending[coalesce_key] = item
+        self._has_items.set()
+
+        if self._is_slow_consumer():
+            self._start_eviction()
+
+        if sent is not None:
+            await sent
+
+    @staticmethod
+    def read_status_coalesce_key(
+            read_status: ChatReadStatusRead
+    ) -> Tuple[str, int, int]:
+        return (
+            ServerToClientEvent.READ_STATUS_UPDATED,
+            read_status.chat_id,
+            read_status.user_id,
+        )
+
+    def _coalesce_key(self, event: ServerEvent) -> Hashable | None:
+        if event.event == ServerToClientEvent.READ_STATUS_UPDATED:
+            return self.read_status_coalesce_key(event.data)
+        return None
+
+    async def _send(self, payload: dict | str | bytes):
+        if isinstance(payload, dict):
+            payload = self.wire_protocol.encode(payload)
+        await self.wire_protocol.send(self.websocket, payload)
+
+    def _is_slow_consumer(self) -> bool:
+        queue_size = len(self._queue)
+        if queue_size >= self.max_queue_size:
+            return True
+
+        if queue_size <= self.high_water_mark:
+            self._reset_high_water()
+            return False
+
+        now = time.monotonic()
+        if self._over_high_water_since is None:
+            self._over_high_water_since = now
+        over_high_water_for = now - self._over_high_water_since
+        if over_high_water_for >= self.slow_consumer_timeout:
+            return True
+        if self._high_water_timer is None:
+            self._high_water_timer = asyncio.get_running_loop().call_later(
+                self.slow_consumer_timeout - over_high_water_for,
+                self._on_high_water_timeout
+            )
+        return False
+
+    def _reset_high_water(self):
+        self._over_high_water_since = None
+        if self._high_water_timer is not None:
+            self._high_water_timer.cancel()
+            self._high_water_timer = None
+
+    def _on_high_water_timeout(self):
+        self._high_water_timer = None
+        if not self._closed and self._is_slow_consumer():
+            self._start_eviction()
+
+    def _start_eviction(self):
+        if self._evictor is not None:
+            return
+        self._closed = True
+        self._evictor = asyncio.create_task(self._evict())
+
+    async def _evict(self):
+        logger.warning(f'Evicting slow websocket consumer with '
+                       f'{len(self._queue)} queued events')
+        await self.close()
+        if self.websocket.application_state != WebSocketState.DISCONNECTED:
+            try:
+                await self.websocket.close(
+                    code=SLOW_CONSUMER_CLOSE_CODE,
+                    reason='Client is too slow'
+                )
+            except RuntimeError:
+                pass
+
+    async def _write(self):
+        while True:
+            await self._has_items.wait()
+            while self._queue:
+                item = self._queue.popleft()
+                if self._pending.get(item.coalesce_key) is item:
+                    del self._pending[item.coalesce_key]
+                try:
+                    await self._send(item.payload)
+                except asyncio.CancelledError:
+                    if item.sent is not None and not item.sent.done():
+                        item.sent.set_exception(
+                            ConnectionError('WebSocket outbound queue is '
+                                            'closed')
+                        )
+                    raise
+                except Exception as e:
+                    logger.info(f'Websocket writer stopped: {e}')
+                    self._closed = True
+                    if item.sent is not None and not item.sent.done():
+                        item.sent.set_exception(e)
+                    self._fail_pending(e)
+                    return
+
+                if item.sent is not None and not item.sent.done():
+                    item.sent.set_result(None)
+                if len(self._queue) <= self.high_water_mark:
+                    self._reset_high_water()
+            self._has_items.clear()
+
+    def _fail_pending(self, error: Exception | None = None):
+        while self._queue:
+            item = self._queue.popleft()
+            if item.sent is not None and not item.sent.done():
+                item.sent.set_exception(
+                    error or ConnectionError('WebSocket outbound queue is '
+                                             'closed')
+                )
+        self._pending.clear()
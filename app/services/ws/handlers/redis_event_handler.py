@@ -2,8 +2,7 @@ from starlette.websockets import WebSocket
 
 from app.schemas.chat import ChatOverview
 from app.schemas.chat_read_status import ChatReadStatusRead
-from app.schemas.event import ReadStatusUpdatedEvent, MessageSentEvent, \
-    NewChatSentEvent
+from app.schemas.event import RedisEvent
 from app.schemas.message import ChatMessage
 from app.services.ws.event_sender import \
     EventSender
@@ -23,22 +22,26 @@ class RedisEventHandler:
         self.redis_subscription_service = redis_subscription_service
 
 
-    async def handle_message_sent(self, message_out: ChatMessage):
-        event = MessageSentEvent(data=message_out)
-
-        await self.event_sender.send_event(event)
+    async def handle_message_sent(
+            self, message_out: ChatMessage, redis_event: RedisEvent
+    ):
+        await self.event_sender.send_redis_event(redis_event)
 
     async def handle_read_status_updated(
-            self, chat_read_status_out: ChatReadStatusRead
+            self,
+            chat_read_status_out: ChatReadStatusRead,
+            redis_event: RedisEvent
     ):
-        event = ReadStatusUpdatedEvent(data=chat_read_status_out)
-        await self.event_sender.send_event(event)
-
-    async def handle_new_chat_sent(self, new_chat_sent_out=ChatOverview):
-        await self.redis_subscription_service.subscribe_to_channel(
-            f'chat:{new_chat_sent_out.chat_id}'
+        await self.event_sender.send_redis_event(
+            redis_event,
+            EventSender.read_status_coalesce_key(chat_read_status_out)
         )
 
-        event = NewChatSentEvent(data=new_chat_sent_out)
+    async def handle_new_chat_sent(
+            self, new_chat_sent_out: ChatOverview, redis_event: RedisEvent
+    ):
+        await self.redis_subscription_service.subscribe_to_new_chat(
+            new_chat_sent_out.chat_id
+        )
 
-        await self.event_sender.send_event(event)
+        await self.event_sender.send_redis_event(redis_event)
@@ -1,14 +1,20 @@
+import asyncio
+from typing import Set
+
 from app.infrastructure.cache.redis_pubsub import RedisPubSub
 from app.schemas.chat import ChatCreate, StartNewChatIn
 from app.schemas.chat_read_status import ChatReadStatusUpdate
 from app.schemas.contact import ContactCreate
 from app.schemas.event import GetChatInfoEvent, ChatInfoSentEvent, \
     GetChatMessagesEvent, ChatMessagesSentEvent, ChatCreatedEvent, \
-    SearchResultSentEvent, AddedToContactsEvent, ContactsSentEvent
-from app.schemas.message import MessageCreate
+    SearchResultSentEvent, AddedToContactsEvent, ContactsSentEvent, \
+    GetChatOverviewListEvent, ChatOverviewListSentEvent, \
+    MessageAcceptedEvent, MessageRejectedEvent
+from app.schemas.message import MessageCreate, MessageAck
 from app.schemas.search import SearchIn
 from app.services.chat.chat_create_helper import ChatCreateHelper
 from app.services.chat.chat_info_service import ChatInfoService
+from app.services.chat_overview_service import ChatOverviewService
 from app.services.contact.contact_service import ContactService
 from app.services.message.chat_messages_constructor import \
     ChatMessagesConstructor
@@ -16,7 +22,9 @@ from app.services.search.search_service import SearchService
 from app.services.ws.chat_read_service import ChatReadService
 from app.services.ws.event_sender import EventSender
 from app.services.ws.message_web_socket_handler import MessageWebSocketHandler
+from logging import getLogger
 
+logger = getLogger(__name__)
 
 
 class WebSocketEventHandler:
@@ -24,6 +32,7 @@ class WebSocketEventHandler:
             self,
             message_handler: MessageWebSocketHandler,
             chat_message_constructor: ChatMessagesConstructor,
+            chat_overview_service: ChatOverviewService,
             chat_read_service: ChatReadService,
             chat_info_service: ChatInfoService,
             event_sender: EventSender,
@@ -34,6 +43,7 @@ class WebSocketEventHandler:
     ):
         self.message_handler = message_handler
         self.chat_message_constructor = chat_message_constructor
+        self.chat_overview_service = chat_overview_service
         self.chat_read_service = chat_read_service
         self.chat_info_service = chat_info_service
         self.event_sender = event_sender
@@ -41,11 +51,49 @@ class WebSocketEventHandler:
         self.pubsub = pubsub
         self.chat_create_helper = chat_create_helper
         self.contact_service = contact_service
+        self._confirmations: Set[asyncio.Task] = set()
 
     async def handle_new_message(
             self, message_in: MessageCreate, user_id: int,
     ):
-        await self.message_handler.send_to_mq(user_id, message_in)
+        confirmation = await self.message_handler.send_to_mq(
+            user_id, message_in
+        )
+        task = asyncio.create_task(
+            self._report_confirmation(confirmation, message_in, user_id)
+        )
+        self._confirmations.add(task)
+        task.add_done_callback(self._confirmations.discard)
+
+    async def _report_confirmation(
+            self,
+            confirmation: asyncio.Future,
+            message_in: MessageCreate,
+            user_id: int,
+    ):
+        ack = MessageAck(
+            chat_id=message_in.chat_id,
+            client_message_id=message_in.client_message_id,
+        )
+        try:
+            await confirmation
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f'Message of user {user_id} was not accepted by '
+                         f'the broker: {e}')
+            ack.error = 'Message was not accepted, please retry'
+            await self.event_sender.send_event(MessageRejectedEvent(data=ack))
+            return
+
+        await self.event_sender.send_event(MessageAcceptedEvent(data=ack))
+
+    async def stop(self):
+        confirmations = list(self._confirmations)
+        for task in confirmations:
+            task.cancel()
+        await asyncio.gather(*confirmations, return_exceptions=True)
+        self._confirmations.clear()
 
     async def handle_read_message(
             self, data_in: ChatReadStatusUpdate, user_id: int
@@ -66,11 +114,37 @@ class WebSocketEventHandler:
     async def handle_get_chat_messages(
             self, data_in: GetChatMessagesEvent, user_id: int
     ):
-        messages = await self.chat_message_constructor.construct_chat_messages(
-            data_in.chat_id, user_id
+        messages, has_more = (
+            await self.chat_message_constructor.construct_chat_messages(
+                data_in.chat_id,
+                user_id,
+                limit=data_in.limit,
+                before_message_id=data_in.before_message_id,
+                after_message_id=data_in.after_message_id,
+            )
         )
 
-        event = ChatMessagesSentEvent(data=messages)
+        event = ChatMessagesSentEvent(
+            data=messages, chat_id=data_in.chat_id, has_more=has_more
+        )
+
+        await self.event_sender.send_event(event)
+
+    async def handle_get_chat_overview_list(
+            self, data_in: GetChatOverviewListEvent, user_id: int
+    ):
+        chat_overviews, has_more = (
+            await self.chat_overview_service.get_chat_overview_page(
+                user_id,
+                limit=data_in.limit,
+                before_activity_at=data_in.before_activity_at,
+                before_chat_id=data_in.before_chat_id,
+            )
+        )
+
+        event = ChatOverviewListSentEvent(
+            data=chat_overviews, has_more=has_more
+        )
 
         await self.event_sender.send_event(event)
 
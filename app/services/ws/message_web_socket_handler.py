@@ -1,3 +1,5 @@
+import asyncio
+
 from app.infrastructure.message_queue.rabbitmq_client import RabbitMQClient
 
 
@@ -5,10 +7,10 @@ class MessageWebSocketHandler:
     def __init__(self, mq_client: RabbitMQClient):
         self.mq_client = mq_client
 
-    async def send_to_mq(self, user_id, message_in):
+    async def send_to_mq(self, user_id, message_in) -> asyncio.Future:
         data = {
             "user_id": user_id,
             "chat_id": message_in.chat_id,
             "content": message_in.content,
         }
-        await self.mq_client.publish(data)
+        return await self.mq_client.publish_confirmed(data)
@@ -0,0 +1,131 @@
+import asyncio
+import os
+import socket
+from collections import defaultdict
+from logging import getLogger
+from typing import Dict, Iterable, List
+
+from redis.asyncio import Redis
+
+from app.core.config import settings
+
+logger = getLogger(__name__)
+
+
+def get_node_id() -> str:
+    return settings.NODE_ID or f'{socket.gethostname()}:{os.getpid()}'
+
+
+class PresenceRegistry:
+    def __init__(
+            self,
+            redis: Redis,
+            node_id: str | None = None,
+            ttl: int = settings.PRESENCE_TTL_SECONDS,
+            heartbeat_interval: int = settings.PRESENCE_HEARTBEAT_SECONDS,
+    ):
+        self._redis = redis
+        self.node_id = node_id or get_node_id()
+        self._ttl = ttl
+        self._heartbeat_interval = heartbeat_interval
+        self._local_connections: Dict[int, int] = defaultdict(int)
+        self._heartbeat: asyncio.Task | None = None
+
+    @property
+    def inbox_channel(self) -> str:
+        return f'node:{self.node_id}'
+
+    @staticmethod
+    def _user_key(user_id: int) -> str:
+        return f'presence:user:{user_id}'
+
+    @staticmethod
+    def _node_key(node_id: str) -> str:
+        return f'presence:node:{node_id}'
+
+    async def start(self):
+        await self._redis.set(
+            self._node_key(self.node_id), 1, ex=self._ttl
+        )
+        self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+        logger.info(f'Presence registry started for node {self.node_id}')
+
+    async def stop(self):
+        if self._heartbeat:
+            self._heartbeat.cancel()
+            await asyncio.gather(self._heartbeat, return_exceptions=True)
+            self._heartbeat = None
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in self._local_connections:
+                pipe.srem(self._user_key(user_id), self.node_id)
+            pipe.delete(self._node_key(self.node_id))
+            await pipe.execute()
+        self._local_connections.clear()
+        logger.info(f'Presence registry stopped for node {self.node_id}')
+
+    async def register(self, user_id: int):
+        self._local_connections[user_id] += 1
+        if self._local_connections[user_id] > 1:
+            return
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.sadd(self._user_key(user_id), self.node_id)
+            pipe.expire(self._user_key(user_id), self._ttl)
+            await pipe.execute()
+
+    async def unregister(self, user_id: int):
+        if user_id not in self._local_connections:
+            return
+
+        self._local_connections[user_id] -= 1
+        if self._local_connections[user_id] > 0:
+            return
+
+        del self._local_connections[user_id]
+        await self._redis.srem(self._user_key(user_id), self.node_id)
+
+    async def get_user_nodes(
+            self, user_ids: Iterable[int]
+    ) -> Dict[str, List[int]]:
+        user_ids = list(set(user_ids))
+        if not user_ids:
+            return {}
+
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.smembers(self._user_key(user_id))
+            node_sets = await pipe.execute()
+
+        users_by_node: Dict[str, List[int]] = defaultdict(list)
+        for user_id, node_ids in zip(user_ids, node_sets):
+            for node_id in node_ids:
+                users_by_node[node_id].append(user_id)
+
+        if not users_by_node:
+            return {}
+
+        node_ids = list(users_by_node)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for node_id in node_ids:
+                pipe.exists(self._node_key(node_id))
+            alive_flags = await pipe.execute()
+
+        return {
+            node_id: users_by_node[node_id]
+            for node_id, is_alive in zip(node_ids, alive_flags)
+            if is_alive
+        }
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self._heartbeat_interval)
+            try:
+                async with self._redis.pipeline(transaction=False) as pipe:
+                    pipe.set(self._node_key(self.node_id), 1, ex=self._ttl)
+                    for user_id in list(self._local_connections):
+                        pipe.sadd(self._user_key(user_id), self.node_id)
+                        pipe.expire(self._user_key(user_id), self._ttl)
+                    await pipe.execute()
+            except Exception as e:
+                logger.error(f'Presence heartbeat failed: {e}', exc_info=e)
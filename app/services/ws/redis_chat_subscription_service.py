@@ -1,15 +1,12 @@
-import asyncio
-import json
-from typing import List, Dict, Callable, Awaitable
-
-from redis.asyncio.client import PubSub
-
-from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from typing import Callable, Awaitable, Set
 
 from logging import getLogger
 
-from app.infrastructure.exceptions.websocket import WebSocketException
+from app.core.config import settings
+from app.infrastructure.types.event import DeliveryMode
 from app.schemas.event import RedisEvent
+from app.services.ws.redis_subscription_multiplexer import \
+    RedisSubscriptionMultiplexer
 
 logger = getLogger(__name__)
 
@@ -17,56 +14,63 @@ logger = getLogger(__name__)
 class RedisChatSubscriptionService:
     def __init__(
             self,
-            pubsub: RedisPubSub,
-            dispatch: Callable[[RedisEvent], Awaitable[None]]
+            multiplexer: RedisSubscriptionMultiplexer,
+            dispatch: Callable[[RedisEvent], Awaitable[None]],
+            delivery_mode: DeliveryMode = settings.WS_DELIVERY_MODE,
     ):
-        self.tasks: List[asyncio.Task] = []
-        self.pubsubs: Dict[str, PubSub] = {}
-        self.pubsub = pubsub
+        self.channels: Set[str] = set()
+        self.multiplexer = multiplexer
         self.dispatch = dispatch
+        self.delivery_mode = delivery_mode
+
+    async def subscribe_for_user(self, user_id: int, chat_ids: list[int]):
+        channels = [f'user:{user_id}']
+        if self.delivery_mode == DeliveryMode.CHAT:
+            channels.extend(f'chat:{chat_id}' for chat_id in chat_ids)
+
+        await self.subscribe_to_channels(channels, user_id)
+
+    async def subscribe_to_new_chat(self, chat_id: int):
+        if self.delivery_mode == DeliveryMode.CHAT:
+            await self.subscribe_to_channel(f'chat:{chat_id}')
 
     async def subscribe_to_every_chat(
             self,
             user_id,
             chat_ids,
     ):
-        for chat_id in chat_ids:
-            channel = f'chat:{chat_id}'
-            await self.subscribe_to_channel(channel, user_id)
+        channels = [f'chat:{chat_id}' for chat_id in chat_ids]
+        await self.subscribe_to_channels(channels, user_id)
 
     async def subscribe_to_channel(
             self, channel: str, user_id: int | None = None
     ):
-        pubsub = await self.pubsub.subscribe(channel)
-        task = asyncio.create_task(self.listen_to_channel(
-            pubsub
-        ))
-        self.tasks.append(task)
-        self.pubsubs[channel] = pubsub
+        await self.subscribe_to_channels([channel], user_id)
 
-        logger.info(f'User {user_id} subscribed to channel {channel}')
+    async def subscribe_to_channels(
+            self, channels: list[str], user_id: int | None = None
+    ):
+        new_channels = [
+            channel for channel in channels if channel not in self.channels
+        ]
+        if not new_channels:
+            return
 
-    async def listen_to_channel(self, pubsub: PubSub):
-        try:
-            async for message in pubsub.listen():
-                if message['type'] == 'message':
-                    logger.info(f'Redis Pubsub got a message {message}')
-                    data = json.loads(message['data'])
+        await self.multiplexer.subscribe(new_channels, self.dispatch)
+        self.channels.update(new_channels)
 
-                    redis_event = RedisEvent(**data)
-                    await self.dispatch(redis_event)
-        except Exception as e:
-            logger.exception(f'Error in listen_to_channel {e}')
-            raise WebSocketException('error listening to channel')
+        logger.info(f'User {user_id} subscribed to channels {new_channels}')
+
+    async def unsubscribe_from_channel(self, channel: str):
+        if channel not in self.channels:
+            return
 
+        await self.multiplexer.unsubscribe([channel], self.dispatch)
+        self.channels.discard(channel)
 
     async def cleanup(self):
         try:
-            for channel, pubsub in self.pubsubs.items():
-                await pubsub.unsubscribe(channel)
-                await pubsub.close()
-            self.pubsubs.clear()
-            for task in self.tasks:
-                task.cancel()
+            await self.multiplexer.unsubscribe(self.channels, self.dispatch)
+            self.channels.clear()
         except Exception as e:
             logger.error(f'error cleaning up: {e}', exc_info=e)
@@ -0,0 +1,145 @@
+import asyncio
+from logging import getLogger
+from typing import Awaitable, Callable, Dict, Iterable, List, Set
+
+from redis.asyncio import Redis
+from redis.asyncio.client import PubSub
+
+from app.schemas.event import RedisEvent
+
+logger = getLogger(__name__)
+
+RedisEventCallback = Callable[[RedisEvent], Awaitable[None]]
+
+
+class RedisSubscriptionMultiplexer:
+    def __init__(
+            self,
+            redis: Redis,
+            poll_timeout: float = 1.0,
+            error_backoff: float = 1.0,
+    ):
+        self._redis = redis
+        self._poll_timeout = poll_timeout
+        self._error_backoff = error_backoff
+        self._pubsub: PubSub | None = None
+        self._listener: asyncio.Task | None = None
+        self._running = False
+        self._subscribers: Dict[str, Set[RedisEventCallback]] = {}
+        self._lock = asyncio.Lock()
+
+    async def start(self):
+        if self._listener:
+            return
+        self._pubsub = self._redis.pubsub()
+        self._running = True
+        self._listener = asyncio.create_task(self._listen())
+        logger.info('Redis subscription multiplexer started')
+
+    async def stop(self):
+        self._running = False
+        if self._listener:
+            self._listener.cancel()
+            await asyncio.gather(self._listener, return_exceptions=True)
+            self._listener = None
+        if self._pubsub:
+            await self._pubsub.aclose()
+            self._pubsub = None
+        self._subscribers.clear()
+        logger.info('Redis subscription multiplexer stopped')
+
+    async def subscribe(
+            self, channels: Iterable[str], callback: RedisEventCallback
+    ):
+        async with self._lock:
+            new_channels = []
+            for channel in channels:
+                subscribers = self._subscribers.setdefault(channel, set())
+                if not subscribers:
+                    new_channels.append(channel)
+                subscribers.add(callback)
+
+            if new_channels:
+                await self._pubsub.subscribe(*new_channels)
+                logger.debug(f'Subscribed to channels {new_channels}')
+
+    async def unsubscribe(
+            self, channels: Iterable[str], callback: RedisEventCallback
+    ):
+        async with self._lock:
+            stale_channels = []
+            for channel in channels:
+                subscribers = self._subscribers.get(channel)
+                if subscribers is None:
+                    continue
+                subscribers.discard(callback)
+                if not subscribers:
+                    del self._subscribers[channel]
+                    stale_channels.append(channel)
+
+            if stale_channels and self._pubsub:
+                await self._pubsub.unsubscribe(*stale_channels)
+                logger.debug(f'Unsubscribed from channels {stale_channels}')
+
+    def subscriber_count(self, channel: str) -> int:
+        return len(self._subscribers.get(channel, ()))
+
+    async def _listen(self):
+        while self._running:
+            try:
+                if not self._pubsub.subscribed:
+                    await asyncio.sleep(self._poll_timeout)
+                    continue
+
+                message = await self._pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=self._poll_timeout
+                )
+                if message and message['type'] == 'message':
+                    await self._fan_out(message['channel'], message['data'])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f'Error in redis multiplexer listener: {e}')
+                await asyncio.sleep(self._error_backoff)
+
+    async def dispatch_to_recipients(self, redis_event: RedisEvent):
+        callbacks: Set[RedisEventCallback] = set()
+        for user_id in redis_event.recipient_ids or ():
+            callbacks.update(self._subscribers.get(f'user:{user_id}', ()))
+
+        await self._dispatch(callbacks, redis_event, 'node inbox')
+
+    async def _fan_out(self, channel: str, raw_data: str):
+        callbacks = self._subscribers.get(channel)
+        if not callbacks:
+            return
+
+        try:
+            redis_event = RedisEvent.from_raw(raw_data)
+        except Exception as e:
+            logger.error(f'Invalid redis event on channel {channel}: {e}')
+            return
+
+        await self._dispatch(callbacks, redis_event, channel)
+
+    async def _dispatch(
+            self,
+            callbacks: Iterable[RedisEventCallback],
+            redis_event: RedisEvent,
+            source: str
+    ):
+        callbacks: List[RedisEventCallback] = list(callbacks)
+        if not callbacks:
+            return
+
+        results = await asyncio.gather(
+            *(callback(redis_event) for callback in callbacks),
+            return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    f'Error dispatching event from {source}: {result}',
+                    exc_info=result
+                )
@@ -5,18 +5,19 @@ from app.db.repository.chat_read_status_repository import \
     ChatReadStatusRepository
 from app.db.repository.chat_repository import ChatRepository
 from app.db.repository.contact_repository import ContactRepository
-from app.db.repository.message_delivery_repository import \
-    MessageDeliveryRepository
 from app.db.repository.message_repository import MessageRepository
 from app.db.repository.user_repository import UserRepository
 from app.infrastructure.cache.json_serializer import JsonSerializer
 from app.infrastructure.cache.redis_cache import RedisCache
 from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.infrastructure.cache.two_level_cache import TwoLevelCache
 from app.infrastructure.message_queue.rabbitmq_client import RabbitMQClient
-from app.models import User, Chat, MessageDelivery, Message, Contact
+from app.models import User, Chat, Message, Contact
 from app.models.chat_read_status import ChatReadStatus
 from app.services.chat.chat_create_helper import ChatCreateHelper
 from app.services.chat.chat_info_service import ChatInfoService
+from app.services.chat.chat_membership_cache import ChatMembershipCache
+from app.services.chat.chat_overview_cache import ChatOverviewCache
 from app.services.chat.chat_query_service import ChatQueryService
 from app.services.chat.chat_service import ChatService
 from app.services.chat_overview_service import ChatOverviewService
@@ -29,31 +30,50 @@ from app.services.redis_token_blacklist_service import \
     RedisTokenBlacklistService
 from app.services.search.search_service import SearchService
 from app.services.user.user_query_service import UserQueryService
+from app.services.ws.chat_event_publisher import ChatEventPublisher
 from app.services.ws.chat_read_service import ChatReadService
 from app.services.ws.dispatchers.redis_event_dispatcher import \
     ChatRedisEventDispatcher
 from app.services.ws.message_web_socket_handler import MessageWebSocketHandler
+from app.services.ws.presence_registry import PresenceRegistry
 from app.services.ws.redis_chat_subscription_service import \
     RedisChatSubscriptionService
+from app.services.ws.redis_subscription_multiplexer import \
+    RedisSubscriptionMultiplexer
 
 
 class WebSocketServiceContainer:
-    def __init__(self, db: AsyncSession, redis_client: Redis):
+    def __init__(
+            self,
+            db: AsyncSession,
+            redis_client: Redis,
+            multiplexer: RedisSubscriptionMultiplexer,
+            presence_registry: PresenceRegistry | None = None,
+            mq_client: RabbitMQClient | None = None,
+            cache: TwoLevelCache | None = None,
+    ):
         self.db = db
         self.redis_client = redis_client
-        self.redis = RedisCache(redis_client, JsonSerializer())
+        self.multiplexer = multiplexer
+        self.presence_registry = presence_registry
         self.pubsub = RedisPubSub(redis_client)
-        self.mq_client = RabbitMQClient()
+        self.redis = cache or TwoLevelCache(
+            RedisCache(redis_client, JsonSerializer()), self.pubsub
+        )
+        self.chat_event_publisher = ChatEventPublisher(
+            self.pubsub, presence_registry=self.presence_registry
+        )
+        self.mq_client = mq_client or RabbitMQClient()
 
         self.user_repository = UserRepository(db, User)
-        self.chat_repository = ChatRepository(db, Chat)
+        self.chat_membership_cache = ChatMembershipCache(redis_client)
+        self.chat_repository = ChatRepository(
+            db, Chat, self.chat_membership_cache
+        )
         self.message_repository = MessageRepository(db, Message)
         self.chat_read_status_repository = ChatReadStatusRepository(
             db, ChatReadStatus
         )
-        self.message_delivery_repository = MessageDeliveryRepository(
-            db, MessageDelivery
-        )
         self.contact_repository = ContactRepository(
             db, Contact
         )
@@ -61,7 +81,7 @@ class WebSocketServiceContainer:
             self.redis
         )
         self.message_delivery_service = MessageDeliveryService(
-            db, self.message_delivery_repository
+            db, self.chat_read_status_repository
         )
         self.chat_query_service = ChatQueryService(self.chat_repository)
         self.message_query_service = MessageQueryService(
@@ -69,11 +89,14 @@ class WebSocketServiceContainer:
         )
         self.chat_message_constructor = ChatMessagesConstructor(
             message_query_service=self.message_query_service,
+            message_delivery_service=self.message_delivery_service,
         )
         self.user_query_service = UserQueryService(self.user_repository)
+        self.chat_overview_cache = ChatOverviewCache(redis_client)
         self.chat_overview_service = ChatOverviewService(
             self.message_delivery_service,
-            self.message_query_service
+            self.chat_query_service,
+            self.chat_overview_cache
         )
         self.message_websocket_handler = MessageWebSocketHandler(
             self.mq_client
@@ -81,8 +104,10 @@ class WebSocketServiceContainer:
         self.chat_read_service = ChatReadService(
             db=self.db,
             chat_read_status_repository=self.chat_read_status_repository,
+            chat_repository=self.chat_repository,
             message_delivery_service=self.message_delivery_service,
-            pubsub=self.pubsub
+            chat_event_publisher=self.chat_event_publisher,
+            chat_overview_cache=self.chat_overview_cache
         )
         self.chat_info_service = ChatInfoService(
             chat_query_service=self.chat_query_service,
@@ -92,14 +117,15 @@ class WebSocketServiceContainer:
             user_repository=self.user_repository,
             chat_repository=self.chat_repository,
             chat_read_status_repository=self.chat_read_status_repository,
-            redis=self.redis
+            redis=self.redis,
+            chat_overview_cache=self.chat_overview_cache,
         )
         self.search_service = SearchService(
             user_repository=self.user_repository,
         )
         self.redis_event_dispatcher = ChatRedisEventDispatcher()
         self.redis_chat_subscription_service = RedisChatSubscriptionService(
-            pubsub=self.pubsub,
+            multiplexer=self.multiplexer,
             dispatch=self.redis_event_dispatcher.dispatch
         )
         self.chat_create_helper = ChatCreateHelper(
@@ -21,6 +21,8 @@ const ChatApp: React.FC<{ accessToken: string }> = ({ accessToken }) => {
     chatInfo,
     requestChatInfo,
     requestChatMessages,
+    hasMoreMessagesByChat,
+    loadOlderMessages,
     search,
     searchResults,
     setSearchResults,
@@ -50,7 +52,9 @@ const ChatApp: React.FC<{ accessToken: string }> = ({ accessToken }) => {
         chatName: selectedChat?.chat_name ?? '',
         messages: selectedChatMessages,
         chatInfo: chatInfo,
-        requestChatInfo: requestChatInfo
+        requestChatInfo: requestChatInfo,
+        hasMoreMessages: hasMoreMessagesByChat[currentChatId] ?? false,
+        loadOlderMessages: loadOlderMessages
       };
     }
     if (provisionalChatUser) {
@@ -68,7 +72,9 @@ const ChatApp: React.FC<{ accessToken: string }> = ({ accessToken }) => {
     messagesByChat,
     chatInfo,
     selectedChatMessages,
-    requestChatInfo
+    requestChatInfo,
+    hasMoreMessagesByChat,
+    loadOlderMessages
     ]
   )
 
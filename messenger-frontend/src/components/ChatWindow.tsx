@@ -20,6 +20,8 @@ interface ExistingChatProps extends ChatWindowBaseProps {
   messages: Message[];
   chatInfo: ChatInfo | null;
   requestChatInfo: (chatId: number) => void;
+  hasMoreMessages: boolean;
+  loadOlderMessages: (chatId: number) => void;
 }
 
 interface ProvisionalChatProps extends ChatWindowBaseProps {
@@ -54,9 +56,11 @@ export const ChatWindow: React.FC<ChatWindowProps> = (props) => {
       </svg>
   );
 
+  const lastMessageId = props.messages[props.messages.length - 1]?.message_id;
+
   useEffect(() => {
     messagesEndRef.current?.scrollIntoView({ behavior: "smooth" });
-  }, [props.messages]);
+  }, [lastMessageId]);
 
   const handleSendMessage = (e: React.FormEvent) => {
     e.preventDefault();
@@ -125,6 +129,15 @@ export const ChatWindow: React.FC<ChatWindowProps> = (props) => {
       </div>
 
       <div className="messages-area">
+        {props.type === 'existing' && props.hasMoreMessages && (
+          <button
+            type="button"
+            className="load-older-button"
+            onClick={() => props.loadOlderMessages(props.chatId)}
+          >
+            Load older messages
+          </button>
+        )}
         {props.messages.map((msg) => (
           <div
             key={msg.message_id}
@@ -1,4 +1,4 @@
-import {useCallback, useEffect, useState} from 'react';
+import {useCallback, useEffect, useRef, useState} from 'react';
 import axios from 'axios';
 import type {
     ChatInfo,
@@ -71,10 +71,24 @@ const mergeAndSortMessages = (existing: Message[] = [], incoming: Message[] = []
     return sorted
 };
 
+const mergeChatOverviews = (existing: ChatOverview[], page: ChatOverview[]): ChatOverview[] => {
+    const knownChatIds = new Set(existing.map(chat => chat.chat_id));
+    return [...existing, ...page.filter(chat => !knownChatIds.has(chat.chat_id))];
+};
+
+const nextChatOverviewCursor = (page: ChatOverview[]) => {
+    const last = page[page.length - 1];
+    const activityAt = last?.last_activity_at ?? last?.last_message?.sent_at;
+    if (!activityAt) return null;
+    return {before_activity_at: activityAt, before_chat_id: last.chat_id};
+};
+
 export const useWebSocket = () => {
     const [socket, setSocket] = useState<WebSocket | null>(null);
     const [messagesByChat, setMessagesByChat] = useState<Record<number, Message[]>>({});
     const [chatOverviewList, setChatOverviewList] = useState<ChatOverview[]>([]);
+    const [hasMoreMessagesByChat, setHasMoreMessagesByChat] = useState<Record<number, boolean>>({});
+    const olderMessagesRequested = useRef<Set<number>>(new Set());
     const [chatInfo, setChatInfo] = useState<ChatInfo | null>(null);
     const [searchResults, setSearchResults] = useState<SearchUser[]>([]);
     const [newlyCreatedChatInfo, setNewlyCreatedChatInfo] = useState<ChatInfo | null>(null);
@@ -97,6 +111,7 @@ export const useWebSocket = () => {
 
         console.log('Connecting WebSocket with token:', token.slice(0, 10) + '...');
         const ws = new WebSocket(`${WS_URL}?access_token=${token}`);
+        let overviewPageRequested = false;
 
         ws.onopen = () => console.log('WebSocket connected successfully');
         ws.onmessage = (event) => {
@@ -112,6 +127,9 @@ export const useWebSocket = () => {
                         const {chat_id} = newMessage;
                         setMessagesByChat(prev => {
                             const currentMessages = prev[chat_id] || [];
+                            if (currentMessages.some(msg => msg.message_id === newMessage.message_id)) {
+                                return prev;
+                            }
                             const lastMessage = currentMessages[currentMessages.length - 1];
 
                             if (!lastMessage || new Date(newMessage.sent_at) >= new Date(lastMessage.sent_at)) {
@@ -131,7 +149,20 @@ export const useWebSocket = () => {
                     }
                     case 'chat_overview_list_sent': {
                         console.log('Handling "chat_overview_list_sent" event');
-                        setChatOverviewList(message.data as ChatOverview[]);
+                        const page = message.data as ChatOverview[];
+                        const isNextPage = overviewPageRequested;
+                        overviewPageRequested = false;
+                        setChatOverviewList(prev => isNextPage ? mergeChatOverviews(prev, page) : page);
+
+                        const cursor = message.has_more ? nextChatOverviewCursor(page) : null;
+                        if (cursor) {
+                            console.log('Requesting next chat overview page', cursor);
+                            overviewPageRequested = true;
+                            ws.send(JSON.stringify({
+                                event: 'get_chat_overview_list',
+                                data: cursor
+                            }));
+                        }
                         break;
                     }
                     case 'undelivered_messages_sent': {
@@ -163,6 +194,14 @@ export const useWebSocket = () => {
                     case 'chat_messages_sent': {
                         console.log('Handling "chat_messages_sent" event');
                         const messages = message.data as Message[]
+                        const pageChatId = message.chat_id ?? messages?.[0]?.chat_id;
+                        if (pageChatId != null) {
+                            olderMessagesRequested.current.delete(pageChatId);
+                            setHasMoreMessagesByChat(prev => ({
+                                ...prev,
+                                [pageChatId]: Boolean(message.has_more)
+                            }));
+                        }
                         if (messages && messages.length > 0) {
                             const chat_id = messages[0].chat_id
 
@@ -261,14 +300,26 @@ export const useWebSocket = () => {
         }));
     }, [socket]);
 
-    const requestChatMessages = useCallback((chatId: number) => {
-        console.log(`Requesting messages for chat ${chatId}`);
+    const requestChatMessages = useCallback((chatId: number, beforeMessageId?: number) => {
+        console.log(`Requesting messages for chat ${chatId}`, beforeMessageId ?? '');
         socket?.send(JSON.stringify({
             event: 'get_chat_messages',
-            data: {chat_id: chatId}
+            data: beforeMessageId
+                ? {chat_id: chatId, before_message_id: beforeMessageId}
+                : {chat_id: chatId}
         }));
     }, [socket]);
 
+    const loadOlderMessages = useCallback((chatId: number) => {
+        const messages = messagesByChat[chatId];
+        if (!hasMoreMessagesByChat[chatId] || !messages?.length) return;
+        if (olderMessagesRequested.current.has(chatId)) return;
+
+        const oldestMessageId = Math.min(...messages.map(msg => msg.message_id));
+        olderMessagesRequested.current.add(chatId);
+        requestChatMessages(chatId, oldestMessageId);
+    }, [messagesByChat, hasMoreMessagesByChat, requestChatMessages]);
+
     const search = useCallback((prompt: string) => {
         socket?.send(JSON.stringify({
             event: 'search',
@@ -298,6 +349,8 @@ export const useWebSocket = () => {
         chatInfo,
         requestChatInfo,
         requestChatMessages,
+        hasMoreMessagesByChat,
+        loadOlderMessages,
         search,
         searchResults,
         setSearchResults,
@@ -20,6 +20,7 @@ export interface ChatOverview {
   chat_name: string;
   last_message: MessageInChatOverview;
   unread_count: number;
+  last_activity_at?: string | null;
 }
 
 export interface User {
@@ -66,6 +67,8 @@ export type ServerToClientEvent =
 export interface IncomingMessage {
   event: ServerToClientEvent;
   data: unknown;
+  has_more?: boolean;
+  chat_id?: number | null;
 }
 
 export type NewMessagePayload =
@@ -0,0 +1,69 @@
+import pytest
+
+from app.infrastructure.cache import local_ttl_cache
+from app.infrastructure.cache.local_ttl_cache import LocalTTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(local_ttl_cache.time, 'monotonic', clock)
+    return clock
+
+
+def test_evicts_least_recently_used(clock):
+    cache = LocalTTLCache(max_size=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    assert cache.get('a') == 1
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+    assert cache.evictions == 1
+
+
+def test_entries_expire_after_ttl(clock):
+    cache = LocalTTLCache(max_size=10, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=30)
+
+    clock.now += 10
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
+    assert len(cache) == 1
+    assert cache.evictions == 0
+
+
+def test_set_refreshes_ttl(clock):
+    cache = LocalTTLCache(max_size=10, ttl=10)
+    cache.set('a', 1)
+    clock.now += 8
+    cache.set('a', 2)
+    clock.now += 8
+
+    assert cache.get('a') == 2
+
+
+def test_delete_many_ignores_missing_keys(clock):
+    cache = LocalTTLCache(max_size=10, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+
+    cache.delete_many(['a', 'missing'])
+    cache.delete('missing')
+
+    assert cache.get('a') is None
+    assert cache.get('b') == 2
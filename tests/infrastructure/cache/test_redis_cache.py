@@ -0,0 +1,159 @@
+import asyncio
+import time
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+from sqlalchemy.exc import OperationalError
+
+from app.infrastructure.cache.json_serializer import JsonSerializer
+from app.infrastructure.cache.redis_cache import RedisCache
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def redis():
+    redis = FakeAsyncRedis(decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+@pytest.fixture
+def cache(redis):
+    return RedisCache(redis, JsonSerializer(), early_refresh_beta=0)
+
+
+class Loader:
+    def __init__(self, value=None, delay=0.0, error=None):
+        self.value = value
+        self.delay = delay
+        self.error = error
+        self.calls = 0
+        self.started = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        self.started.set()
+        await asyncio.sleep(self.delay)
+        if self.error:
+            raise self.error
+        return self.value
+
+
+async def expire_logically(redis, cache, key):
+    envelope = cache.serializer.loads(await redis.get(key))
+    envelope['expires_at'] = time.time() - 1
+    await redis.set(key, cache.serializer.dumps(envelope), ex=100)
+
+
+async def test_concurrent_misses_share_one_load(cache):
+    loader = Loader({'n': 1}, delay=0.05)
+
+    results = await asyncio.gather(*[
+        cache.get_or_load('k', loader, 10) for _ in range(10)
+    ])
+
+    assert results == [{'n': 1}] * 10
+    assert loader.calls == 1
+    assert await cache.get_or_load('k', Loader({'n': 2}), 10) == {'n': 1}
+
+
+async def test_follower_loads_itself_when_leader_is_cancelled(cache):
+    leader_loader = Loader({'n': 1}, delay=1)
+    follower_loader = Loader({'n': 2})
+
+    leader = asyncio.create_task(cache.get_or_load('k', leader_loader, 10))
+    await leader_loader.started.wait()
+    follower = asyncio.create_task(
+        cache.get_or_load('k', follower_loader, 10)
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+
+    assert await asyncio.wait_for(follower, 1) == {'n': 2}
+    assert follower_loader.calls == 1
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+async def test_loader_errors_reach_every_waiter(cache):
+    loader = Loader(delay=0.05, error=ValueError('boom'))
+
+    results = await asyncio.gather(
+        cache.get_or_load('k', loader, 10),
+        cache.get_or_load('k', loader, 10),
+        return_exceptions=True,
+    )
+
+    assert [type(result) for result in results] == [ValueError] * 2
+    assert loader.calls == 1
+
+
+async def test_serves_stale_entry_when_loader_fails(redis, cache):
+    await cache.get_or_load('k', Loader({'n': 1}), 10)
+    await expire_logically(redis, cache, 'k')
+
+    failing = Loader(error=OperationalError('select', {}, Exception()))
+
+    assert await cache.get_or_load('k', failing, 10) == {'n': 1}
+    assert failing.calls == 1
+
+
+async def test_domain_errors_are_not_hidden_by_stale_entry(redis, cache):
+    await cache.get_or_load('k', Loader({'n': 1}), 10)
+    await expire_logically(redis, cache, 'k')
+
+    with pytest.raises(ValueError):
+        await cache.get_or_load('k', Loader(error=ValueError('gone')), 10)
+
+
+async def test_serves_stale_entry_while_other_process_holds_lock(
+        redis, cache
+):
+    await cache.get_or_load('k', Loader({'n': 1}), 10)
+    await expire_logically(redis, cache, 'k')
+    await redis.set('lock:k', 'other', px=5000)
+    loader = Loader({'n': 2})
+
+    assert await cache.get_or_load('k', loader, 10, lock=True) == {'n': 1}
+    assert loader.calls == 0
+
+
+async def test_none_is_not_cached(redis, cache):
+    assert await cache.get_or_load('k', Loader(None), 10) is None
+    assert await redis.get('k') is None
+
+
+async def test_invalidate_tags_unlinks_tagged_keys(cache, redis):
+    await cache.set('a', 1, 60, tags=['chat:1'])
+    await cache.set('b', 2, 60, tags=['chat:1', 'chat:2'])
+    await cache.set('c', 3, 60, tags=['chat:2'])
+
+    keys = await cache.invalidate_tags(['chat:1'])
+
+    assert sorted(keys) == ['a', 'b']
+    assert await redis.exists('a', 'b') == 0
+    assert await cache.get('c') == 3
+    assert await redis.smembers(cache.tag_key('chat:1')) == set()
+
+
+async def test_invalidate_tags_keeps_membership_of_later_writes(cache, redis):
+    await cache.set('a', 1, 60, tags=['chat:1'])
+    await cache.invalidate_tags(['chat:1'])
+    await cache.set('a', 2, 60, tags=['chat:1'])
+
+    assert await cache.invalidate_tags(['chat:1']) == ['a']
+    assert await redis.exists('a') == 0
+
+
+async def test_invalidate_tags_handles_large_tag_sets(cache, redis):
+    tag_key = cache.tag_key('chat:1')
+    members = [f'k{i}' for i in range(2500)]
+    await redis.sadd(tag_key, *members)
+
+    keys = await cache.invalidate_tags(['chat:1', 'chat:404'])
+
+    assert sorted(keys) == sorted(members)
+    assert await redis.scard(tag_key) == 0
+    assert await cache.invalidate_tags([]) == []
@@ -0,0 +1,103 @@
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+
+from app.infrastructure.cache.json_serializer import JsonSerializer
+from app.infrastructure.cache.local_ttl_cache import LocalTTLCache
+from app.infrastructure.cache.redis_cache import RedisCache
+from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.infrastructure.cache.two_level_cache import TwoLevelCache, \
+    CACHE_INVALIDATED_EVENT
+from app.schemas.event import RedisEvent
+
+pytestmark = pytest.mark.asyncio
+
+CHANNEL = 'cache:invalidation:test'
+
+
+@pytest_asyncio.fixture
+async def redis():
+    redis = FakeAsyncRedis(decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+@pytest_asyncio.fixture
+async def invalidations(redis):
+    pubsub = redis.pubsub()
+    await pubsub.subscribe(CHANNEL)
+    await pubsub.get_message(timeout=1)
+    yield pubsub
+    await pubsub.aclose()
+
+
+def make_node(redis) -> TwoLevelCache:
+    return TwoLevelCache(
+        RedisCache(redis, JsonSerializer(), early_refresh_beta=0),
+        RedisPubSub(redis),
+        LocalTTLCache(max_size=100, ttl=60),
+        channel=CHANNEL,
+    )
+
+
+async def next_invalidation(pubsub) -> RedisEvent:
+    message = await pubsub.get_message(
+        ignore_subscribe_messages=True, timeout=1
+    )
+    return RedisEvent.from_raw(message['data'])
+
+
+async def test_serves_repeated_reads_from_local_cache(redis):
+    node = make_node(redis)
+    await node.set('k', {'v': 1})
+    await redis.delete('k')
+
+    assert await node.get('k') == {'v': 1}
+    assert node.stats()['hits'] == 1
+
+
+async def test_remote_write_invalidates_other_nodes(redis, invalidations):
+    writer, reader = make_node(redis), make_node(redis)
+    await writer.set('k', {'v': 1})
+    await reader.handle_invalidation(await next_invalidation(invalidations))
+    assert await reader.get('k') == {'v': 1}
+
+    await writer.set('k', {'v': 2})
+    assert await reader.get('k') == {'v': 1}
+
+    event = await next_invalidation(invalidations)
+    assert event.event == CACHE_INVALIDATED_EVENT
+    assert event.data['keys'] == ['k']
+    await reader.handle_invalidation(event)
+
+    assert await reader.get('k') == {'v': 2}
+
+
+async def test_ignores_own_invalidations(redis, invalidations):
+    node = make_node(redis)
+    await node.set('k', {'v': 1})
+    await redis.delete('k')
+
+    await node.handle_invalidation(await next_invalidation(invalidations))
+
+    assert await node.get('k') == {'v': 1}
+
+
+async def test_delete_and_tag_invalidation_clear_local_copies(
+        redis, invalidations
+):
+    writer, reader = make_node(redis), make_node(redis)
+    await writer.remote.set_raw('a', '{"v": 1}', 60, ['chat:1'])
+    await writer.set('b', {'v': 2})
+    await reader.handle_invalidation(await next_invalidation(invalidations))
+    assert await reader.get('a') == {'v': 1}
+    assert await reader.get('b') == {'v': 2}
+
+    await writer.invalidate_tags(['chat:1'])
+    await writer.delete('b')
+    await reader.handle_invalidation(await next_invalidation(invalidations))
+    await reader.handle_invalidation(await next_invalidation(invalidations))
+
+    assert await reader.get('a') is None
+    assert await reader.get('b') is None
+    assert len(reader.local_cache) == 0
@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.message_queue.keyed_task_queue import KeyedTaskQueue
+
+pytestmark = pytest.mark.asyncio
+
+
+class Tracker:
+    def __init__(self):
+        self.log = []
+        self.running = 0
+        self.max_running = 0
+
+    def job(self, key, n, delay=0.0, error=None):
+        async def run():
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+            self.log.append(('start', key, n))
+            await asyncio.sleep(delay)
+            self.log.append(('end', key, n))
+            self.running -= 1
+            if error:
+                raise error
+        return run
+
+    def order(self, key):
+        return [n for event, k, n in self.log if event == 'end' and k == key]
+
+
+async def test_jobs_for_one_key_run_in_submission_order():
+    queue = KeyedTaskQueue(max_concurrency=4)
+    tracker = Tracker()
+
+    for n, delay in enumerate([0.03, 0.0, 0.02, 0.0]):
+        queue.submit(1, tracker.job(1, n, delay))
+    await queue.join()
+
+    assert tracker.order(1) == [0, 1, 2, 3]
+    assert tracker.max_running == 1
+    assert queue.active_keys == 0
+
+
+async def test_different_keys_run_concurrently():
+    queue = KeyedTaskQueue(max_concurrency=4)
+    tracker = Tracker()
+
+    for key in (1, 2, 3):
+        queue.submit(key, tracker.job(key, 0, 0.02))
+    assert queue.active_keys == 3
+    await queue.join()
+
+    assert tracker.max_running == 3
+
+
+async def test_concurrency_is_bounded():
+    queue = KeyedTaskQueue(max_concurrency=2)
+    tracker = Tracker()
+
+    for key in range(5):
+        queue.submit(key, tracker.job(key, 0, 0.01))
+    await queue.join()
+
+    assert tracker.max_running == 2
+    assert len(tracker.order(0)) == 1
+
+
+async def test_failed_job_does_not_stop_its_key():
+    queue = KeyedTaskQueue(max_concurrency=1)
+    tracker = Tracker()
+
+    queue.submit(1, tracker.job(1, 0, error=RuntimeError('boom')))
+    queue.submit(1, tracker.job(1, 1))
+    await queue.join()
+
+    assert tracker.order(1) == [0, 1]
+
+
+async def test_submit_after_drain_starts_new_worker():
+    queue = KeyedTaskQueue(max_concurrency=1)
+    tracker = Tracker()
+
+    queue.submit(1, tracker.job(1, 0))
+    await queue.join()
+    queue.submit(1, tracker.job(1, 1))
+    await queue.join()
+
+    assert tracker.order(1) == [0, 1]
+    assert queue.active_keys == 0
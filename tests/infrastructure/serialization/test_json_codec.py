@@ -0,0 +1,84 @@
+from datetime import datetime
+from enum import Enum
+
+import pytest
+from pydantic import BaseModel
+
+from app.infrastructure.serialization import json_codec as codec_module
+from app.infrastructure.serialization.json_codec import JsonDecodeError, \
+    MsgspecJsonCodec, OrjsonCodec, StdlibJsonCodec, get_json_codec
+from app.infrastructure.types.codec import JsonCodecBackend
+
+
+class Color(Enum):
+    RED = 'red'
+
+
+class Payload(BaseModel):
+    id: int
+    sent_at: datetime
+
+
+def codec_param(codec_class, module):
+    return pytest.param(
+        codec_class,
+        id=codec_class.name.value,
+        marks=pytest.mark.skipif(
+            module is None, reason=f'{codec_class.name.value} not installed'
+        ),
+    )
+
+
+@pytest.fixture(params=[
+    codec_param(StdlibJsonCodec, codec_module.json),
+    codec_param(OrjsonCodec, codec_module.orjson),
+    codec_param(MsgspecJsonCodec, codec_module.msgspec),
+])
+def codec(request):
+    return request.param()
+
+
+def test_round_trips_plain_json(codec):
+    obj = {'event': 'new_message', 'data': {'id': 1, 'text': 'привет'},
+           'ids': [1, 2], 'ok': True, 'none': None}
+
+    assert codec.loads(codec.dumps(obj)) == obj
+    assert codec.loads(codec.dumpb(obj)) == obj
+
+
+def test_encodes_non_json_types(codec):
+    sent_at = datetime(2026, 1, 1, 12, 30)
+    obj = {
+        'model': Payload(id=1, sent_at=sent_at),
+        'sent_at': sent_at,
+        'color': Color.RED,
+        'tags': ('a', 'b'),
+    }
+
+    assert codec.loads(codec.dumps(obj)) == {
+        'model': {'id': 1, 'sent_at': '2026-01-01T12:30:00'},
+        'sent_at': '2026-01-01T12:30:00',
+        'color': 'red',
+        'tags': ['a', 'b'],
+    }
+
+
+def test_uses_custom_default(codec):
+    assert codec.loads(codec.dumps({'x': object()}, default=lambda _: 1)) \
+           == {'x': 1}
+
+
+def test_decode_errors_are_normalized(codec):
+    with pytest.raises(JsonDecodeError):
+        codec.loads('{not json')
+
+
+def test_stdlib_backend_is_always_available():
+    assert isinstance(get_json_codec(JsonCodecBackend.STDLIB), StdlibJsonCodec)
+
+
+def test_missing_backend_falls_back_to_stdlib(monkeypatch):
+    monkeypatch.setattr(codec_module, 'msgspec', None)
+
+    assert isinstance(get_json_codec(JsonCodecBackend.MSGSPEC),
+                      StdlibJsonCodec)
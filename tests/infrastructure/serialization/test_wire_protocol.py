@@ -0,0 +1,179 @@
+import zlib
+
+import pytest
+
+from app.core.config import settings, Settings
+from app.infrastructure.serialization import wire_protocol
+from app.infrastructure.serialization.json_codec import json_codec
+from app.infrastructure.serialization.wire_protocol import \
+    DeflateJsonWireProtocol, JsonWireProtocol, MsgpackWireProtocol, \
+    WireDecodeError, negotiate_wire_protocol, json_wire_protocol, \
+    DEFLATE_JSON_SUBPROTOCOL, MSGPACK_SUBPROTOCOL
+from app.schemas.event import RedisEvent
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.text = []
+        self.bytes = []
+
+    async def send_text(self, data: str):
+        self.text.append(data)
+
+    async def send_bytes(self, data: bytes):
+        self.bytes.append(data)
+
+
+@pytest.fixture
+def per_message_deflate(monkeypatch):
+    monkeypatch.setattr(settings, 'WS_COMPRESSION_ENABLED', True)
+    monkeypatch.setattr(settings, 'WS_PER_MESSAGE_DEFLATE', True)
+
+
+def test_negotiates_deflate_without_transport_compression(
+        per_message_deflate
+):
+    protocol = negotiate_wire_protocol([DEFLATE_JSON_SUBPROTOCOL], '')
+
+    assert isinstance(protocol, DeflateJsonWireProtocol)
+
+
+def test_skips_deflate_when_per_message_deflate_negotiated(
+        per_message_deflate
+):
+    protocol = negotiate_wire_protocol(
+        [DEFLATE_JSON_SUBPROTOCOL],
+        'permessage-deflate; client_max_window_bits',
+    )
+
+    assert type(protocol) is JsonWireProtocol
+    assert protocol.subprotocol is None
+
+
+def test_per_message_deflate_is_off_by_default():
+    assert Settings.model_fields['WS_PER_MESSAGE_DEFLATE'].default is False
+
+
+def test_keeps_deflate_when_server_disables_per_message_deflate(
+        per_message_deflate, monkeypatch
+):
+    monkeypatch.setattr(settings, 'WS_PER_MESSAGE_DEFLATE', False)
+
+    protocol = negotiate_wire_protocol(
+        [DEFLATE_JSON_SUBPROTOCOL], 'permessage-deflate'
+    )
+
+    assert isinstance(protocol, DeflateJsonWireProtocol)
+
+
+async def test_deflate_compresses_large_frames_and_records_metrics(
+        monkeypatch
+):
+    metrics = wire_protocol.CompressionMetrics()
+    monkeypatch.setattr(wire_protocol, 'compression_metrics', metrics)
+    protocol = DeflateJsonWireProtocol(threshold=64)
+    websocket = FakeWebSocket()
+    payload = {'content': 'x' * 512}
+
+    await protocol.send(websocket, protocol.encode({'content': 'hi'}))
+    await protocol.send(websocket, protocol.encode(payload))
+
+    assert websocket.text == [json_codec.dumps({'content': 'hi'})]
+    decompressed = zlib.decompress(websocket.bytes[0], -zlib.MAX_WBITS)
+    assert json_codec.loads(decompressed) == payload
+    stats = metrics.as_dict()
+    assert stats['frames_raw'] == 1
+    assert stats['frames_compressed'] == 1
+    assert stats['bytes_saved'] > 0
+
+
+async def test_redis_event_is_compressed_once_for_all_sockets(monkeypatch):
+    metrics = wire_protocol.CompressionMetrics()
+    monkeypatch.setattr(wire_protocol, 'compression_metrics', metrics)
+    redis_event = RedisEvent.from_raw(json_codec.dumps(
+        {'event': 'new_message', 'data': {'content': 'x' * 512}}
+    ))
+    websockets = [FakeWebSocket() for _ in range(3)]
+
+    for websocket in websockets:
+        protocol = DeflateJsonWireProtocol(threshold=64)
+        await protocol.send(websocket, redis_event.encode_for(protocol))
+
+    frames = [websocket.bytes[0] for websocket in websockets]
+    assert frames[0] is frames[1] is frames[2]
+    assert metrics.frames_compressed == 1
+    assert redis_event.encode_for(JsonWireProtocol()) == redis_event.frame
+
+
+class FakeReceivingWebSocket:
+    def __init__(self, data):
+        self.data = data
+
+    async def receive_text(self) -> str:
+        return self.data
+
+    async def receive_bytes(self) -> bytes:
+        return self.data
+
+
+PAYLOAD = {
+    'event': 'new_message',
+    'data': {'chat_id': 1, 'content': 'привет', 'ids': [1, 2]},
+}
+
+
+@pytest.mark.skipif(wire_protocol.msgpack is None,
+                    reason='msgpack not installed')
+async def test_msgpack_round_trip():
+    protocol = MsgpackWireProtocol()
+    websocket = FakeWebSocket()
+
+    await protocol.send(websocket, protocol.encode(PAYLOAD))
+
+    assert websocket.text == []
+    received = FakeReceivingWebSocket(websocket.bytes[0])
+    assert await protocol.receive(received) == PAYLOAD
+
+
+async def test_json_round_trip():
+    protocol = JsonWireProtocol()
+    websocket = FakeWebSocket()
+
+    await protocol.send(websocket, protocol.encode(PAYLOAD))
+
+    assert websocket.bytes == []
+    received = FakeReceivingWebSocket(websocket.text[0])
+    assert await protocol.receive(received) == PAYLOAD
+
+
+@pytest.mark.parametrize('protocol', [
+    JsonWireProtocol(),
+    pytest.param(MsgpackWireProtocol(), marks=pytest.mark.skipif(
+        wire_protocol.msgpack is None, reason='msgpack not installed'
+    )),
+], ids=['json', 'msgpack'])
+def test_invalid_frames_raise_wire_decode_error(protocol):
+    with pytest.raises(WireDecodeError):
+        protocol.decode(b'\xc1' if protocol.subprotocol else '{not json')
+
+
+@pytest.mark.skipif(wire_protocol.msgpack is None,
+                    reason='msgpack not installed')
+def test_redis_event_encodes_once_per_wire_format():
+    redis_event = RedisEvent.from_raw(json_codec.dumps(PAYLOAD))
+    protocol = MsgpackWireProtocol()
+
+    frame = redis_event.encode_for(protocol)
+
+    assert redis_event.encode_for(JsonWireProtocol()) == redis_event.frame
+    assert redis_event.encode_for(protocol) is frame
+    assert protocol.decode(frame) == PAYLOAD
+
+
+def test_negotiates_msgpack_when_offered():
+    protocol = negotiate_wire_protocol([MSGPACK_SUBPROTOCOL])
+
+    if wire_protocol.msgpack is None:
+        assert protocol is json_wire_protocol
+    else:
+        assert isinstance(protocol, MsgpackWireProtocol)
@@ -0,0 +1,27 @@
+from sqlalchemy.dialects import mysql
+
+
+class FakeResult:
+    def __init__(self, rows=(), lastrowid=None, rowcount=0):
+        self.rows = list(rows)
+        self.lastrowid = lastrowid
+        self.rowcount = rowcount
+
+    def all(self):
+        return self.rows
+
+    def scalars(self):
+        return self
+
+
+class FakeSession:
+    def __init__(self, *results):
+        self.results = list(results)
+        self.statements = []
+        self.bound_params = []
+
+    async def execute(self, statement, params=None):
+        compiled = statement.compile(dialect=mysql.dialect())
+        self.statements.append((str(compiled), params))
+        self.bound_params.append(compiled.params)
+        return self.results.pop(0) if self.results else FakeResult()
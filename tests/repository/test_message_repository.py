@@ -0,0 +1,50 @@
+import pytest
+
+from app.db.repository.message_repository import MessageRepository
+from app.infrastructure.exceptions.exceptions import DatabaseError
+from app.models import Message
+from tests.repository.fake_session import FakeResult, FakeSession
+
+pytestmark = pytest.mark.asyncio
+
+
+def message_data(chat_id, user_id, content):
+    return {
+        'chat_id': chat_id,
+        'user_id': user_id,
+        'content': content,
+        'sent_at': None,
+    }
+
+
+async def test_bulk_insert_assigns_consecutive_ids_in_input_order():
+    db = FakeSession(FakeResult(lastrowid=100))
+    repository = MessageRepository(db, Message)
+
+    messages = await repository.create_messages_bulk([
+        message_data(1, 5, 'a'),
+        message_data(2, 6, 'b'),
+        message_data(1, 5, 'a'),
+    ])
+
+    assert [message.message_id for message in messages] == [100, 101, 102]
+    assert [message.chat_id for message in messages] == [1, 2, 1]
+    assert len(db.statements) == 1
+    insert_sql, _ = db.statements[0]
+    assert insert_sql.startswith('INSERT INTO message')
+
+
+async def test_bulk_insert_fails_without_lastrowid():
+    db = FakeSession(FakeResult(lastrowid=None))
+    repository = MessageRepository(db, Message)
+
+    with pytest.raises(DatabaseError):
+        await repository.create_messages_bulk([message_data(1, 5, 'a')])
+
+
+async def test_bulk_insert_of_nothing_skips_the_database():
+    db = FakeSession()
+    repository = MessageRepository(db, Message)
+
+    assert await repository.create_messages_bulk([]) == []
+    assert db.statements == []
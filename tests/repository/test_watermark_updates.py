@@ -0,0 +1,101 @@
+from datetime import datetime
+
+import pytest
+
+from app.db.repository.chat_read_status_repository import \
+    ChatReadStatusRepository
+from app.db.repository.chat_repository import ChatRepository
+from app.models import Chat
+from app.models.chat_read_status import ChatReadStatus
+from tests.repository.fake_session import FakeResult, FakeSession
+
+pytestmark = pytest.mark.asyncio
+
+NOW = datetime(2026, 1, 1, 12, 0)
+
+
+async def test_mark_as_read_only_moves_watermarks_forward():
+    db = FakeSession(FakeResult(rowcount=1))
+    repository = ChatReadStatusRepository(db, ChatReadStatus)
+
+    assert await repository.mark_as_read(1, 2, 10, NOW)
+
+    sql, _ = db.statements[0]
+    assert sql.startswith('UPDATE chat_read_status SET')
+    assert 'last_delivered_message_id=greatest(coalesce(' \
+           'chat_read_status.last_delivered_message_id, %s), %s)' in sql
+    assert 'coalesce(chat_read_status.last_read_message_id, %s) < %s' \
+           in sql.split('WHERE')[1]
+    assert 10 in db.bound_params[0].values()
+
+
+async def test_mark_as_read_reports_stale_watermark():
+    db = FakeSession(FakeResult(rowcount=0))
+    repository = ChatReadStatusRepository(db, ChatReadStatus)
+
+    assert not await repository.mark_as_read(1, 2, 10, NOW)
+
+
+async def test_mark_as_sent_is_one_executemany_update():
+    db = FakeSession()
+    repository = ChatReadStatusRepository(db, ChatReadStatus)
+
+    await repository.mark_as_sent([
+        {'chat_id': 1, 'user_id': 2, 'message_id': 5},
+        {'chat_id': 3, 'user_id': 2, 'message_id': 9},
+    ], NOW)
+
+    assert len(db.statements) == 1
+    sql, params = db.statements[0]
+    assert 'last_read_message_id=greatest(' in sql
+    assert 'last_delivered_message_id=greatest(' in sql
+    assert params == [
+        {'b_chat_id': 1, 'b_user_id': 2, 'b_message_id': 5},
+        {'b_chat_id': 3, 'b_user_id': 2, 'b_message_id': 9},
+    ]
+
+
+async def test_mark_as_delivered_uses_per_chat_case():
+    db = FakeSession()
+    repository = ChatReadStatusRepository(db, ChatReadStatus)
+
+    await repository.mark_as_delivered(2, {1: 5, 3: 7}, NOW)
+
+    sql, _ = db.statements[0]
+    assert 'last_delivered_message_id=greatest(coalesce(' \
+           'chat_read_status.last_delivered_message_id, %s), ' \
+           'CASE chat_read_status.chat_id WHEN %s THEN %s ' \
+           'WHEN %s THEN %s END)' in sql
+    assert 'chat_read_status.chat_id IN' in sql
+    params = list(db.bound_params[0].values())
+    assert [1, 3] in params
+    assert params.index(5) < params.index(7)
+
+
+async def test_empty_watermark_batches_skip_the_database():
+    db = FakeSession()
+    read_statuses = ChatReadStatusRepository(db, ChatReadStatus)
+    chats = ChatRepository(db, Chat)
+
+    await read_statuses.mark_as_sent([], NOW)
+    await read_statuses.mark_as_delivered(2, {}, NOW)
+    await chats.update_last_messages({}, NOW)
+
+    assert db.statements == []
+
+
+async def test_update_last_messages_never_moves_chat_backwards():
+    db = FakeSession()
+    repository = ChatRepository(db, Chat)
+
+    await repository.update_last_messages({1: 5, 2: 8}, NOW)
+
+    sql, params = db.statements[0]
+    assert 'last_message_id=greatest(coalesce(chat.last_message_id, %s)' \
+           in sql
+    assert 'last_activity_at=greatest(coalesce(chat.last_activity_at, ' \
+           '%s), %s)' in sql
+    assert params == [
+        {'b_chat_id': 1, 'b_message_id': 5},
+        {'b_chat_id': 2, 'b_message_id': 8},
+    ]
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+
+from app.db.repository.chat_repository import ChatRepository
+from app.infrastructure.cache.local_ttl_cache import LocalTTLCache
+from app.models import Chat
+from app.schemas.event import RedisEvent
+from app.services.chat.chat_membership_cache import ChatMembershipCache
+from app.services.ws.redis_subscription_multiplexer import \
+    RedisSubscriptionMultiplexer
+from tests.repository.fake_session import FakeResult, FakeSession
+
+pytestmark = pytest.mark.asyncio
+
+CHANNEL = 'cache:invalidation:test'
+
+
+@pytest_asyncio.fixture
+async def redis():
+    redis = FakeAsyncRedis(decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+def make_cache(redis) -> ChatMembershipCache:
+    return ChatMembershipCache(
+        redis, ttl=60, local_cache=LocalTTLCache(100, 60), channel=CHANNEL
+    )
+
+
+async def test_fill_round_trips_through_redis(redis):
+    cache, other_process = make_cache(redis), make_cache(redis)
+    generations = await cache.get_generations([1])
+
+    assert await cache.store_participant_ids(1, [5, 6], generations[1])
+
+    assert sorted(await other_process.get_participant_ids(1)) == [5, 6]
+
+
+async def test_fill_after_invalidation_is_rejected(redis):
+    reader, writer = make_cache(redis), make_cache(redis)
+    generations = await reader.get_generations([1])
+
+    await writer.invalidate([1])
+    stored = await reader.store_participant_ids(1, [5], generations[1])
+
+    assert not stored
+    assert await reader.get_participant_ids(1) is None
+    assert await redis.exists('chat_members:1') == 0
+
+
+async def test_repository_does_not_cache_rows_read_before_invalidation(
+        redis
+):
+    cache = make_cache(redis)
+    db = FakeSession(FakeResult([(1, 5)]))
+    repository = ChatRepository(db, Chat, cache)
+    invalidate = cache.invalidate
+
+    async def execute_then_invalidate(statement, params=None):
+        result = await FakeSession.execute(db, statement, params)
+        await invalidate([1])
+        return result
+
+    db.execute = execute_then_invalidate
+
+    assert await repository.get_participant_ids(1) == [5]
+    assert await cache.get_participant_ids(1) is None
+
+
+async def test_invalidation_reaches_other_processes(redis):
+    local_cache = LocalTTLCache(100, 60)
+    other_process = ChatMembershipCache(
+        redis, local_cache=local_cache, channel=CHANNEL
+    )
+    await other_process.store_participant_ids(1, [5], 0)
+    received = asyncio.Event()
+
+    async def handle(redis_event: RedisEvent):
+        await other_process.handle_invalidation(redis_event)
+        received.set()
+
+    multiplexer = RedisSubscriptionMultiplexer(redis, poll_timeout=0.01)
+    await multiplexer.start()
+    try:
+        await multiplexer.subscribe([CHANNEL], handle)
+        await make_cache(redis).invalidate([1])
+        await asyncio.wait_for(received.wait(), 1)
+    finally:
+        await multiplexer.stop()
+
+    assert local_cache.get(1) is None
+
+
+async def test_ignores_other_events_on_the_channel(redis):
+    cache = make_cache(redis)
+    await cache.store_participant_ids(1, [5], 0)
+
+    await cache.handle_invalidation(RedisEvent(
+        event='cache_invalidated', data={'keys': [1]}
+    ))
+
+    assert await cache.get_participant_ids(1) == [5]
@@ -0,0 +1,106 @@
+from datetime import datetime, timezone
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+
+from app.schemas.chat import ChatOverview
+from app.schemas.message import MessageInChatOverview
+from app.services.chat.chat_overview_cache import ChatOverviewCache
+
+pytestmark = pytest.mark.asyncio
+
+SENT_AT = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+@pytest_asyncio.fixture
+async def redis():
+    redis = FakeAsyncRedis(decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+@pytest.fixture
+def cache(redis):
+    return ChatOverviewCache(redis, ttl=60)
+
+
+def overview(chat_id, unread_count=0, content=None):
+    return ChatOverview(
+        chat_id=chat_id,
+        chat_name=f'chat {chat_id}',
+        unread_count=unread_count,
+        last_message=MessageInChatOverview(
+            sent_at=SENT_AT, content=content, display_name='bob'
+        ) if content else None,
+        last_activity_at=SENT_AT,
+    )
+
+
+async def apply_message(cache, chat_id, content):
+    await cache.apply_new_message(
+        chat_id=chat_id,
+        sender_id=2,
+        participant_ids=[1, 2],
+        last_message=MessageInChatOverview(
+            sent_at=SENT_AT, content=content, display_name='bob'
+        ),
+    )
+
+
+async def test_store_round_trips_overviews(cache):
+    version = await cache.get_version(1)
+
+    assert await cache.store_overview_list(
+        1, [overview(1, 2, 'hi'), overview(2)], version
+    )
+
+    cached = {o.chat_id: o for o in await cache.get_overview_list(1)}
+    assert cached[1].unread_count == 2
+    assert cached[1].last_message.content == 'hi'
+    assert cached[2].last_message is None
+    assert cached[2].chat_name == 'chat 2'
+
+
+async def test_store_is_skipped_after_concurrent_message(cache):
+    await cache.store_overview_list(1, [overview(1)], 0)
+    version = await cache.get_version(1)
+
+    await apply_message(cache, 1, 'new')
+    stored = await cache.store_overview_list(1, [overview(1)], version)
+
+    assert not stored
+    [cached] = await cache.get_overview_list(1)
+    assert cached.unread_count == 1
+    assert cached.last_message.content == 'new'
+
+
+async def test_store_is_skipped_after_message_on_cold_cache(cache):
+    version = await cache.get_version(1)
+
+    await apply_message(cache, 1, 'new')
+
+    assert not await cache.store_overview_list(1, [overview(1)], version)
+    assert await cache.get_overview_list(1) is None
+
+
+async def test_store_is_skipped_after_invalidation(cache):
+    version = await cache.get_version(1)
+
+    await cache.invalidate([1])
+
+    assert not await cache.store_overview_list(1, [overview(1)], version)
+    assert await cache.store_overview_list(
+        1, [overview(1)], await cache.get_version(1)
+    )
+
+
+async def test_set_unread_count_bumps_version(cache):
+    await cache.store_overview_list(1, [overview(1, 5)], 0)
+    version = await cache.get_version(1)
+
+    await cache.set_unread_count(1, 1, 0)
+
+    assert await cache.get_version(1) > version
+    [cached] = await cache.get_overview_list(1)
+    assert cached.unread_count == 0
@@ -0,0 +1,70 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.schemas.chat import ChatUpdate
+from app.services.chat.chat_service import ChatService
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeDb:
+    async def commit(self):
+        pass
+
+    async def refresh(self, *args, **kwargs):
+        pass
+
+    async def rollback(self):
+        pass
+
+
+class FakeChatRepository:
+    def __init__(self, chat):
+        self.chat = chat
+
+    async def check_if_user_in_chat(self, chat_id, user_id):
+        return True
+
+    async def get_chat_with_users(self, chat_id):
+        return self.chat
+
+
+class FakeCache:
+    def __init__(self):
+        self.invalidated_tags = []
+
+    async def invalidate_tags(self, tags):
+        self.invalidated_tags.extend(tags)
+
+
+class FakeOverviewCache:
+    def __init__(self):
+        self.invalidated_user_ids = []
+
+    async def invalidate(self, user_ids):
+        self.invalidated_user_ids.extend(user_ids)
+
+
+async def test_rename_invalidates_participant_overviews():
+    chat = SimpleNamespace(chat_id=7, name='old', participants=[
+        SimpleNamespace(user_id=1), SimpleNamespace(user_id=2),
+    ])
+    cache, overview_cache = FakeCache(), FakeOverviewCache()
+    chat_service = ChatService(
+        db=FakeDb(),
+        chat_repository=FakeChatRepository(chat),
+        user_repository=None,
+        chat_read_status_repository=None,
+        redis=cache,
+        current_user_id=1,
+        chat_overview_cache=overview_cache,
+    )
+
+    await chat_service.update_chat(ChatUpdate(
+        chat_id=7, name='new', chat_name='new'
+    ))
+
+    assert chat.name == 'new'
+    assert cache.invalidated_tags == ['chat:7']
+    assert overview_cache.invalidated_user_ids == [1, 2]
@@ -0,0 +1,178 @@
+import asyncio
+
+import pytest
+
+from app.services.ws.event_sender import EventSender, \
+    SLOW_CONSUMER_CLOSE_CODE
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeWebSocket:
+    def __init__(self):
+        self.sent = []
+        self.closed_with = None
+        self.release = asyncio.Event()
+        self.release.set()
+        self.sending = asyncio.Event()
+        self.application_state = None
+
+    async def send_text(self, frame):
+        self.sending.set()
+        await self.release.wait()
+        self.sent.append(frame)
+
+    async def close(self, code, reason):
+        self.closed_with = code
+        await self.release.wait()
+
+
+async def test_coalesces_pending_events_with_same_key():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(websocket)
+    sender.start()
+
+    await sender._enqueue({'v': 0})
+    await websocket.sending.wait()
+    await sender._enqueue({'v': 1}, coalesce_key='read')
+    await sender._enqueue({'v': 2}, coalesce_key='read')
+    websocket.release.set()
+    await sender._enqueue({'v': 3}, wait=True)
+    await sender.close()
+
+    assert [frame.replace(' ', '') for frame in websocket.sent] == [
+        '{"v":0}', '{"v":2}', '{"v":3}'
+    ]
+
+
+async def test_does_not_coalesce_into_event_being_sent():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(websocket)
+    sender.start()
+
+    await sender._enqueue({'v': 1}, coalesce_key='read')
+    await websocket.sending.wait()
+    await sender._enqueue({'v': 2}, coalesce_key='read')
+    websocket.release.set()
+    await sender._enqueue({'v': 3}, wait=True)
+    await sender.close()
+
+    assert [frame.replace(' ', '') for frame in websocket.sent] == [
+        '{"v":1}', '{"v":2}', '{"v":3}'
+    ]
+
+
+async def test_wait_completes_after_event_is_written():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(websocket)
+    sender.start()
+
+    waiter = asyncio.create_task(sender._enqueue({'v': 1}, wait=True))
+    await websocket.sending.wait()
+    assert not waiter.done()
+
+    websocket.release.set()
+    await asyncio.wait_for(waiter, 1)
+    assert len(websocket.sent) == 1
+    await sender.close()
+
+
+async def test_wait_fails_when_sender_closes():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(websocket)
+    sender.start()
+
+    waiter = asyncio.create_task(sender._enqueue({'v': 1}, wait=True))
+    await websocket.sending.wait()
+    await sender.close()
+
+    with pytest.raises(ConnectionError):
+        await asyncio.wait_for(waiter, 1)
+
+
+async def test_evicts_consumer_when_queue_is_full():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(websocket, max_queue_size=3, high_water_mark=2)
+    sender.start()
+
+    await sender._enqueue({'v': 0})
+    await websocket.sending.wait()
+    for i in range(3):
+        await sender._enqueue({'v': i + 1})
+    await asyncio.sleep(0.01)
+
+    assert websocket.closed_with == SLOW_CONSUMER_CLOSE_CODE
+    assert sender.queue_size == 0
+    await sender._enqueue({'v': 4})
+    assert sender.queue_size == 0
+    websocket.release.set()
+    await sender._evictor
+
+
+async def test_evicts_consumer_over_high_water_mark_for_too_long():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(
+        websocket,
+        max_queue_size=100,
+        high_water_mark=1,
+        slow_consumer_timeout=0.05,
+    )
+    sender.start()
+
+    await sender._enqueue({'v': 0})
+    await websocket.sending.wait()
+    await sender._enqueue({'v': 1})
+    await sender._enqueue({'v': 2})
+    assert websocket.closed_with is None
+
+    await asyncio.sleep(0.1)
+    assert websocket.closed_with == SLOW_CONSUMER_CLOSE_CODE
+    assert sender.queue_size == 0
+    websocket.release.set()
+    await sender._evictor
+
+
+async def test_high_water_timer_is_cancelled_when_queue_drains():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(
+        websocket,
+        max_queue_size=100,
+        high_water_mark=1,
+        slow_consumer_timeout=0.05,
+    )
+    sender.start()
+
+    await sender._enqueue({'v': 0})
+    await websocket.sending.wait()
+    await sender._enqueue({'v': 1})
+    await sender._enqueue({'v': 2})
+    websocket.release.set()
+    await sender._enqueue({'v': 3}, wait=True)
+
+    await asyncio.sleep(0.1)
+    assert websocket.closed_with is None
+    await sender.close()
+
+
+async def test_eviction_does_not_block_the_enqueuing_task():
+    websocket = FakeWebSocket()
+    websocket.release.clear()
+    sender = EventSender(websocket, max_queue_size=2, high_water_mark=1)
+    sender.start()
+
+    await sender._enqueue({'v': 0})
+    await websocket.sending.wait()
+    await asyncio.wait_for(sender._enqueue({'v': 1}), 0.1)
+    await asyncio.wait_for(sender._enqueue({'v': 2}), 0.1)
+    await asyncio.sleep(0.01)
+
+    assert websocket.closed_with == SLOW_CONSUMER_CLOSE_CODE
+    websocket.release.set()
+    await sender._evictor
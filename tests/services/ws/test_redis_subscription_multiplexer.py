@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from fakeredis import FakeAsyncRedis
+
+from app.infrastructure.serialization.json_codec import json_codec
+from app.schemas.event import RedisEvent
+from app.services.ws.redis_subscription_multiplexer import \
+    RedisSubscriptionMultiplexer
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest_asyncio.fixture
+async def redis():
+    redis = FakeAsyncRedis(decode_responses=True)
+    yield redis
+    await redis.aclose()
+
+
+@pytest_asyncio.fixture
+async def multiplexer(redis):
+    multiplexer = RedisSubscriptionMultiplexer(
+        redis, poll_timeout=0.01, error_backoff=0.01
+    )
+    await multiplexer.start()
+    yield multiplexer
+    await multiplexer.stop()
+
+
+class Recorder:
+    def __init__(self):
+        self.events = []
+        self.received = asyncio.Event()
+
+    async def __call__(self, redis_event: RedisEvent):
+        self.events.append(redis_event)
+        self.received.set()
+
+    async def wait(self, count: int = 1):
+        while len(self.events) < count:
+            self.received.clear()
+            await asyncio.wait_for(self.received.wait(), 1)
+
+
+async def active_channels(redis) -> set:
+    return set(await redis.pubsub_channels())
+
+
+async def publish(redis, channel: str, event: str):
+    payload = json_codec.dumps({'event': event, 'data': {'id': 1}})
+    await redis.publish(channel, payload)
+
+
+async def test_subscribes_each_channel_once(redis, multiplexer):
+    first, second = Recorder(), Recorder()
+
+    await multiplexer.subscribe(['chat:1'], first)
+    await multiplexer.subscribe(['chat:1', 'chat:2'], second)
+
+    assert multiplexer.subscriber_count('chat:1') == 2
+    assert multiplexer.subscriber_count('chat:2') == 1
+    assert await active_channels(redis) == {'chat:1', 'chat:2'}
+
+
+async def test_unsubscribes_channel_after_last_subscriber(
+        redis, multiplexer
+):
+    first, second = Recorder(), Recorder()
+    await multiplexer.subscribe(['chat:1'], first)
+    await multiplexer.subscribe(['chat:1'], second)
+
+    await multiplexer.unsubscribe(['chat:1'], first)
+    assert await active_channels(redis) == {'chat:1'}
+
+    await multiplexer.unsubscribe(['chat:1'], second)
+    assert multiplexer.subscriber_count('chat:1') == 0
+    assert await active_channels(redis) == set()
+
+
+async def test_unsubscribe_unknown_channel_is_noop(multiplexer):
+    await multiplexer.unsubscribe(['chat:404'], Recorder())
+
+    assert multiplexer.subscriber_count('chat:404') == 0
+
+
+async def test_fans_out_to_every_channel_subscriber(redis, multiplexer):
+    first, second, other = Recorder(), Recorder(), Recorder()
+    await multiplexer.subscribe(['chat:1'], first)
+    await multiplexer.subscribe(['chat:1'], second)
+    await multiplexer.subscribe(['chat:2'], other)
+
+    await publish(redis, 'chat:1', 'new_message')
+    await first.wait()
+    await second.wait()
+
+    assert first.events[0].event == 'new_message'
+    assert first.events[0] is second.events[0]
+    assert other.events == []
+
+
+async def test_failing_callback_does_not_block_others(redis, multiplexer):
+    recorder = Recorder()
+
+    async def failing(redis_event: RedisEvent):
+        raise RuntimeError('boom')
+
+    await multiplexer.subscribe(['chat:1'], failing)
+    await multiplexer.subscribe(['chat:1'], recorder)
+
+    await publish(redis, 'chat:1', 'first')
+    await publish(redis, 'chat:1', 'second')
+    await recorder.wait(2)
+
+    assert [e.event for e in recorder.events] == ['first', 'second']
+
+
+async def test_dispatches_to_recipient_user_channels(multiplexer):
+    alice, bob, carol = Recorder(), Recorder(), Recorder()
+    await multiplexer.subscribe(['user:1'], alice)
+    await multiplexer.subscribe(['user:2'], bob)
+    await multiplexer.subscribe(['user:3'], carol)
+
+    await multiplexer.dispatch_to_recipients(RedisEvent(
+        event='new_message', data={}, recipient_ids=[1, 2]
+    ))
+
+    assert len(alice.events) == 1
+    assert len(bob.events) == 1
+    assert carol.events == []
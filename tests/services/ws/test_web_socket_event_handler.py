@@ -0,0 +1,93 @@
+import asyncio
+
+import pytest
+
+from app.infrastructure.exceptions.exceptions import MessagePublishError
+from app.infrastructure.types.event import ServerToClientEvent
+from app.schemas.message import MessageCreate
+from app.services.ws.handlers.web_socket_event_handler import \
+    WebSocketEventHandler
+
+pytestmark = pytest.mark.asyncio
+
+
+class FakeMessageHandler:
+    def __init__(self):
+        self.confirmation = None
+
+    async def send_to_mq(self, user_id, message_in):
+        self.confirmation = asyncio.get_running_loop().create_future()
+        return self.confirmation
+
+
+class FakeEventSender:
+    def __init__(self):
+        self.events = []
+
+    async def send_event(self, event, wait=False):
+        self.events.append(event)
+
+
+def make_handler():
+    return WebSocketEventHandler(
+        message_handler=FakeMessageHandler(),
+        chat_message_constructor=None,
+        chat_overview_service=None,
+        chat_read_service=None,
+        chat_info_service=None,
+        event_sender=FakeEventSender(),
+        search_service=None,
+        pubsub=None,
+        chat_create_helper=None,
+        contact_service=None,
+    )
+
+
+async def test_sends_accepted_event_when_broker_confirms():
+    handler = make_handler()
+    await handler.handle_new_message(
+        MessageCreate(chat_id=1, content='hi', client_message_id='c1'), 7
+    )
+    assert handler.event_sender.events == []
+
+    handler.message_handler.confirmation.set_result(None)
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    event, = handler.event_sender.events
+    assert event.event == ServerToClientEvent.MESSAGE_ACCEPTED
+    assert event.data.client_message_id == 'c1'
+    assert event.data.error is None
+
+
+async def test_sends_rejected_event_when_broker_nacks():
+    handler = make_handler()
+    await handler.handle_new_message(
+        MessageCreate(chat_id=1, content='hi', client_message_id='c2'), 7
+    )
+
+    handler.message_handler.confirmation.set_exception(
+        MessagePublishError('nack')
+    )
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    event, = handler.event_sender.events
+    assert event.event == ServerToClientEvent.MESSAGE_REJECTED
+    assert event.data.chat_id == 1
+    assert event.data.client_message_id == 'c2'
+    assert event.data.error
+
+
+async def test_stop_cancels_pending_confirmations():
+    handler = make_handler()
+    await handler.handle_new_message(
+        MessageCreate(chat_id=1, content='hi', client_message_id='c3'), 7
+    )
+    task, = handler._confirmations
+
+    await handler.stop()
+
+    assert task.cancelled()
+    assert handler._confirmations == set()
+    assert handler.event_sender.events == []
@@ -1,5 +1,4 @@
 import asyncio
-import json
 import aio_pika
 import logging
 
@@ -7,31 +6,51 @@ from datetime import datetime, timezone
 
 from logging import getLogger
 
+from redis.asyncio import Redis
+
 from app.core.config import settings
 from app.db.repository.chat_repository import ChatRepository
-from app.db.repository.message_delivery_repository import \
-    MessageDeliveryRepository
+from app.db.repository.chat_read_status_repository import \
+    ChatReadStatusRepository
 from app.db.repository.message_repository import MessageRepository
 from app.db.repository.user_repository import UserRepository
 
 from app.db.session import AsyncSessionFactory
 from app.infrastructure.cache.connection import get_redis_client
 from app.infrastructure.cache.redis_pubsub import RedisPubSub
+from app.infrastructure.exceptions.exceptions import DatabaseError
+from app.infrastructure.message_queue.keyed_task_queue import KeyedTaskQueue
 from app.infrastructure.message_queue.rabbitmq_connection_provider import \
     RabbitMQConnectionProvider
-from app.models import Chat, Message, MessageDelivery, User
-
-from app.schemas.message import MessageCreate
+from app.infrastructure.serialization.json_codec import json_codec, \
+    JsonDecodeError
+from app.infrastructure.types.event import ServerToClientEvent, DeliveryMode
+from app.models import Chat, ChatReadStatus, Message, User
+
+from app.schemas.message import MessageCreate, MessageInChatOverview
+from app.services.chat.chat_membership_cache import ChatMembershipCache
+from app.services.chat.chat_overview_cache import ChatOverviewCache
 from app.services.message.chat_messages_constructor import \
     ChatMessagesConstructor
+from app.services.message.message_batch_service import MessageBatchService
 from app.services.message_delivery_service import MessageDeliveryService
 from app.services.message.message_service import MessageService
+from app.services.ws.chat_event_publisher import ChatEventPublisher
+from app.services.ws.presence_registry import PresenceRegistry
+from app.services.ws.redis_subscription_multiplexer import \
+    RedisSubscriptionMultiplexer
 
 RABBITMQ_HOST = settings.RABBITMQ_HOST
 RABBITMQ_PORT = settings.RABBITMQ_PORT
 RABBITMQ_DEFAULT_USER = settings.RABBITMQ_DEFAULT_USER
 RABBITMQ_DEFAULT_PASS = settings.RABBITMQ_DEFAULT_PASS
 REGULAR_MESSAGE_QUEUE_NAME = settings.RABBITMQ_REGULAR_MESSAGE_QUEUE
+BATCH_SIZE = settings.WORKER_BATCH_SIZE
+BATCH_WAIT_SECONDS = settings.WORKER_BATCH_WAIT_MS / 1000
+CONCURRENCY = min(
+    settings.WORKER_CONCURRENCY,
+    settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+)
 
 
 logging.basicConfig(
@@ -41,12 +60,24 @@ logging.basicConfig(
 )
 logger = getLogger(__name__)
 
-redis_pubsub: RedisPubSub | None = None
+chat_event_publisher: ChatEventPublisher | None = None
+chat_overview_cache: ChatOverviewCache | None = None
+chat_membership_cache: ChatMembershipCache | None = None
+chat_task_queue: KeyedTaskQueue | None = None
 
 
 async def main():
-    global redis_pubsub
-    redis_pubsub = await get_redis_pubsub()
+    global chat_event_publisher, chat_overview_cache, chat_membership_cache
+    redis = await get_redis_client()
+    chat_event_publisher = get_chat_event_publisher(redis)
+    chat_overview_cache = ChatOverviewCache(redis)
+    chat_membership_cache = ChatMembershipCache(redis)
+    multiplexer = RedisSubscriptionMultiplexer(redis)
+    await multiplexer.start()
+    await multiplexer.subscribe(
+        [chat_membership_cache.channel],
+        chat_membership_cache.handle_invalidation
+    )
     logger.info('[*] Worker starting...')
     connection = await RabbitMQConnectionProvider().get_connection()
     while True:
@@ -55,8 +86,9 @@ async def main():
                 channel = await connection.channel()
                 logger.info("[*] Channel created")
 
-                await channel.set_qos(prefetch_count=1)
-                logger.info("[*] QoS set to prefetch_count=1.")
+                prefetch_count = get_prefetch_count()
+                await channel.set_qos(prefetch_count=prefetch_count)
+                logger.info(f"[*] QoS set to prefetch_count={prefetch_count}.")
 
                 regular_message_queue = await channel.declare_queue(
                     REGULAR_MESSAGE_QUEUE_NAME,
@@ -68,9 +100,14 @@ async def main():
                 logger.info('[*] Starting consumer. Waiting for messages. '
                             'To exit press CTRL+C')
 
-                await regular_message_queue.consume(on_message)
+                if BATCH_SIZE > 1:
+                    await consume_in_batches(regular_message_queue)
+                elif CONCURRENCY > 1:
+                    await consume_concurrently(regular_message_queue)
+                else:
+                    await regular_message_queue.consume(on_message)
 
-                await asyncio.Future()
+                    await asyncio.Future()
         except KeyboardInterrupt:
             logger.info(' [*] Interrupted by user (CTRL+C). Shutting down...')
             break
@@ -94,9 +131,20 @@ async def main():
         logger.info(" [*] Worker stopped")
 
 
-async def get_redis_pubsub() -> RedisPubSub:
-    redis = await get_redis_client()
-    return RedisPubSub(redis)
+def get_prefetch_count() -> int:
+    if BATCH_SIZE > 1:
+        return BATCH_SIZE * 2
+    return CONCURRENCY * 2 if CONCURRENCY > 1 else 1
+
+
+def get_chat_event_publisher(redis: Redis) -> ChatEventPublisher:
+    presence_registry = None
+    if settings.WS_DELIVERY_MODE == DeliveryMode.NODE:
+        presence_registry = PresenceRegistry(redis)
+    return ChatEventPublisher(
+        RedisPubSub(redis),
+        presence_registry=presence_registry
+    )
 
 
 async def on_message(message: aio_pika.IncomingMessage):
@@ -113,38 +161,198 @@ async def on_message(message: aio_pika.IncomingMessage):
                            f"(delivery_tag={message.delivery_tag})")
 
 
-async def process_message_logic(raw_message_body: bytes):
-    global redis_pubsub
+async def consume_concurrently(queue: aio_pika.abc.AbstractQueue):
+    global chat_task_queue
+    chat_task_queue = KeyedTaskQueue(max_concurrency=CONCURRENCY)
+    logger.info(f"[*] Processing up to {CONCURRENCY} chats concurrently")
+
+    await queue.consume(on_message_concurrent)
     try:
+        await asyncio.Future()
+    finally:
+        await chat_task_queue.join()
+
+
+async def on_message_concurrent(message: aio_pika.IncomingMessage):
+    chat_task_queue.submit(
+        get_ordering_key(message), lambda: on_message(message)
+    )
+
+
+def get_ordering_key(message: aio_pika.IncomingMessage):
+    try:
+        chat_id = json_codec.loads(message.body).get('chat_id')
+    except (ValueError, AttributeError):
+        chat_id = None
+    return chat_id if chat_id is not None else message.delivery_tag
+
+
+async def consume_in_batches(queue: aio_pika.abc.AbstractQueue):
+    buffer: asyncio.Queue[aio_pika.IncomingMessage] = asyncio.Queue()
+    await queue.consume(buffer.put)
+
+    loop = asyncio.get_running_loop()
+    while True:
+        batch = [await buffer.get()]
+        deadline = loop.time() + BATCH_WAIT_SECONDS
+
+        while len(batch) < BATCH_SIZE:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(buffer.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        await on_message_batch(batch)
+
+
+async def on_message_batch(batch: list[aio_pika.IncomingMessage]):
+    logger.info(f"Received batch of {len(batch)} messages at "
+                f"{datetime.now(timezone.utc).isoformat()}")
+
+    try:
+        await process_message_batch_logic(
+            [message.body for message in batch]
+        )
+        logger.info(f"Batch of {len(batch)} messages processed successfully")
+    except DatabaseError:
+        logger.warning(f"Batch insert failed, falling back to "
+                       f"processing {len(batch)} messages one by one")
+        for message in batch:
+            try:
+                await process_message_logic(message.body)
+            except Exception:
+                logger.warning(f"Message processing failed "
+                               f"(delivery_tag={message.delivery_tag})")
+    except Exception as e:
+        logger.error(f"Error processing message batch in worker: {e}",
+                     exc_info=True)
+
+    await batch[-1].ack(multiple=True)
+
+
+def parse_message_body(raw_message_body: bytes) -> MessageCreate:
+    try:
+        message_data = json_codec.loads(raw_message_body)
+    except JsonDecodeError as e:
+        logger.error(f"Failed to decode message body: "
+                     f"{raw_message_body}, error: {e}",
+                     exc_info=True
+                     )
+        raise
+    chat_id = message_data.get('chat_id')
+    content = message_data.get('content')
+    user_id = message_data.get('user_id')
+
+    if not all([chat_id, content, user_id]):
+        logger.error(f"Invalid message payload: {message_data}")
+        raise ValueError(
+            "Invalid message payload: missing required fields"
+        )
+
+    return MessageCreate(chat_id=chat_id, content=content, user_id=user_id)
+
+
+async def process_message_batch_logic(raw_message_bodies: list[bytes]):
+    messages_in = []
+    for raw_message_body in raw_message_bodies:
         try:
-            message_data = json.loads(raw_message_body.decode('utf-8'))
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to decode message body: "
-                         f"{raw_message_body}, error: {e}",
-                         exc_info=True
-                         )
-            raise
-        chat_id = message_data.get('chat_id')
-        content = message_data.get('content')
-        user_id = message_data.get('user_id')
-
-        if not all([chat_id, content, user_id]):
-            logger.error(f"Invalid message payload: {message_data}")
-            raise ValueError(
-                "Invalid message payload: missing required fields"
+            messages_in.append(parse_message_body(raw_message_body))
+        except Exception as e:
+            logger.warning(f"Skipping invalid message in batch: {e}")
+
+    if not messages_in:
+        return
+
+    async with AsyncSessionFactory() as db:
+        chat_repository = ChatRepository(db, Chat, chat_membership_cache)
+        message_repository = MessageRepository(db, Message)
+        chat_read_status_repository = ChatReadStatusRepository(
+            db, ChatReadStatus
+        )
+        user_repository = UserRepository(db, User)
+
+        message_batch_service = MessageBatchService(
+            db,
+            chat_repository=chat_repository,
+            message_repository=message_repository,
+            message_delivery_service=MessageDeliveryService(
+                db=db,
+                chat_read_status_repository=chat_read_status_repository,
+            )
+        )
+
+        created_messages = await message_batch_service.create_messages(
+            messages_in
+        )
+        logger.info(f"{len(created_messages)} messages created by worker")
+
+        senders = await user_repository.get_by_ids(
+            list({message.user_id for message, _ in created_messages})
+        )
+        sender_map = {sender.user_id: sender for sender in senders}
+
+    message_constructor = ChatMessagesConstructor()
+
+    for message, participant_ids in created_messages:
+        sender = sender_map.get(message.user_id)
+        if not sender:
+            logger.warning(f"Sender {message.user_id} of message "
+                           f"{message.message_id} not found, not publishing")
+            continue
+
+        chat_message = await message_constructor.construct_chat_message(
+            message=message, sender=sender
+        )
+        await chat_event_publisher.publish_chat_event(
+            chat_id=message.chat_id,
+            recipient_ids=participant_ids,
+            event=ServerToClientEvent.MESSAGE_SENT,
+            data=chat_message.model_dump(mode='json')
+        )
+        await update_chat_overview_cache(message, participant_ids, sender)
+
+
+async def update_chat_overview_cache(
+        message: Message, participant_ids: list[int], sender: User
+):
+    try:
+        await chat_overview_cache.apply_new_message(
+            chat_id=message.chat_id,
+            sender_id=message.user_id,
+            participant_ids=participant_ids,
+            last_message=MessageInChatOverview(
+                sent_at=message.sent_at,
+                content=message.content,
+                display_name=sender.display_name,
             )
+        )
+    except Exception as e:
+        logger.error(f"Failed to update chat overview cache for chat "
+                     f"{message.chat_id}: {e}")
+
+
+async def process_message_logic(raw_message_body: bytes):
+    try:
+        message_in = parse_message_body(raw_message_body)
+        chat_id = message_in.chat_id
+        user_id = message_in.user_id
 
         async with (AsyncSessionFactory() as db):
-            chat_repository = ChatRepository(db, Chat)
+            chat_repository = ChatRepository(
+                db, Chat, chat_membership_cache
+            )
             message_repository = MessageRepository(db, Message)
-            message_delivery_repository = MessageDeliveryRepository(
-                db, MessageDelivery
+            chat_read_status_repository = ChatReadStatusRepository(
+                db, ChatReadStatus
             )
             user_repository = UserRepository(db, User)
 
             message_delivery_service = MessageDeliveryService(
                 db=db,
-                message_delivery_repository=message_delivery_repository,
+                chat_read_status_repository=chat_read_status_repository,
             )
 
             message_service = MessageService(
@@ -157,13 +365,8 @@ async def process_message_logic(raw_message_body: bytes):
 
             message_constructor = ChatMessagesConstructor()
 
-            message_in = MessageCreate(
-                chat_id=chat_id,
-                content=content,
-            )
-
-            created_message, deliveries = await message_service.create_message(
-                message_in
+            created_message, participant_ids = (
+                await message_service.create_message(message_in)
             )
 
 
@@ -174,18 +377,20 @@ async def process_message_logic(raw_message_body: bytes):
             sender = await user_repository.get_by_id(user_id)
 
             chat_message = await message_constructor.construct_chat_message(
-                message=created_message, deliveries=deliveries, sender=sender
+                message=created_message, sender=sender
             )
             data = chat_message.model_dump(mode='json')
             print(data)
 
-            await redis_pubsub.publish(f'chat:{chat_id}', json.dumps({
-                'event': 'message_sent',
-                'data': data
-            }))
-
-            logger.info(f'published message {data} to channel "chat:{chat_id}"'
-                        )
+            await chat_event_publisher.publish_chat_event(
+                chat_id=chat_id,
+                recipient_ids=participant_ids,
+                event=ServerToClientEvent.MESSAGE_SENT,
+                data=data
+            )
+            await update_chat_overview_cache(
+                created_message, participant_ids, sender
+            )
 
     except Exception as e:
         logger.error(
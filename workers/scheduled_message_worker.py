@@ -1,5 +1,4 @@
 import asyncio
-import json
 import aio_pika
 import logging
 
@@ -9,17 +8,25 @@ from logging import getLogger
 
 from app.core.config import settings
 from app.db.repository.chat_repository import ChatRepository
-from app.db.repository.message_delivery_repository import \
-    MessageDeliveryRepository
+from app.db.repository.chat_read_status_repository import \
+    ChatReadStatusRepository
 from app.db.repository.message_repository import MessageRepository
 from app.db.repository.scheduled_message_repository import \
     ScheduledMessageRepository
 from app.db.session import AsyncSessionFactory
-from app.models import Chat, Message, MessageDelivery
+from app.infrastructure.cache.connection import get_redis_client
+from app.infrastructure.serialization.json_codec import json_codec, \
+    JsonDecodeError
+from app.models import Chat, ChatReadStatus, Message
 from app.models.scheduled_message import ScheduledMessage, \
     ScheduledMessageStatus
 from app.schemas.message import MessageCreate
+from app.services.chat.chat_membership_cache import ChatMembershipCache
+from app.services.chat.chat_overview_cache import ChatOverviewCache
 from app.services.message.message_service import MessageService
+from app.services.message_delivery_service import MessageDeliveryService
+from app.services.ws.redis_subscription_multiplexer import \
+    RedisSubscriptionMultiplexer
 
 RABBITMQ_HOST = settings.RABBITMQ_HOST
 RABBITMQ_PORT = settings.RABBITMQ_PORT
@@ -36,6 +43,9 @@ logging.basicConfig(
 
 logger = getLogger(__name__)
 
+chat_overview_cache: ChatOverviewCache | None = None
+chat_membership_cache: ChatMembershipCache | None = None
+
 
 async def _set_message_status_to_failed(
         scheduled_message_db_id: int,
@@ -86,8 +96,8 @@ async def process_message_logic(raw_message_body: bytes):
     scheduled_message_db_id: int | None = None
     try:
         try:
-            message_data = json.loads(raw_message_body.decode('utf-8'))
-        except json.JSONDecodeError as e:
+            message_data = json_codec.loads(raw_message_body)
+        except JsonDecodeError as e:
             logger.error(f"Failed to decode message body: "
                          f"{raw_message_body}, error: {e}",
                          exc_info=True
@@ -124,10 +134,12 @@ async def process_message_logic(raw_message_body: bytes):
                     ScheduledMessageStatus.PROCESSING
                 )
                 await db.commit()
-            chat_repository = ChatRepository(db, Chat)
+            chat_repository = ChatRepository(
+                db, Chat, chat_membership_cache
+            )
             message_repository = MessageRepository(db, Message)
-            message_delivery_repository = MessageDeliveryRepository(
-                db, MessageDelivery
+            chat_read_status_repository = ChatReadStatusRepository(
+                db, ChatReadStatus
             )
 
             message_service = MessageService(
@@ -135,7 +147,10 @@ async def process_message_logic(raw_message_body: bytes):
                 current_user_id=user_id,
                 chat_repository=chat_repository,
                 message_repository=message_repository,
-                message_delivery_repository=message_delivery_repository
+                message_delivery_service=MessageDeliveryService(
+                    db=db,
+                    chat_read_status_repository=chat_read_status_repository,
+                )
             )
 
             message_in_schema = MessageCreate(
@@ -145,11 +160,13 @@ async def process_message_logic(raw_message_body: bytes):
 
             scheduled_message_in_db.status = ScheduledMessageStatus.SENT
 
-            created_message = await message_service.create_message(
-                message_in_schema
+            created_message, participant_ids = (
+                await message_service.create_message(message_in_schema)
             )
             logger.info(f"Message created by worker: "
                         f"{created_message.message_id}")
+
+            await chat_overview_cache.invalidate(participant_ids)
     except Exception as e:
         logger.error(
             f"Error processing message in worker: {e}",
@@ -180,8 +197,18 @@ async def on_message(message: aio_pika.IncomingMessage):
 
 
 async def main():
+    global chat_overview_cache, chat_membership_cache
     connection = None
     logger.info('[*] Worker starting...')
+    redis = await get_redis_client()
+    chat_overview_cache = ChatOverviewCache(redis)
+    chat_membership_cache = ChatMembershipCache(redis)
+    multiplexer = RedisSubscriptionMultiplexer(redis)
+    await multiplexer.start()
+    await multiplexer.subscribe(
+        [chat_membership_cache.channel],
+        chat_membership_cache.handle_invalidation
+    )
 
     rabbitmq_url = (f"amqp://{RABBITMQ_DEFAULT_USER}:{RABBITMQ_DEFAULT_PASS}@"
                     f"{RABBITMQ_HOST}:{RABBITMQ_PORT}")